@@ -0,0 +1,230 @@
+"""Two-tier cache backend: a small in-process LRU in front of a shared cache.
+
+Every gunicorn worker keeps recently read entries in its own memory (L1,
+``L1_MAX_ENTRIES`` entries for at most ``L1_TIMEOUT`` seconds) and falls
+back to the cache named by the ``L2`` option, shared by all workers and
+nodes (Redis, database, file or, for tests, local memory).
+
+Writes go to both tiers. Deletes, ``clear()`` and ``publish_invalidation()``,
+which ``registration.caching.bump_version`` calls after replacing the
+version tokens the page, event and site caches are keyed by, also replace
+an invalidation epoch stored in L2. Each worker compares its epoch with L2
+at most every ``EPOCH_CHECK_INTERVAL`` seconds and drops its L1 when it
+moved, so an invalidation reaches every worker within that interval.
+Other overwrites, including the entries stored without expiry when a
+worker rebuilds a bundle or grid, and counters changed with ``incr()``,
+are seen by the other workers once their L1 copy expires.
+
+Hit and miss counters are kept per process and returned by ``get_stats()``.
+"""
+
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+# L2 key of the invalidation epoch
+EPOCH_KEY = 'tiered_cache_epoch'
+
+# Returned by lookups of missing keys, since None is a valid cached value
+_MISSING = object()
+
+
+class TieredCache(BaseCache):
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._l2_alias = options.get('L2', 'shared')
+        self._l1_max_entries = int(options.get('L1_MAX_ENTRIES', 1000))
+        self._l1_timeout = float(options.get('L1_TIMEOUT', 5))
+        self._epoch_interval = float(options.get('EPOCH_CHECK_INTERVAL', 1))
+        self._l1 = OrderedDict()
+        self._lock = threading.Lock()
+        self._epoch = None
+        self._epoch_checked = 0.0
+        self._stats = Counter()
+
+    @property
+    def l2(self):
+        return caches[self._l2_alias]
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._stats[name] += amount
+
+    def _timeout_seconds(self, timeout):
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    # L1 ---------------------------------------------------------------------#
+
+    def _l1_get(self, key):
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, pickled = entry
+            if expires_at <= time.monotonic():
+                del self._l1[key]
+                return _MISSING
+            self._l1.move_to_end(key)
+        return pickle.loads(pickled)
+
+    def _l1_set(self, key, value, timeout):
+        if timeout is not None and timeout <= 0:
+            self._l1_delete(key)
+            return
+        ttl = self._l1_timeout if timeout is None else min(timeout, self._l1_timeout)
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._l1[key] = (time.monotonic() + ttl, pickled)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self._l1_max_entries:
+                self._l1.popitem(last=False)
+                self._stats['l1_evictions'] += 1
+
+    def _l1_delete(self, key):
+        with self._lock:
+            self._l1.pop(key, None)
+
+    def _l1_key(self, key, version):
+        return self.make_and_validate_key(key, version=version)
+
+    # Invalidation epoch -----------------------------------------------------#
+
+    def _sync_epoch(self):
+        now = time.monotonic()
+        if now - self._epoch_checked < self._epoch_interval:
+            return
+        self._epoch_checked = now
+        epoch = self.l2.get(EPOCH_KEY)
+        if epoch != self._epoch:
+            with self._lock:
+                self._l1.clear()
+                self._stats['l1_invalidations'] += 1
+            self._epoch = epoch
+
+    def publish_invalidation(self):
+        """Make every worker drop its L1 at its next epoch check."""
+        # Seeded with the time, like the version tokens, so it never repeats
+        epoch = time.time_ns()
+        self.l2.set(EPOCH_KEY, epoch, None)
+        self._epoch = epoch
+        self._count('invalidations_sent')
+
+    # Cache API --------------------------------------------------------------#
+
+    def get(self, key, default=None, version=None):
+        self._sync_epoch()
+        l1_key = self._l1_key(key, version)
+        value = self._l1_get(l1_key)
+        if value is not _MISSING:
+            self._count('l1_hits')
+            return value
+        value = self.l2.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self._count('misses')
+            return default
+        self._count('l2_hits')
+        self._l1_set(l1_key, value, None)
+        return value
+
+    def get_many(self, keys, version=None):
+        self._sync_epoch()
+        found = {}
+        pending = []
+        for key in keys:
+            value = self._l1_get(self._l1_key(key, version))
+            if value is _MISSING:
+                pending.append(key)
+            else:
+                found[key] = value
+        self._count('l1_hits', len(found))
+        if pending:
+            fetched = self.l2.get_many(pending, version=version)
+            for key, value in fetched.items():
+                self._l1_set(self._l1_key(key, version), value, None)
+            found.update(fetched)
+            self._count('l2_hits', len(fetched))
+            self._count('misses', len(pending) - len(fetched))
+        return found
+
+    def has_key(self, key, version=None):
+        self._sync_epoch()
+        if self._l1_get(self._l1_key(key, version)) is not _MISSING:
+            return True
+        return self.l2.has_key(key, version=version)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout = self._timeout_seconds(timeout)
+        added = self.l2.add(key, value, timeout, version=version)
+        if added:
+            self._l1_set(self._l1_key(key, version), value, timeout)
+            self._count('sets')
+        return added
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout = self._timeout_seconds(timeout)
+        self.l2.set(key, value, timeout, version=version)
+        self._l1_set(self._l1_key(key, version), value, timeout)
+        self._count('sets')
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout = self._timeout_seconds(timeout)
+        failed = self.l2.set_many(data, timeout, version=version)
+        for key, value in data.items():
+            if key not in failed:
+                self._l1_set(self._l1_key(key, version), value, timeout)
+        self._count('sets', len(data))
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.l2.touch(key, self._timeout_seconds(timeout), version=version)
+
+    def delete(self, key, version=None):
+        self._l1_delete(self._l1_key(key, version))
+        deleted = self.l2.delete(key, version=version)
+        self._count('deletes')
+        self.publish_invalidation()
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        for key in keys:
+            self._l1_delete(self._l1_key(key, version))
+        self.l2.delete_many(keys, version=version)
+        self._count('deletes', len(keys))
+        self.publish_invalidation()
+
+    def incr(self, key, delta=1, version=None):
+        # Counters change on every hit, too often to invalidate other workers
+        value = self.l2.incr(key, delta, version=version)
+        self._l1_delete(self._l1_key(key, version))
+        return value
+
+    def decr(self, key, delta=1, version=None):
+        return self.incr(key, -delta, version=version)
+
+    def clear(self):
+        with self._lock:
+            self._l1.clear()
+        self.l2.clear()
+        self.publish_invalidation()
+
+    def get_stats(self):
+        """Return the hit/miss counters of this process and the tier settings."""
+        with self._lock:
+            stats = dict(self._stats)
+            l1_entries = len(self._l1)
+        reads = sum(stats.get(name, 0) for name in ('l1_hits', 'l2_hits', 'misses'))
+        hits = stats.get('l1_hits', 0) + stats.get('l2_hits', 0)
+        return {
+            **stats,
+            'hit_ratio': round(hits / reads, 4) if reads else None,
+            'l1_entries': l1_entries,
+            'l1_max_entries': self._l1_max_entries,
+            'l1_timeout': self._l1_timeout,
+            'l2': f'{type(self.l2).__module__}.{type(self.l2).__name__}',
+        }
@@ -0,0 +1,144 @@
+"""Non-blocking, structured logging for the web workers.
+
+Loggers write to a ``QueuedHandler``, which only puts the record on an
+in-memory queue. A ``QueueListener`` thread, started on the first record of
+each process (so it survives gunicorn forking its workers), takes records
+off the queue and passes them to the handlers given in its ``handlers``
+option: a ``RotatingFileHandler`` writing one JSON object per line and the
+console. Request threads therefore never wait on disk I/O for logging.
+
+``SamplingFilter`` keeps a configurable share of the DEBUG/INFO records of
+chatty loggers before they are queued. Warnings and errors are always kept.
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import threading
+from datetime import datetime, timezone
+
+# Attributes every LogRecord has; anything else was passed with ``extra=``
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format a record as one line of JSON, with its ``extra`` fields."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'process': record.process,
+            'thread': record.thread,
+            'message': record.getMessage(),
+        }
+        for name, value in vars(record).items():
+            if name not in _RECORD_ATTRS and not name.startswith('_'):
+                entry[name] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a share of the records below ``max_level`` of some loggers.
+
+    ``rates`` maps logger names to the share of their records kept (0 to 1);
+    a logger takes the rate of its closest configured ancestor, and loggers
+    without one keep everything.
+    """
+
+    def __init__(self, rates=None, max_level='INFO'):
+        super().__init__()
+        self.rates = dict(rates or {})
+        self.max_level = logging.getLevelName(max_level) if isinstance(max_level, str) else max_level
+        self._cache = {}
+
+    def _rate(self, name):
+        rate = self._cache.get(name)
+        if rate is None:
+            rate, logger = 1.0, name
+            while logger:
+                if logger in self.rates:
+                    rate = float(self.rates[logger])
+                    break
+                logger = logger.rpartition('.')[0]
+            self._cache[name] = rate
+        return rate
+
+    def filter(self, record):
+        if record.levelno > self.max_level:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1 or random.random() < rate
+
+
+class QueuedHandler(logging.handlers.QueueHandler):
+    """Queue records for a listener thread that runs the given ``handlers``.
+
+    In the LOGGING setting, ``handlers`` lists ``cfg://handlers.<name>``
+    references to handlers that are not attached to any logger. This handler
+    keeps them alive: logging itself only holds weak references to handlers.
+    ``logging.shutdown()`` closes this handler at exit, which stops the
+    listener once the queued records are written.
+    """
+
+    def __init__(self, handlers=(), respect_handler_level=True):
+        super().__init__(None)
+        self.respect_handler_level = respect_handler_level
+        self.listener = None
+        self._listener_pid = None
+        self._start_lock = threading.Lock()
+        # Indexing a dictConfig list resolves its cfg:// references. dictConfig
+        # builds handlers in the order of their names, and a reference to one
+        # it has not built yet resolves to its configuration instead
+        self.targets = [handlers[index] for index in range(len(handlers))]
+        for target in self.targets:
+            if not isinstance(target, logging.Handler):
+                raise ValueError(
+                    'Queued handlers must be configured first: give the queue handler '
+                    'a name that sorts after theirs'
+                )
+
+    def _start_listener(self):
+        with self._start_lock:
+            if self._listener_pid == os.getpid():
+                return
+            # A forked worker inherits the listener of its parent without its
+            # thread, and the records still queued in the parent: start afresh
+            self.queue = queue.SimpleQueue()
+            self.listener = logging.handlers.QueueListener(
+                self.queue, *self.targets, respect_handler_level=self.respect_handler_level,
+            )
+            self.listener.start()
+            self._listener_pid = os.getpid()
+
+    def prepare(self, record):
+        # Merge the arguments into the message and render the traceback now,
+        # while the objects they refer to are unchanged, but keep the other
+        # fields of the record for the formatters of the listener
+        record = logging.makeLogRecord(vars(record))
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record):
+        if self._listener_pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+
+    def close(self):
+        if self.listener is not None and self._listener_pid == os.getpid():
+            self.listener.stop()
+            self._listener_pid = None
+        super().close()
@@ -0,0 +1,23 @@
+"""Attach the logged-in user's profile to every request.
+
+``request.user_profile`` is a lazy object: nothing is loaded until a view,
+context processor or template first touches it, and every later access in the
+same request reuses that copy. It is falsy for anonymous users and users
+without a profile. Code that needs a real ``None`` for them should call
+``registration.profile.get_user_profile``.
+"""
+
+from django.utils.functional import SimpleLazyObject
+
+from registration.profile import get_user_profile
+
+
+class UserProfileMiddleware:
+    """Set ``request.user_profile``; must come after AuthenticationMiddleware."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.user_profile = SimpleLazyObject(lambda: get_user_profile(request))
+        return self.get_response(request)
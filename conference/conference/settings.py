@@ -23,8 +23,6 @@ ALLOWED_HOSTS = [
     'localhost',            # Local testing (optional, remove if not needed)
     '127.0.0.1',           # Loopback (optional, remove if not needed)
 ]
-import matplotlib
-matplotlib.use('Agg')
 
 # Application definition
 
@@ -58,6 +56,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'conference.middleware.user_profile.UserProfileMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -105,6 +104,44 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Two tiers (see conference/cache_backends.py): a small in-process LRU in
+# front of a cache shared by every worker. CACHE_BACKEND picks the shared
+# one: 'redis' (CACHE_LOCATION=redis://host:6379/0, any Redis-compatible
+# server), 'db' (run `python manage.py createcachetable` first), 'file'
+# (a directory) or 'locmem' (per process; development and tests).
+
+CACHE_BACKENDS = {
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'db': 'django.core.cache.backends.db.DatabaseCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+}
+CACHE_BACKEND = config('CACHE_BACKEND', default='locmem')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'conference.cache_backends.TieredCache',
+        'OPTIONS': {
+            'L2': 'shared',
+            'L1_MAX_ENTRIES': config('CACHE_L1_MAX_ENTRIES', default=1000, cast=int),
+            'L1_TIMEOUT': config('CACHE_L1_TIMEOUT', default=5, cast=float),
+            'EPOCH_CHECK_INTERVAL': config('CACHE_EPOCH_CHECK_INTERVAL', default=1, cast=float),
+        },
+    },
+    'shared': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND],
+        'LOCATION': config('CACHE_LOCATION', default={
+            'redis': 'redis://127.0.0.1:6379/0',
+            'db': 'django_cache',
+            'file': os.path.join(BASE_DIR, 'cache'),
+            'locmem': 'shared',
+        }[CACHE_BACKEND]),
+        'KEY_PREFIX': 'bsbcs',
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -188,89 +225,102 @@ CONTACT_EMAIL = config('CONTACT_EMAIL', default='info.bsbcs@gmail.com')
 
 
 # Django Logging Configuration
+# Loggers only queue their records (see conference/log_handlers.py); a
+# listener thread writes them as JSON lines to django.log, rotated at
+# LOG_MAX_BYTES with LOG_BACKUP_COUNT old files kept, and to the console.
+# LOG_SAMPLE_RATES keeps that share of the DEBUG/INFO records of a logger.
+LOG_LEVEL = config('LOG_LEVEL', default='INFO')
+
+LOG_SAMPLE_RATES = {
+    'django.server': 0.1,
+}
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
-        'verbose': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
-            'style': '{',
+        'json': {
+            '()': 'conference.log_handlers.JsonFormatter',
         },
         'simple': {
-            'format': '{levelname} {asctime} {message}',
+            'format': '{levelname} {asctime} {name} {message}',
             'style': '{',
         },
     },
+    'filters': {
+        'sampling': {
+            '()': 'conference.log_handlers.SamplingFilter',
+            'rates': LOG_SAMPLE_RATES,
+        },
+    },
     'handlers': {
+        # Run by the listener thread of the queue handler only
         'file': {
             'level': 'DEBUG',
-            'class': 'logging.FileHandler',
+            'class': 'logging.handlers.RotatingFileHandler',
             'filename': os.path.join(BASE_DIR, 'django.log'),
-            'formatter': 'verbose',
+            'maxBytes': config('LOG_MAX_BYTES', default=10 * 1024 * 1024, cast=int),
+            'backupCount': config('LOG_BACKUP_COUNT', default=5, cast=int),
+            'encoding': 'utf-8',
+            'delay': True,
+            'formatter': 'json',
         },
         'console': {
             'level': 'DEBUG',
             'class': 'logging.StreamHandler',
             'formatter': 'simple',
         },
+        # Must sort after the handlers it references, which dictConfig builds first
+        'queue': {
+            '()': 'conference.log_handlers.QueuedHandler',
+            'handlers': ['cfg://handlers.file', 'cfg://handlers.console'],
+            'filters': ['sampling'],
+        },
     },
     'loggers': {
         'django': {
-            'handlers': ['file', 'console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'django.template': {
-            'handlers': ['file', 'console'],
+            'handlers': ['queue'],
             'level': 'ERROR',
             'propagate': False,
         },
         'django.request': {
-            'handlers': ['file', 'console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'django.server': {
-            'handlers': ['file', 'console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'django.db.backends': {
-            'handlers': ['file', 'console'],
+            'handlers': ['queue'],
             'level': 'WARNING',
             'propagate': False,
         },
         'django.security': {
-            'handlers': ['file', 'console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'debug_event': {
-            'handlers': ['file', 'console'],
+            'handlers': ['queue'],
             'level': 'WARNING',
             'propagate': False,
         },
         'registration': {
-            'handlers': ['file', 'console'],
-            'level': 'DEBUG',
+            'handlers': ['queue'],
+            'level': LOG_LEVEL,
             'propagate': False,
         },
     },
     'root': {
-        'handlers': ['file', 'console'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
 }
-
-# Override print to also log
-import builtins
-original_print = builtins.print
-
-def logged_print(*args, **kwargs):
-    import logging
-    logger = logging.getLogger('registration')
-    message = ' '.join(str(arg) for arg in args)
-    logger.info(f"PRINT: {message}")
-    original_print(*args, **kwargs)
-
-builtins.print = logged_print
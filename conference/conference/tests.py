@@ -0,0 +1,203 @@
+import copy
+import gc
+import json
+import logging
+import logging.config
+import logging.handlers
+import os
+import tempfile
+import threading
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache, caches
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from conference.cache_backends import EPOCH_KEY, TieredCache
+from conference.log_handlers import QueuedHandler, SamplingFilter
+from conference.middleware.user_profile import UserProfileMiddleware
+from registration.models import UserProfile
+from registration.caching import bump_version, get_version
+
+
+class QueuedLoggingTests(SimpleTestCase):
+    def setUp(self):
+        self.log_dir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.log_dir.name, 'django.log')
+        config = copy.deepcopy(settings.LOGGING)
+        config['handlers']['file']['filename'] = self.log_path
+        config['handlers']['console']['class'] = 'logging.NullHandler'
+        logging.config.dictConfig(config)
+        # logging keeps handlers in a WeakValueDictionary only
+        gc.collect()
+        self.handler = logging.getLogger('django.request').handlers[0]
+
+    def tearDown(self):
+        self.handler.close()
+        logging.config.dictConfig(settings.LOGGING)
+        self.log_dir.cleanup()
+
+    def read_records(self):
+        # Stopping the listener writes the records still queued
+        self.handler.close()
+        with open(self.log_path) as log_file:
+            return [json.loads(line) for line in log_file]
+
+    def test_error_is_written_to_the_log_file(self):
+        logging.getLogger('django.request').error('Internal Server Error: %s', '/events/', extra={'status_code': 500})
+        records = self.read_records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['level'], 'ERROR')
+        self.assertEqual(records[0]['logger'], 'django.request')
+        self.assertEqual(records[0]['message'], 'Internal Server Error: /events/')
+        self.assertEqual(records[0]['status_code'], 500)
+
+    def test_exception_is_written_with_its_traceback(self):
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logging.getLogger('registration.views').exception('Payment failed')
+        records = self.read_records()
+        self.assertIn('ZeroDivisionError', records[0]['exception'])
+
+    def test_file_is_written_by_the_listener_thread(self):
+        writers = set()
+        emit = logging.handlers.RotatingFileHandler.emit
+
+        def recording_emit(handler, record):
+            writers.add(threading.current_thread())
+            emit(handler, record)
+
+        with mock.patch.object(logging.handlers.RotatingFileHandler, 'emit', recording_emit):
+            logging.getLogger('registration').warning('queued')
+            self.read_records()
+        self.assertTrue(writers)
+        self.assertNotIn(threading.current_thread(), writers)
+
+    def test_handlers_must_be_configured_before_the_queue_handler(self):
+        with self.assertRaises(ValueError):
+            QueuedHandler(handlers=[{'class': 'logging.StreamHandler'}])
+
+
+class SamplingFilterTests(SimpleTestCase):
+    def record(self, name, level):
+        return logging.LogRecord(name, level, __file__, 1, 'message', None, None)
+
+    def test_sampled_logger_drops_info_records(self):
+        sampling = SamplingFilter(rates={'django.server': 0})
+        self.assertFalse(sampling.filter(self.record('django.server', logging.INFO)))
+        self.assertFalse(sampling.filter(self.record('django.server.access', logging.DEBUG)))
+
+    def test_warnings_and_other_loggers_are_kept(self):
+        sampling = SamplingFilter(rates={'django.server': 0})
+        self.assertTrue(sampling.filter(self.record('django.server', logging.WARNING)))
+        self.assertTrue(sampling.filter(self.record('registration', logging.INFO)))
+
+
+def make_worker(**options):
+    """A TieredCache over the shared L2, standing in for one worker process."""
+    return TieredCache('', {'OPTIONS': {'L2': 'shared', 'EPOCH_CHECK_INTERVAL': 0, **options}})
+
+
+class TieredCacheTests(TestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        self.worker = make_worker()
+        self.other_worker = make_worker()
+
+    def test_reads_are_served_from_l1(self):
+        self.worker.set('key', 'value')
+        self.assertEqual(self.worker.get('key'), 'value')
+        self.assertEqual(self.other_worker.get('key'), 'value')
+        self.assertEqual(self.other_worker.get('key'), 'value')
+        self.assertEqual(self.other_worker.get_stats()['l2_hits'], 1)
+        self.assertEqual(self.other_worker.get_stats()['l1_hits'], 1)
+
+    def test_missing_keys_and_cached_none(self):
+        self.assertEqual(self.worker.get('missing', 'default'), 'default')
+        self.worker.set('none', None)
+        self.assertIsNone(self.other_worker.get('none', 'default'))
+
+    def test_delete_reaches_the_other_workers(self):
+        self.worker.set('key', 'old')
+        self.other_worker.get('key')
+        self.worker.delete('key')
+        self.assertIsNone(self.other_worker.get('key'))
+
+    def test_writes_without_expiry_leave_other_l1_caches(self):
+        self.other_worker.set('warm', 'value')
+        epoch = caches['shared'].get(EPOCH_KEY)
+        self.worker.set('bundle', {'rebuilt': True}, None)
+        self.worker.set_many({'grid': 1, 'stats': 2}, None)
+        self.assertEqual(caches['shared'].get(EPOCH_KEY), epoch)
+        self.other_worker.get('warm')
+        self.assertEqual(self.other_worker.get_stats().get('l1_invalidations', 0), 0)
+        self.assertEqual(self.other_worker.get_stats()['l1_hits'], 1)
+
+    def test_bumped_version_reaches_the_other_workers(self):
+        other_worker = make_worker()
+        with mock.patch('registration.caching.cache', make_worker()):
+            old = get_version('page_version')
+            other_worker.get('page_version')
+            with self.captureOnCommitCallbacks(execute=True):
+                bump_version('page_version')
+        self.assertNotEqual(other_worker.get('page_version'), old)
+
+    def test_l1_evicts_the_least_recently_used_entry(self):
+        worker = make_worker(L1_MAX_ENTRIES=2)
+        worker.set('a', 1)
+        worker.set('b', 2)
+        worker.get('a')
+        worker.set('c', 3)
+        self.assertEqual(worker.get_stats()['l1_evictions'], 1)
+        caches['shared'].delete_many(['a', 'b', 'c'])
+        self.assertEqual(worker.get('a'), 1)
+        self.assertIsNone(worker.get('b'))
+
+    def test_default_cache_is_tiered(self):
+        self.assertIsInstance(caches['default'], TieredCache)
+
+
+class UserProfileMiddlewareTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.middleware = UserProfileMiddleware(lambda request: HttpResponse())
+
+    def profile_for(self, user):
+        request = RequestFactory().get('/')
+        request.user = user
+        self.middleware(request)
+        return request.user_profile
+
+    def test_profile_is_not_loaded_until_read(self):
+        with mock.patch('conference.middleware.user_profile.get_user_profile') as get_user_profile:
+            self.profile_for(User.objects.create_user('member'))
+        get_user_profile.assert_not_called()
+
+    def test_anonymous_users_have_no_profile(self):
+        with self.assertNumQueries(0):
+            self.assertFalse(self.profile_for(AnonymousUser()))
+
+    def test_users_without_a_profile_have_none(self):
+        user = User.objects.create_user('visitor')
+        self.assertFalse(self.profile_for(user))
+        with self.assertNumQueries(0):
+            self.assertFalse(self.profile_for(user))
+
+    def test_profile_is_loaded_once_and_cached(self):
+        user = User.objects.create_user('member')
+        UserProfile.objects.create(user=user, name='Member', email='member@example.com', phone='01710000000')
+        self.assertEqual(self.profile_for(user).name, 'Member')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.profile_for(user).name, 'Member')
+
+    def test_profile_changes_drop_the_cached_copy(self):
+        user = User.objects.create_user('member')
+        profile = UserProfile.objects.create(user=user, name='Member', email='member@example.com', phone='01710000000')
+        self.profile_for(user)
+        profile.name = 'Renamed'
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+        self.assertEqual(self.profile_for(user).name, 'Renamed')
@@ -3,30 +3,16 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include, reverse_lazy
 from django.contrib.auth import views as auth_views
-from django.contrib.sitemaps.views import sitemap
 from django.views.generic import TemplateView
-from registration.sitemaps import (
-    EventSitemap,
-    StaticViewSitemap,
-    PublicationSitemap,
-    WebsiteStaticSitemap,
-    WebinarSitemap,
-)
 from registration import views
-from registration.views import global_dashboard
-
-sitemaps = {
-    'events': EventSitemap,
-    'static': StaticViewSitemap,
-    'publications': PublicationSitemap,
-    'website': WebsiteStaticSitemap,
-    'webinars': WebinarSitemap,
-}
+from registration.views import global_dashboard, cache_stats
+from website.sitemaps import sitemap_index, sitemap_section
 
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('dashboard/', global_dashboard, name='global_dashboard'),
+    path('dashboard/cache-stats/', cache_stats, name='cache_stats'),
     path('', include(('website.urls', 'website'), namespace='website')),
     path('index/', views.index, name='index'),
 
@@ -48,7 +34,9 @@ urlpatterns = [
     # path('initiate-payment/<int:event_id>/', initiate_payment, name='initiate_payment'),
     # path('payment-success/', payment_success, name='payment_success'),
     # path('payment-failure/', payment_failure, name='payment_failure'),
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
+    # Sitemap index, one cached sitemap per section (see website.sitemaps)
+    path('sitemap.xml', sitemap_index, name='django.contrib.sitemaps.views.sitemap'),
+    path('sitemap-<section>.xml', sitemap_section, name='sitemap_section'),
     path('robots.txt', TemplateView.as_view(template_name='robots.txt', content_type='text/plain'), name='robots_txt'),
 ]
 
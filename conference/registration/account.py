@@ -0,0 +1,112 @@
+"""Cached per-user summary behind the "My account" page.
+
+The summary holds the user's payments and abstract submissions as plain
+dicts, built from two queries. It is keyed by a per-user version token,
+replaced whenever one of the user's Participant, PaymentStatus or
+AbstractSubmission rows changes, and by a token replaced whenever an Event
+row changes (event names and fees are shown with the payments). The event
+lists come from the shared event catalog and schedule slots from the
+cached schedule grid of each event, which have their own invalidation.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+
+from .caching import bump_version, get_version
+from .event_catalog import get_event_catalog
+from .models import AbstractSubmission, Event, Participant, PaymentStatus
+from .schedule_grid import get_schedule_grid
+
+# Replaced on any Event save/delete
+ACCOUNT_EVENTS_VERSION_KEY = 'account_events_version'
+
+# Summaries are keyed by version, so the timeout only bounds memory use
+ACCOUNT_SUMMARY_TIMEOUT = 60 * 60 * 24
+
+
+def _user_version_key(user_id):
+    return f'account_version_{user_id}'
+
+
+def build_account_summary(user_id):
+    """Query the database and return a fresh account summary for a user."""
+    payments = [
+        {
+            'event': f"{payment.event.name} {payment.event.year}",
+            'trxID': payment.trxID,
+            'amount': payment.event.amount,
+            'status': payment.status,
+            'updated_at': payment.updated_at,
+        }
+        for payment in PaymentStatus.objects.filter(participant__user_id=user_id)
+        .select_related('event').only(
+            'trxID', 'status', 'updated_at', 'event__name', 'event__year', 'event__amount'
+        ).order_by('-updated_at')
+    ]
+
+    abstracts = list(
+        AbstractSubmission.objects.filter(user_id=user_id)
+        .values('id', 'event_id', 'title', 'approved_for_presentation', 'approved_for_poster')
+        .order_by('id')
+    )
+
+    return {
+        'payment_data': payments,
+        'abstract_submissions': abstracts,
+    }
+
+
+def get_account_summary(user_id):
+    """Return the cached account summary of a user with the event catalog
+    and schedule slots attached."""
+    key = (
+        f'account_summary_{user_id}'
+        f'_u{get_version(_user_version_key(user_id))}'
+        f'_e{get_version(ACCOUNT_EVENTS_VERSION_KEY)}'
+    )
+    summary = cache.get(key)
+    if summary is None:
+        summary = build_account_summary(user_id)
+        cache.set(key, summary, ACCOUNT_SUMMARY_TIMEOUT)
+
+    grids = {}
+    abstracts = []
+    for abstract in summary['abstract_submissions']:
+        if abstract['event_id'] not in grids:
+            grids[abstract['event_id']] = get_schedule_grid(abstract['event_id'])
+        session = grids[abstract['event_id']]['sessions'].get(abstract['id'])
+        abstracts.append(dict(abstract, schedule_slots=session['slot_labels'] if session else []))
+    return dict(summary, **get_event_catalog(), abstract_submissions=abstracts)
+
+
+def invalidate_account_summary(user_id):
+    """Drop the account summary of a user once the current transaction commits."""
+    if user_id is not None:
+        bump_version(_user_version_key(user_id))
+
+
+# Signal handlers ------------------------------------------------------------#
+
+def _invalidate_for_user_row(sender, instance, **kwargs):
+    invalidate_account_summary(instance.user_id)
+
+
+def _invalidate_for_payment(sender, instance, **kwargs):
+    user_id = Participant.objects.filter(pk=instance.participant_id).values_list('user_id', flat=True).first()
+    invalidate_account_summary(user_id)
+
+
+def _invalidate_for_event(sender, instance, **kwargs):
+    bump_version(ACCOUNT_EVENTS_VERSION_KEY)
+
+
+def connect_account_signals():
+    """Connect account summary invalidation to the user's rows and to Event."""
+    for model in (Participant, AbstractSubmission):
+        uid = f'account_summary_{model._meta.label_lower}'
+        post_save.connect(_invalidate_for_user_row, sender=model, dispatch_uid=f'{uid}_save')
+        post_delete.connect(_invalidate_for_user_row, sender=model, dispatch_uid=f'{uid}_delete')
+    post_save.connect(_invalidate_for_payment, sender=PaymentStatus, dispatch_uid='account_summary_paymentstatus_save')
+    post_delete.connect(_invalidate_for_payment, sender=PaymentStatus, dispatch_uid='account_summary_paymentstatus_delete')
+    post_save.connect(_invalidate_for_event, sender=Event, dispatch_uid='account_summary_event_save')
+    post_delete.connect(_invalidate_for_event, sender=Event, dispatch_uid='account_summary_event_delete')
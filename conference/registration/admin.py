@@ -14,8 +14,11 @@ from django.http import HttpResponse, HttpResponseRedirect
 from django.utils.crypto import get_random_string
 from django.contrib.auth import get_user_model
 from .views import send_approval_email
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 User = get_user_model()  # Getting the user model.
 
 class UserProfileAdmin(ImportExportModelAdmin):
@@ -56,11 +59,29 @@ class ModeratorAdmin(admin.ModelAdmin):
     search_fields = ('name', 'email')
 admin.site.register(Moderator, ModeratorAdmin)
 
+from .snapshot import SnapshotError, export_event_snapshot, delete_event_snapshot
 class EventAdmin(admin.ModelAdmin):
-    list_display = ('name', 'id','year', 'location', 'start_date', 'event_status', 'registration', 'show_publication_tab', 'payment_required')
+    list_display = ('name', 'id','year', 'location', 'start_date', 'event_status', 'registration', 'show_publication_tab', 'payment_required', 'snapshot_exported_at')
     list_filter = ('year', 'event_status', 'payment_required')
     search_fields = ('name',)
     list_editable = ('show_publication_tab', 'payment_required')
+    actions = ['export_static_snapshot', 'delete_static_snapshot']
+
+    def export_static_snapshot(self, request, queryset):
+        for event in queryset:
+            try:
+                pages = export_event_snapshot(event)
+            except SnapshotError as e:
+                self.message_user(request, f"Snapshot not exported: {e}", level=messages.WARNING)
+                continue
+            self.message_user(request, f"Exported {pages} pages for {event}")
+    export_static_snapshot.short_description = "Export static snapshot of selected closed events"
+
+    def delete_static_snapshot(self, request, queryset):
+        for event in queryset:
+            delete_event_snapshot(event)
+        self.message_user(request, f"Deleted the static snapshot of {queryset.count()} event(s)")
+    delete_static_snapshot.short_description = "Delete static snapshot of selected events"
 admin.site.register(Event, EventAdmin)
 
 import os
@@ -133,8 +154,8 @@ def send_consolidated_email(request, participant, password, include_password):
         email = EmailMultiAlternatives(subject, text_content, from_email, recipient_list)
         email.attach_alternative(html_content, "text/html")
         email.send()
-    except Exception as e:
-        print(f"Error sending consolidated email: {e}")
+    except Exception:
+        logger.exception("Error sending consolidated email to participant %s", participant.id)
 
 def send_free_event_confirmation_email(participant, event, password=None, include_password=False):
     """Send confirmation email for free events"""
@@ -206,7 +227,12 @@ def approve_participants(modeladmin, request, queryset):
             send_free_event_confirmation_email(participant, event, password, include_password)
 
 def deny_participants(modeladmin, request, queryset):
-    queryset.update(denied=True, approved=False)
+    # Saved one by one so the participant list and account pages are
+    # invalidated by their post_save handlers, which update() would skip
+    for participant in queryset:
+        participant.denied = True
+        participant.approved = False
+        participant.save(update_fields=['denied', 'approved'])
 
 approve_participants.short_description = "Approve selected participants"
 deny_participants.short_description = "Deny selected participants"
@@ -267,18 +293,29 @@ class ProgramDayAdmin(admin.ModelAdmin):
 admin.site.register(ProgramDay, ProgramDayAdmin)
 
 # Abstracts admin view START------------------------------------------------------------------------------#
+def _approve_abstracts(queryset, presentation):
+    # Saved one by one instead of with queryset.update(), which sends no
+    # signals: the event pages, publication list, site tags and sitemap are
+    # cached until an AbstractSubmission save replaces their version tokens
+    abstracts = list(queryset)
+    for abstract in abstracts:
+        abstract.approved_for_presentation = presentation
+        abstract.approved_for_poster = not presentation
+        abstract.save(update_fields=['approved_for_presentation', 'approved_for_poster', 'updated_at'])
+    return abstracts
+
 def approve_for_presentation(modeladmin, request, queryset):
-    queryset.update(approved_for_presentation=True, approved_for_poster=False)
+    abstracts = _approve_abstracts(queryset, presentation=True)
 
     # send an approval email
-    for abstract in queryset:
+    for abstract in abstracts:
         send_approval_email(abstract, "Presentation")
 
 def approve_for_poster(modeladmin, request, queryset):
-    queryset.update(approved_for_poster=True, approved_for_presentation=False)
+    abstracts = _approve_abstracts(queryset, presentation=False)
 
     # send an approval email
-    for abstract in queryset:
+    for abstract in abstracts:
         send_approval_email(abstract, "Poster")
 def export_as_pdf(modeladmin, request, queryset):
     if queryset.exists():
@@ -859,20 +896,16 @@ class PendingPaymentReminderAdmin(admin.ModelAdmin):
         Custom admin action to refresh the PendingPaymentReminder list.
         """
         added_count = 0
-        print("Starting refresh process...")  # Debugging log
 
         # Process all active events in the system
         events = Event.objects.filter(event_status='active')
-        print(f"Processing events: {[event.name for event in events]}")  # Debugging log
 
         for event in events:
             participants = Participant.objects.filter(event=event, approved=True)
-            print(f"Found participants for event {event.name}: {[participant.name for participant in participants]}")  # Debugging log
 
             for participant in participants:
                 if not PendingPaymentReminder.objects.filter(participant=participant, event=event).exists():
                     payment_status = PaymentStatus.objects.filter(participant=participant, event=event).first()
-                    print(f"Checking participant {participant.name} with payment status: {payment_status.status if payment_status else 'No Status'}")  # Debugging log
 
                     if not payment_status or payment_status.status not in ['paid', 'completed']:
                         PendingPaymentReminder.objects.create(
@@ -883,16 +916,16 @@ class PendingPaymentReminderAdmin(admin.ModelAdmin):
                                 'participant_id': participant.id
                             })
                         )
-                        print(f"Added {participant.name} to PendingPaymentReminder.")  # Debugging log
+                        logger.debug("Added participant %s to PendingPaymentReminder", participant.id)
                         added_count += 1
                     else:
-                        print(f"Skipped {participant.name}: Payment status is {payment_status.status}.")  # Debugging log
+                        logger.debug("Skipped participant %s: payment status is %s", participant.id, payment_status.status)
                 else:
-                    print(f"Skipped {participant.name}: Already in PendingPaymentReminder.")  # Debugging log
+                    logger.debug("Skipped participant %s: already in PendingPaymentReminder", participant.id)
 
         # Provide feedback to the admin
         self.message_user(request, f"Successfully added {added_count} participant(s) to Pending Payment Reminders.")
-        print(f"Refresh completed. Total added: {added_count}")  # Debugging log
+        logger.info("Pending payment reminders refreshed, %s added", added_count)
 
     refresh_pending_reminders.short_description = "Refresh Pending Payment Reminder List"
 
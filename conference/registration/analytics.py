@@ -0,0 +1,226 @@
+"""Charts and participant statistics of the staff dashboard.
+
+pandas, seaborn and matplotlib take hundreds of milliseconds and tens of MB
+to import, and only the staff dashboard uses them, so they are imported
+here and this module is imported by ``global_dashboard`` on its first call
+instead of by every worker at boot. ``python manage.py startup_benchmark``
+reports what each app module costs to import.
+"""
+
+import hashlib
+import logging
+import os
+from datetime import datetime
+
+import matplotlib
+matplotlib.use('Agg')  # Set backend before importing pyplot
+import matplotlib.pyplot as plt
+import pandas as pd
+import seaborn as sns
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+
+from .models import Event, Participant
+
+logger = logging.getLogger(__name__)
+
+
+def generate_chart(event_metrics):
+    # hash() of a str differs between worker processes, md5 is shared
+    cache_key = f"chart_{hashlib.md5(str(event_metrics).encode()).hexdigest()}"
+    cached_chart = cache.get(cache_key)
+    if cached_chart:
+        return cached_chart
+    if not event_metrics:
+        return None
+
+    try:
+        df = pd.DataFrame(event_metrics)
+        df = df.rename(columns={
+            'approved_participants': 'Approved Participants',
+            'pending_payments': 'Pending Payments',
+            'revenue_collected': 'Revenue Collected'
+        })
+
+        df_melted = df.melt(
+            id_vars=['name'],
+            value_vars=['Approved Participants', 'Pending Payments'],
+            var_name='Metric',
+            value_name='Count'
+        )
+
+        plt.figure(figsize=(12, 7))
+        sns.set_style("whitegrid")
+        ax = sns.barplot(
+            x='name',
+            y='Count',
+            hue='Metric',
+            data=df_melted,
+            palette="viridis"
+        )
+        plt.title('Event Metrics Comparison', fontsize=14)
+        plt.xlabel('Events', fontsize=12)
+        plt.ylabel('Count', fontsize=12)
+        plt.xticks(rotation=45, ha='right')
+        plt.legend(title='Metrics', bbox_to_anchor=(1.05, 1), loc='upper left')
+
+        chart_dir = os.path.join(settings.MEDIA_ROOT, 'charts')
+        os.makedirs(chart_dir, exist_ok=True)
+        chart_filename = f'metrics_{datetime.now().timestamp()}.png'
+        chart_path = os.path.join(chart_dir, chart_filename)
+
+        plt.tight_layout()
+        plt.savefig(chart_path)
+        plt.close()
+
+        chart_url = f'charts/{chart_filename}'
+        cache.set(cache_key, chart_url, timeout=3600)
+        return chart_url
+
+    except Exception:
+        logger.exception("Error generating dashboard chart")
+        return None
+
+
+def get_participant_summary(request, org_page_number=None):
+    event_filter = request.GET.get('event')
+    event_status_filter = request.GET.get('event_status')
+
+    events = Event.objects.all()
+    if event_status_filter:
+        events = events.filter(event_status=event_status_filter)
+    if event_filter:
+        events = events.filter(id=event_filter)
+
+    if not events.exists():
+        return [], {}, None, [], None
+
+    event_ids = events.values_list('id', flat=True)
+
+    participant_qs = Participant.objects.filter(event_id__in=event_ids).values(
+        'name', 'email', 'approved', 'denied', 'event__name', 'country', 'organization'
+    )
+
+    df = pd.DataFrame(list(participant_qs))
+    if df.empty:
+        return [], {}, None, [], None
+
+    df = df.rename(columns={'event__name': 'event_name'})
+
+    totals = {
+        'total_participants': len(df),
+        'approved_participants': df['approved'].sum(),
+        'denied_participants': df['denied'].sum(),
+        'pending_participants': len(df) - df['approved'].sum() - df['denied'].sum(),
+        'local_participants': df['country'].fillna('').str.contains('Bangladesh', case=False).sum(),
+        'foreign_participants': len(df) - df['country'].fillna('').str.contains('Bangladesh', case=False).sum(),
+    }
+
+    organization_summary = df.groupby('organization').size().reset_index(name='participant_count')
+    organization_paginator = Paginator(organization_summary.to_dict(orient='records'), 10)
+    organization_page_obj = organization_paginator.get_page(org_page_number)
+
+    chart_path = generate_participant_summary_chart(df)
+    org_chart_path = generate_organization_chart(organization_summary)
+
+    return df.to_dict(orient='records'), totals, chart_path, organization_page_obj, org_chart_path
+
+
+def generate_participant_summary_chart(df):
+    if df.empty:
+        return None
+
+    cache_key = f"participant_summary_chart_{hash(pd.util.hash_pandas_object(df).sum())}"
+    cached_chart = cache.get(cache_key)
+    if cached_chart:
+        return cached_chart
+
+    summary_df = df.groupby('event_name').agg({
+        'approved': 'sum',
+        'denied': 'sum',
+    }).reset_index()
+    summary_df['pending'] = df.groupby('event_name').apply(
+        lambda x: len(x) - x['approved'].sum() - x['denied'].sum()
+    ).values
+
+    summary_df = summary_df.rename(columns={
+        'approved': 'Approved Participants',
+        'denied': 'Denied Participants',
+        'pending': 'Pending Participants'
+    })
+
+    df_melted = summary_df.melt(
+        id_vars=['event_name'],
+        value_vars=['Approved Participants', 'Denied Participants', 'Pending Participants'],
+        var_name='Status',
+        value_name='Count'
+    )
+
+    plt.figure(figsize=(12, 7))
+    sns.set_style("whitegrid")
+    sns.barplot(
+        x='event_name',
+        y='Count',
+        hue='Status',
+        data=df_melted,
+        palette='pastel'
+    )
+    plt.title('Participant approval status per event', fontsize=16)
+    plt.xlabel('Event', fontsize=14)
+    plt.ylabel('Count', fontsize=14)
+    plt.xticks(rotation=45, ha='right', fontsize=12)
+    plt.yticks(fontsize=12)
+    plt.tight_layout()
+
+    chart_dir = os.path.join(settings.MEDIA_ROOT, 'charts')
+    os.makedirs(chart_dir, exist_ok=True)
+    chart_filename = f'participant_summary_status_{datetime.now().timestamp()}.png'
+    chart_path = os.path.join(chart_dir, chart_filename)
+    plt.savefig(chart_path)
+    plt.close()
+
+    chart_url = f'charts/{chart_filename}'
+    cache.set(cache_key, chart_url, timeout=3600)
+    return chart_url
+
+
+def generate_organization_chart(organization_summary):
+    if organization_summary.empty:
+        return None
+
+    try:
+        cache_key = f"organization_chart_{hash(pd.util.hash_pandas_object(organization_summary).sum())}"
+        cached_chart = cache.get(cache_key)
+        if cached_chart:
+            return cached_chart
+
+        plt.figure(figsize=(12, 7))
+        sns.set_style("whitegrid")
+        sns.barplot(
+            x="participant_count",
+            y="organization",
+            data=organization_summary.sort_values('participant_count', ascending=False),
+            hue="organization",
+            palette="pastel",
+            legend=False
+        )
+
+        plt.title("Participants Per Organization", fontsize=16)
+        plt.xlabel("Number of Participants", fontsize=14)
+        plt.ylabel("Organization", fontsize=14)
+        plt.tight_layout()
+
+        chart_dir = os.path.join(settings.MEDIA_ROOT, 'charts')
+        os.makedirs(chart_dir, exist_ok=True)
+        chart_filename = f'organization_participant_chart_{datetime.now().timestamp()}.png'
+        chart_path = os.path.join(chart_dir, chart_filename)
+        plt.savefig(chart_path)
+        plt.close()
+
+        chart_url = f'charts/{chart_filename}'
+        cache.set(cache_key, chart_url, timeout=3600)
+        return chart_url
+    except Exception:
+        logger.exception("Error generating dashboard chart")
+        return None
@@ -5,3 +5,18 @@ class RegistrationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'registration'
     verbose_name = 'Conference Management System (CMS)'
+
+    def ready(self):
+        """Connect the per-event cache, bundle, schedule grid, event catalog, account and profile invalidation handlers."""
+        from .account import connect_account_signals
+        from .bundle import connect_bundle_signals
+        from .caching import connect_event_cache_signals
+        from .event_catalog import connect_event_catalog_signals
+        from .profile import connect_profile_signals
+        from .schedule_grid import connect_schedule_grid_signals
+        connect_event_cache_signals()
+        connect_bundle_signals()
+        connect_schedule_grid_signals()
+        connect_event_catalog_signals()
+        connect_account_signals()
+        connect_profile_signals()
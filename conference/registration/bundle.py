@@ -0,0 +1,139 @@
+"""Precomputed per-event snapshot shared by the public event views.
+
+The bundle holds the Event row and every piece of content the event tabs
+render (speakers, sponsors, invitations, about text, gallery, abstract book,
+notebook and schedule PDF). It is built once, stored in the cache without a
+timeout and dropped only when one of those rows changes, so an event tab
+costs a single cache read.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.http import Http404
+
+from .models import (
+    Event, FeatureSpeaker, Sponsor, Invitation, AboutTheConference, EventImage,
+    EventVideo, UploadAbstractBook, UploadNoteBook, ProgramSchedulePdf,
+)
+
+# Models whose rows are part of the bundle; a change to any of them drops it
+BUNDLE_MODELS = (
+    FeatureSpeaker, Sponsor, Invitation, AboutTheConference, EventImage,
+    EventVideo, UploadAbstractBook, UploadNoteBook, ProgramSchedulePdf,
+)
+
+BUNDLE_HITS_KEY = 'event_bundle_stats_hits'
+BUNDLE_MISSES_KEY = 'event_bundle_stats_misses'
+BUNDLE_REBUILDS_KEY = 'event_bundle_stats_rebuilds'
+BUNDLE_LAST_REBUILD_KEY = 'event_bundle_stats_last_rebuild'
+
+
+def _bundle_key(event_id):
+    return f'event_bundle_{event_id}'
+
+
+def _incr(key, delta=1):
+    cache.add(key, 0, None)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # The counter was evicted between add() and incr()
+        cache.set(key, delta, None)
+        return delta
+
+
+def build_event_bundle(event_id):
+    """Query the database and return a fresh bundle, or None if no such event."""
+    event = Event.objects.filter(id=event_id).first()
+    if event is None:
+        return None
+
+    # One ordered query for the whole sponsor wall, grouped by tier in Python
+    sponsors = Sponsor.objects.filter(event=event, category__isnull=False).order_by('id')
+    sponsors_by_category = Sponsor.group_by_category(sponsors)
+
+    return {
+        'event': event,
+        'speakers': list(FeatureSpeaker.objects.filter(event=event)),
+        'sponsors_by_category': sponsors_by_category,
+        'invitations': list(Invitation.objects.filter(event=event)),
+        'about_conference': AboutTheConference.objects.filter(event=event).first(),
+        'images': list(EventImage.objects.filter(event=event).order_by('id')),
+        'videos': list(EventVideo.objects.filter(event=event)),
+        'abstract_book': UploadAbstractBook.objects.filter(event=event).first(),
+        'notebook': UploadNoteBook.objects.filter(event=event).first(),
+        'program_schedule_pdf': ProgramSchedulePdf.objects.filter(event=event).first(),
+    }
+
+
+def get_event_bundle(event_id):
+    """Return the cached bundle of an event, rebuilding it on a miss.
+
+    Raises Http404 when the event does not exist, like get_object_or_404.
+    """
+    key = _bundle_key(event_id)
+    bundle = cache.get(key)
+    if bundle is not None:
+        _incr(BUNDLE_HITS_KEY)
+        return bundle
+
+    _incr(BUNDLE_MISSES_KEY)
+    started = time.perf_counter()
+    bundle = build_event_bundle(event_id)
+    if bundle is None:
+        raise Http404("No Event matches the given query.")
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    cache.set(key, bundle, None)
+    _incr(BUNDLE_REBUILDS_KEY)
+    cache.set(BUNDLE_LAST_REBUILD_KEY, {
+        'event_id': event_id,
+        'duration_ms': round(elapsed_ms, 2),
+        'rebuilt_at': time.time(),
+    }, None)
+    return bundle
+
+
+def invalidate_event_bundle(event_id):
+    """Drop the bundle of an event once the current transaction commits."""
+    if event_id is None:
+        return
+    key = _bundle_key(event_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def get_bundle_stats():
+    """Return hit/miss counters and the last rebuild timing for monitoring."""
+    hits = cache.get(BUNDLE_HITS_KEY, 0)
+    misses = cache.get(BUNDLE_MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'rebuilds': cache.get(BUNDLE_REBUILDS_KEY, 0),
+        'hit_ratio': round(hits / total, 4) if total else None,
+        'last_rebuild': cache.get(BUNDLE_LAST_REBUILD_KEY),
+    }
+
+
+# Signal handlers ------------------------------------------------------------#
+
+def _invalidate_for_child(sender, instance, **kwargs):
+    invalidate_event_bundle(instance.event_id)
+
+
+def _invalidate_for_event(sender, instance, **kwargs):
+    invalidate_event_bundle(instance.pk)
+
+
+def connect_bundle_signals():
+    """Connect bundle invalidation to the Event and every bundled model."""
+    post_save.connect(_invalidate_for_event, sender=Event, dispatch_uid='event_bundle_event_save')
+    post_delete.connect(_invalidate_for_event, sender=Event, dispatch_uid='event_bundle_event_delete')
+    for model in BUNDLE_MODELS:
+        uid = f'event_bundle_{model._meta.label_lower}'
+        post_save.connect(_invalidate_for_child, sender=model, dispatch_uid=f'{uid}_save')
+        post_delete.connect(_invalidate_for_child, sender=model, dispatch_uid=f'{uid}_delete')
@@ -0,0 +1,187 @@
+"""Per-event cache helpers for the public event pages.
+
+Every event owns a version token stored in the cache. Any save or delete of a
+model with an ``event`` foreign key (and of the Event itself) replaces that
+token, so cache entries built from the old token are never read again and
+editors see their changes on the next request.
+"""
+
+import datetime
+import hashlib
+import time
+from functools import wraps
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from django.db.models import ForeignKey
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.http import HttpResponse
+from django.views.decorators.http import condition
+
+# Rendered pages are keyed by version, so the timeout only bounds memory use
+EVENT_PAGE_TIMEOUT = 60 * 60 * 24
+
+
+# Replaced together with any event token, for pages that list every event
+ALL_EVENTS_VERSION_KEY = 'event_version_all'
+
+
+def _event_version_key(event_id):
+    return f'event_version_{event_id}'
+
+
+def get_version(key):
+    """Return the version token stored under ``key``, seeding it if missing."""
+    version = cache.get(key)
+    if version is None:
+        # Seed with the current time so an evicted token never repeats
+        version = time.time_ns()
+        cache.add(key, version, None)
+        version = cache.get(key, version)
+    return version
+
+
+def _replace_versions(keys):
+    cache.set_many({key: time.time_ns() for key in keys}, None)
+    # Other workers keep the old tokens in their in-process tier until told
+    # (see conference/cache_backends.py); plain backends have no such tier
+    publish_invalidation = getattr(cache, 'publish_invalidation', None)
+    if publish_invalidation is not None:
+        publish_invalidation()
+
+
+def bump_version(*keys):
+    """Replace the version tokens under ``keys`` once the transaction commits."""
+    transaction.on_commit(lambda: _replace_versions(keys))
+
+
+def version_timestamp(version):
+    """Return the (aware) time a version token was issued, for Last-Modified."""
+    return datetime.datetime.fromtimestamp(version / 1e9, tz=datetime.timezone.utc)
+
+
+def get_event_version(event_id):
+    """Return the current cache version token for an event."""
+    return get_version(_event_version_key(event_id))
+
+
+def get_all_events_version():
+    """Return a token that changes whenever any event token changes."""
+    return get_version(ALL_EVENTS_VERSION_KEY)
+
+
+def bump_event_version(event_id):
+    """Invalidate every cached entry of an event by replacing its token.
+
+    The token is replaced once the surrounding transaction commits, so a
+    concurrent request can not cache rows that are about to change.
+    """
+    if event_id is None:
+        return
+    bump_version(_event_version_key(event_id), ALL_EVENTS_VERSION_KEY)
+
+
+def event_cache_key(event_id, name, *parts):
+    """Build a cache key bound to the current version of an event."""
+    version = get_event_version(event_id)
+    suffix = ''.join(f'_{part}' for part in parts)
+    return f'event_{event_id}_v{version}_{name}{suffix}'
+
+
+def cache_event_page(view_func):
+    """Cache the rendered page of an event view for anonymous visitors.
+
+    Logged-in users, HTMX requests and anything but GET always hit the view,
+    because those responses depend on the user. Only 200 responses are kept.
+    """
+    @wraps(view_func)
+    def _wrapped_view_func(request, event_id, *args, **kwargs):
+        if (request.method != 'GET' or request.user.is_authenticated
+                or request.headers.get('HX-Request')):
+            return view_func(request, event_id, *args, **kwargs)
+
+        url_hash = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+        key = event_cache_key(event_id, 'page', view_func.__name__, url_hash)
+        cached = cache.get(key)
+        if cached is not None:
+            content, content_type = cached
+            return HttpResponse(content, content_type=content_type)
+
+        response = view_func(request, event_id, *args, **kwargs)
+        if response.status_code == 200 and not response.streaming:
+            cache.set(key, (response.content, response['Content-Type']), EVENT_PAGE_TIMEOUT)
+        return response
+    return _wrapped_view_func
+
+
+def is_conditional_request_cacheable(request):
+    """Whether a response may be revalidated with ETag/Last-Modified alone.
+
+    Pages of logged-in users show their own account details, and HTMX
+    fragments share the URL of the full page, so neither can be validated
+    by a content token.
+    """
+    return not (request.user.is_authenticated or request.headers.get('HX-Request'))
+
+
+def _event_etag(request, event_id, *args, **kwargs):
+    if not is_conditional_request_cacheable(request):
+        return None
+    return f'"event-{event_id}-{get_event_version(event_id)}"'
+
+
+def _event_last_modified(request, event_id, *args, **kwargs):
+    if not is_conditional_request_cacheable(request):
+        return None
+    return version_timestamp(get_event_version(event_id))
+
+
+def conditional_event_page(view_func):
+    """Answer conditional GETs of an event page from its version token.
+
+    Anonymous visitors get an ETag and Last-Modified derived from the event
+    token, and a matching If-None-Match/If-Modified-Since is answered with
+    304 before the view runs.
+    """
+    return condition(etag_func=_event_etag, last_modified_func=_event_last_modified)(view_func)
+
+
+# Signal handlers ------------------------------------------------------------#
+
+def invalidate_event_cache(sender, instance, **kwargs):
+    """post_save/post_delete handler for models with an ``event`` foreign key."""
+    bump_event_version(getattr(instance, 'event_id', None))
+
+
+def invalidate_event_cache_for_event(sender, instance, **kwargs):
+    """post_save/post_delete handler for the Event itself."""
+    bump_event_version(instance.pk)
+
+
+def invalidate_event_cache_for_m2m(sender, instance, action, **kwargs):
+    """m2m_changed handler; either side of the link may carry the event."""
+    if action.startswith('post_'):
+        bump_event_version(getattr(instance, 'event_id', None))
+
+
+def connect_event_cache_signals():
+    """Connect the invalidation handlers to every model with an ``event`` FK."""
+    Event = apps.get_model('registration', 'Event')
+    post_save.connect(invalidate_event_cache_for_event, sender=Event, dispatch_uid='event_cache_event_save')
+    post_delete.connect(invalidate_event_cache_for_event, sender=Event, dispatch_uid='event_cache_event_delete')
+
+    for model in apps.get_app_config('registration').get_models():
+        try:
+            field = model._meta.get_field('event')
+        except FieldDoesNotExist:
+            continue
+        if not isinstance(field, ForeignKey) or field.related_model is not Event:
+            continue
+        uid = f'event_cache_{model._meta.label_lower}'
+        post_save.connect(invalidate_event_cache, sender=model, dispatch_uid=f'{uid}_save')
+        post_delete.connect(invalidate_event_cache, sender=model, dispatch_uid=f'{uid}_delete')
+        for m2m in model._meta.many_to_many:
+            through = m2m.remote_field.through
+            m2m_changed.connect(invalidate_event_cache_for_m2m, sender=through, dispatch_uid=f'event_cache_{through._meta.label_lower}')
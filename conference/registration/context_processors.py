@@ -1,12 +1,14 @@
-from .models import UserProfile
+from .profile import get_user_profile
 
 
 def user_profile(request):
-    """Context processor that adds `user_profile` to the template context if available."""
-    profile = None
+    """Context processor that adds `user_profile` to the template context if available.
+
+    Shares the request-scoped copy used by the views, so rendering does not
+    query the profile again.
+    """
     try:
-        if request.user.is_authenticated:
-            profile = UserProfile.objects.filter(user=request.user).first()
+        profile = get_user_profile(request)
     except Exception:
         profile = None
     return {
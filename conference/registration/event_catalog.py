@@ -0,0 +1,82 @@
+"""Cached catalog of every event, grouped by status.
+
+The event lists of the registration index, the website events page and
+homepage, and the account page all come from one query over Event, split
+by status in Python. The catalog is cached under a version token replaced
+on any Event save or delete, and holds each event as a plain dict with the
+data its card shows, so a cache hit runs no queries.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+
+from .caching import bump_version, get_version
+from .models import Event
+
+# Replaced on any Event save/delete
+EVENT_CATALOG_VERSION_KEY = 'event_catalog_version'
+
+# Keyed by version, so the timeout only bounds memory use
+EVENT_CATALOG_TIMEOUT = 60 * 60 * 24
+
+EVENT_CARD_FIELDS = (
+    'id', 'name', 'year', 'slogan', 'description', 'location', 'start_date', 'end_date',
+    'event_status', 'registration', 'event_logo',
+)
+
+
+def _event_card(event):
+    return {
+        'id': event.id,
+        'name': event.name,
+        'year': event.year,
+        'title': f"{event.name} {event.year}",
+        'slogan': event.slogan,
+        'description': event.description,
+        'location': event.location,
+        'start_date': event.start_date,
+        'end_date': event.end_date,
+        'event_status': event.event_status,
+        'registration': event.registration,
+        'registration_open': event.registration == 'Open',
+        'logo_url': event.event_logo.url if event.event_logo else '',
+    }
+
+
+def build_event_catalog():
+    """Query the database and return the event cards of every status."""
+    events = {'active': [], 'upcoming': [], 'closed': []}
+    for event in Event.objects.only(*EVENT_CARD_FIELDS).order_by('start_date', 'id'):
+        if event.event_status in events:
+            events[event.event_status].append(_event_card(event))
+    # Active events are listed most recent first, past events by end date
+    events['active'].reverse()
+    events['closed'].sort(key=lambda card: card['end_date'], reverse=True)
+    return {
+        'active_events': events['active'],
+        'upcoming_events': events['upcoming'],
+        'closed_events': events['closed'],
+    }
+
+
+def get_event_catalog():
+    """Return the cached event cards, keyed ``active_events``,
+    ``upcoming_events`` and ``closed_events``."""
+    key = f'event_catalog_v{get_version(EVENT_CATALOG_VERSION_KEY)}'
+    catalog = cache.get(key)
+    if catalog is None:
+        catalog = build_event_catalog()
+        cache.set(key, catalog, EVENT_CATALOG_TIMEOUT)
+    return catalog
+
+
+# Signal handlers ------------------------------------------------------------#
+
+def _invalidate_catalog(sender, instance, **kwargs):
+    bump_version(EVENT_CATALOG_VERSION_KEY)
+
+
+def connect_event_catalog_signals():
+    """Rebuild the catalog after any Event save or delete."""
+    post_save.connect(_invalidate_catalog, sender=Event, dispatch_uid='event_catalog_event_save')
+    post_delete.connect(_invalidate_catalog, sender=Event, dispatch_uid='event_catalog_event_delete')
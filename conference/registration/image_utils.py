@@ -0,0 +1,36 @@
+# registration/image_utils.py
+
+import logging
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+
+def make_thumbnail(image_field, max_size, image_format='WEBP', quality=85):
+    """Return a downscaled copy of an ImageField file as a ContentFile.
+
+    The aspect ratio is kept and transparency is preserved, so logos keep
+    their background. Returns None if the source file cannot be read.
+    """
+    try:
+        image_field.open('rb')
+        with Image.open(image_field) as source:
+            image = ImageOps.exif_transpose(source)
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA')
+            image.thumbnail(max_size, Image.LANCZOS)
+
+            buffer = BytesIO()
+            image.save(buffer, format=image_format, quality=quality)
+    except (OSError, ValueError) as e:
+        logger.warning("Thumbnail Error for %s: %s", image_field.name, e)
+        return None
+    finally:
+        image_field.close()
+
+    stem = os.path.splitext(os.path.basename(image_field.name))[0]
+    return ContentFile(buffer.getvalue(), name=f"{stem}.{image_format.lower()}")
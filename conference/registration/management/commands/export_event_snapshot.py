@@ -0,0 +1,37 @@
+"""
+Management command to pre-render the public pages of closed events into static HTML.
+
+Usage: python manage.py export_event_snapshot [<event_id> ...] [--delete]
+"""
+
+from django.core.management.base import BaseCommand
+from registration.models import Event
+from registration.snapshot import SnapshotError, export_event_snapshot, delete_event_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Export static HTML snapshots of closed events (all closed events by default)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('event_ids', nargs='*', type=int, help='IDs of the events to export')
+        parser.add_argument('--delete', action='store_true', help='Remove the snapshots instead of exporting them')
+
+    def handle(self, *args, **options):
+        events = Event.objects.all()
+        if options['event_ids']:
+            events = events.filter(id__in=options['event_ids'])
+        elif not options['delete']:
+            events = events.filter(event_status='closed')
+
+        for event in events:
+            if options['delete']:
+                delete_event_snapshot(event)
+                self.stdout.write(self.style.SUCCESS(f"Deleted snapshot of {event}"))
+                continue
+
+            try:
+                pages = export_event_snapshot(event)
+            except SnapshotError as e:
+                self.stdout.write(self.style.ERROR(f"Skipped {event}: {e}"))
+                continue
+            self.stdout.write(self.style.SUCCESS(f"Exported {pages} pages for {event}"))
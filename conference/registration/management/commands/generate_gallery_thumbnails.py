@@ -0,0 +1,36 @@
+"""
+Management command to backfill image dimensions and resized copies for event galleries.
+
+Usage: python manage.py generate_gallery_thumbnails [--event <event_id>] [--force]
+"""
+
+from django.db.models import Q
+from django.core.management.base import BaseCommand
+from registration.models import EventImage
+
+
+class Command(BaseCommand):
+    help = 'Store width/height and generate gallery thumbnails for event images'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--event', type=int, help='Only process images of this event')
+        parser.add_argument('--force', action='store_true', help='Regenerate existing thumbnails too')
+
+    def handle(self, *args, **options):
+        images = EventImage.objects.exclude(image='')
+        if options['event']:
+            images = images.filter(event_id=options['event'])
+        if not options['force']:
+            images = images.filter(Q(thumbnail='') | Q(thumbnail__isnull=True) | Q(width__isnull=True))
+
+        count = 0
+        for event_image in images.iterator():
+            if not event_image.read_dimensions():
+                self.stdout.write(self.style.WARNING(f"Could not read {event_image.image.name} (id {event_image.pk})"))
+                continue
+            # Thumbnail first, so save() finds it and does not generate another
+            event_image.generate_thumbnail()
+            event_image.save(update_fields=['width', 'height'])
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {count} gallery image(s)"))
@@ -0,0 +1,33 @@
+"""
+Management command to (re)build the resized sponsor logos used on the sponsor wall.
+
+Usage: python manage.py generate_sponsor_thumbnails [--event <event_id>] [--force]
+"""
+
+from django.core.management.base import BaseCommand
+from registration.models import Sponsor
+
+
+class Command(BaseCommand):
+    help = 'Generate resized logo thumbnails for sponsors'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--event', type=int, help='Only process sponsors of this event')
+        parser.add_argument('--force', action='store_true', help='Regenerate existing thumbnails too')
+
+    def handle(self, *args, **options):
+        sponsors = Sponsor.objects.exclude(image='').exclude(image__isnull=True)
+        if options['event']:
+            sponsors = sponsors.filter(event_id=options['event'])
+        if not options['force']:
+            sponsors = sponsors.filter(logo_thumbnail__in=['', None])
+
+        count = 0
+        for sponsor in sponsors.iterator():
+            sponsor.generate_logo_thumbnail()
+            if sponsor.logo_thumbnail:
+                count += 1
+            else:
+                self.stdout.write(self.style.WARNING(f"Could not read logo for {sponsor} (id {sponsor.pk})"))
+
+        self.stdout.write(self.style.SUCCESS(f"Generated {count} sponsor thumbnail(s)"))
@@ -0,0 +1,143 @@
+"""
+Management command to report what each app module costs a worker at startup.
+
+Every module is imported in a fresh interpreter after django.setup(), so the
+import time, resident memory and heavy libraries (pandas, seaborn,
+matplotlib) it adds are measured on their own. Modules that django.setup()
+already imports (models, admin, apps) count towards its total. With --check
+the command fails when a module a worker loads at boot does not import or
+pulls in a heavy library.
+
+Usage: python manage.py startup_benchmark [--module <dotted.path> ...] [--check]
+"""
+
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Libraries only the staff dashboard needs, see registration/analytics.py
+HEAVY_MODULES = ('pandas', 'seaborn', 'matplotlib')
+
+# Imported by every worker: the WSGI application and, through the URLconf, every view
+BOOT_MODULES = ('conference.wsgi', 'conference.urls')
+
+PROJECT_PACKAGES = ('conference', 'website', 'registration')
+
+# Runs in the child interpreter: argv[1] is the module to import
+_MEASURE = """
+import importlib, json, os, sys, time
+
+def rss_kb():
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+
+heavy = {heavy!r}
+started = time.perf_counter()
+import django
+django.setup()
+setup_s = time.perf_counter() - started
+setup_rss = rss_kb()
+loaded = len(sys.modules)
+result = {{'setup_ms': setup_s * 1000, 'setup_rss_kb': setup_rss,
+          'setup_heavy': [name for name in heavy if name in sys.modules],
+          'during_setup': sys.argv[1] in sys.modules}}
+started = time.perf_counter()
+try:
+    importlib.import_module(sys.argv[1])
+except Exception as e:
+    result['error'] = f'{{type(e).__name__}}: {{e}}'
+result.update({{
+    'import_ms': (time.perf_counter() - started) * 1000,
+    'rss_kb': rss_kb() - setup_rss,
+    'modules': len(sys.modules) - loaded,
+    'heavy': [name for name in heavy if name in sys.modules and name not in result['setup_heavy']],
+}})
+print(json.dumps(result))
+""".format(heavy=HEAVY_MODULES)
+
+
+def project_modules():
+    """Return the dotted paths of the top-level modules of the project packages."""
+    modules = []
+    for package_name in PROJECT_PACKAGES:
+        package = import_module(package_name)
+        for module in pkgutil.iter_modules(package.__path__):
+            # Skip subpackages, tests and stray files such as Old_views.py.py
+            if module.ispkg or module.name == 'tests' or '.' in module.name:
+                continue
+            modules.append(f'{package_name}.{module.name}')
+    return sorted(modules)
+
+
+def measure(module):
+    """Import ``module`` in a fresh interpreter and return its measurements."""
+    completed = subprocess.run(
+        [sys.executable, '-c', _MEASURE, module],
+        cwd=settings.BASE_DIR, env=os.environ.copy(), capture_output=True, text=True,
+    )
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        error = completed.stderr.strip().splitlines()
+        return {'error': error[-1] if error else f'exit status {completed.returncode}'}
+    return json.loads(lines[-1])
+
+
+class Command(BaseCommand):
+    help = 'Report the import time, memory and heavy libraries of each app module'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--module', action='append', dest='modules', help='Only measure this module (repeatable)')
+        parser.add_argument('--check', action='store_true', help='Fail if a boot module does not import or imports a heavy library')
+
+    def handle(self, *args, **options):
+        modules = options['modules'] or project_modules()
+        if options['check']:
+            modules = sorted(set(modules) | set(BOOT_MODULES))
+
+        results = {module: measure(module) for module in modules}
+        setup = next((result for result in results.values() if 'setup_ms' in result), None)
+        if setup:
+            self.stdout.write(
+                f"django.setup(): {setup['setup_ms']:.0f} ms, {setup['setup_rss_kb'] / 1024:.1f} MB RSS"
+                + (f", loads {', '.join(setup['setup_heavy'])}" if setup['setup_heavy'] else '')
+            )
+
+        self.stdout.write(f"{'module':<40} {'import ms':>10} {'RSS MB':>8} {'modules':>8}  heavy")
+        ordered = sorted(results.items(), key=lambda item: item[1].get('import_ms', 0), reverse=True)
+        for module, result in ordered:
+            if 'error' in result and 'import_ms' not in result:
+                self.stdout.write(self.style.ERROR(f"{module:<40} {result['error']}"))
+                continue
+            if result['during_setup']:
+                self.stdout.write(f"{module:<40} {'(imported by django.setup())':>28}")
+                continue
+            line = (
+                f"{module:<40} {result['import_ms']:>10.1f} {result['rss_kb'] / 1024:>8.1f} "
+                f"{result['modules']:>8}  {', '.join(result['heavy'])}"
+            )
+            if 'error' in result:
+                line += f"  ({result['error']})"
+            self.stdout.write(self.style.WARNING(line) if result['heavy'] else line)
+
+        if options['check']:
+            failed = {module: results[module]['error'] for module in BOOT_MODULES if 'error' in results[module]}
+            if failed:
+                raise CommandError('Boot modules failed to import: ' + '; '.join(
+                    f"{module} ({error})" for module, error in failed.items()
+                ))
+            offenders = {
+                module: (results[module].get('setup_heavy') or []) + (results[module].get('heavy') or [])
+                for module in BOOT_MODULES
+            }
+            offenders = {module: heavy for module, heavy in offenders.items() if heavy}
+            if offenders:
+                raise CommandError('Heavy libraries on the worker import path: ' + '; '.join(
+                    f"{module} loads {', '.join(heavy)}" for module, heavy in offenders.items()
+                ))
+            self.stdout.write(self.style.SUCCESS('No heavy libraries on the worker import path'))
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 06:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registration', '0063_alter_abouttheconference_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sponsor',
+            name='logo_thumbnail',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='media/sponsor_thumbnails/'),
+        ),
+    ]
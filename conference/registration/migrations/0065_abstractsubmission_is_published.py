@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-18 06:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registration', '0064_sponsor_logo_thumbnail'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='abstractsubmission',
+            name='is_published',
+            field=models.GeneratedField(db_persist=True, expression=models.Q(('approved_for_presentation', True), ('approved_for_poster', True), _connector='OR'), output_field=models.BooleanField()),
+        ),
+        migrations.AddIndex(
+            model_name='abstractsubmission',
+            index=models.Index(fields=['event', 'is_published', 'title'], name='abstract_event_published_idx'),
+        ),
+    ]
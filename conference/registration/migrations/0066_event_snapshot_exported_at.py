@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 06:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registration', '0065_abstractsubmission_is_published'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='snapshot_exported_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When the static snapshot of this closed event was last exported', null=True),
+        ),
+    ]
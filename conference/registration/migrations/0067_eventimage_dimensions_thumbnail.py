@@ -0,0 +1,33 @@
+# Generated by Django 5.1.4 on 2026-10-18 06:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registration', '0066_event_snapshot_exported_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventimage',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='eventimage',
+            name='thumbnail',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='media/event_image_thumbnails/'),
+        ),
+        migrations.AddField(
+            model_name='eventimage',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='eventimage',
+            name='image',
+            field=models.ImageField(height_field='height', upload_to='media/event_images/', width_field='width'),
+        ),
+    ]
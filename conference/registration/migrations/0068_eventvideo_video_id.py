@@ -0,0 +1,29 @@
+# Generated by Django 5.1.4 on 2026-10-18 06:56
+
+from django.db import migrations, models
+
+from registration.video_utils import parse_youtube_id
+
+
+def fill_video_ids(apps, schema_editor):
+    EventVideo = apps.get_model('registration', 'EventVideo')
+    videos = list(EventVideo.objects.only('youtube_url'))
+    for video in videos:
+        video.video_id = parse_youtube_id(video.youtube_url)
+    EventVideo.objects.bulk_update(videos, ['video_id'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registration', '0067_eventimage_dimensions_thumbnail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventvideo',
+            name='video_id',
+            field=models.CharField(blank=True, default='', editable=False, max_length=11),
+        ),
+        migrations.RunPython(fill_video_ids, migrations.RunPython.noop),
+    ]
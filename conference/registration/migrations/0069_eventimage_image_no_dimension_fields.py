@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 07:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registration', '0068_eventvideo_video_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='eventimage',
+            name='image',
+            field=models.ImageField(upload_to='media/event_images/'),
+        ),
+    ]
@@ -76,6 +76,11 @@ class Event(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     email_subject = models.CharField(max_length=255, blank=True, null=True, help_text='Thank You email subject text')
     email_body = models.TextField(blank=True, null=True, help_text='Thank You email body text')
+    snapshot_exported_at = models.DateTimeField(blank=True, null=True, editable=False, help_text='When the static snapshot of this closed event was last exported')
+
+    @property
+    def has_snapshot(self):
+        return self.event_status == 'closed' and self.snapshot_exported_at is not None
 
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -303,10 +308,19 @@ class AbstractSubmission(models.Model):
     )
     approved_for_presentation = models.BooleanField(default=False)
     approved_for_poster = models.BooleanField(default=False)
+    # Computed by the database from the approval flags, so lists can filter on an index
+    is_published = models.GeneratedField(
+        expression=models.Q(approved_for_presentation=True) | models.Q(approved_for_poster=True),
+        output_field=models.BooleanField(),
+        db_persist=True,
+    )
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = 'Abstract Submission'
+        indexes = [
+            models.Index(fields=['event', 'is_published', 'title'], name='abstract_event_published_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -458,14 +472,53 @@ class Sponsor(models.Model):
         (IT, 'IT'),
         (EVENT, 'Event')
     ]
+    # Bounding box of the resized logo shown on the sponsor wall (2x the card width)
+    THUMBNAIL_SIZE = (640, 320)
+
     event = models.ForeignKey(Event, on_delete=models.CASCADE)
     name = models.CharField(max_length=200)
     image = models.ImageField(upload_to='media/sponsor_images/', null=True, blank=True)
+    logo_thumbnail = models.ImageField(upload_to='media/sponsor_thumbnails/', null=True, blank=True, editable=False)
     category = models.CharField(max_length=200, choices=CATEGORY_CHOICES, null=True, blank=True)
 
     class Meta:
         verbose_name_plural = 'Sponsors'
 
+    def save(self, *args, **kwargs):
+        previous_image = None
+        if self.pk:
+            previous_image = Sponsor.objects.filter(pk=self.pk).values_list('image', flat=True).first()
+        super().save(*args, **kwargs)
+
+        # Regenerate the resized logo whenever the uploaded image changes
+        if self.image and (not self.logo_thumbnail or previous_image != self.image.name):
+            self.generate_logo_thumbnail()
+        elif not self.image and self.logo_thumbnail:
+            self.logo_thumbnail = None
+            super().save(update_fields=['logo_thumbnail'])
+
+    def generate_logo_thumbnail(self):
+        """Store a downscaled WebP copy of the logo for the sponsor wall."""
+        from .image_utils import make_thumbnail
+        thumbnail = make_thumbnail(self.image, self.THUMBNAIL_SIZE)
+        if thumbnail is None:
+            # Drop the copy of a replaced logo, so the wall shows the upload
+            if self.logo_thumbnail:
+                self.logo_thumbnail = None
+                super().save(update_fields=['logo_thumbnail'])
+            return
+        self.logo_thumbnail.save(thumbnail.name, thumbnail, save=False)
+        super().save(update_fields=['logo_thumbnail'])
+
+    @classmethod
+    def group_by_category(cls, sponsors):
+        """Group sponsors into a dict ordered like CATEGORY_CHOICES."""
+        grouped = {category: [] for category, _ in cls.CATEGORY_CHOICES}
+        for sponsor in sponsors:
+            if sponsor.category in grouped:
+                grouped[sponsor.category].append(sponsor)
+        return grouped
+
     def __str__(self):
         return self.name
 # Sponsorship Models END------------------------------------------------------------------------------------#
@@ -476,18 +529,80 @@ class Sponsor(models.Model):
 from django.db import models
 
 class EventImage(models.Model):
+    # Bounding box of the resized copy shown in the gallery grid
+    THUMBNAIL_SIZE = (800, 800)
+
     event = models.ForeignKey(Event, on_delete=models.CASCADE)
     image = models.ImageField(upload_to='media/event_images/')
+    # Read on save rather than through width_field/height_field, which open
+    # the file whenever a row is loaded and fail if it is missing
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    thumbnail = models.ImageField(upload_to='media/event_image_thumbnails/', null=True, blank=True, editable=False)
     caption = models.CharField(max_length=200, blank=True, null=True)
 
+    def save(self, *args, **kwargs):
+        previous_image = None
+        if self.pk:
+            previous_image = EventImage.objects.filter(pk=self.pk).values_list('image', flat=True).first()
+        image_changed = previous_image != self.image.name
+        if self.image and (image_changed or self.width is None):
+            if not self.read_dimensions() and image_changed:
+                # The stored size is the one of the previous image
+                self.width = self.height = None
+        super().save(*args, **kwargs)
+
+        # Regenerate the gallery copy whenever the uploaded image changes
+        if self.image and (not self.thumbnail or image_changed):
+            self.generate_thumbnail()
+
+    def read_dimensions(self):
+        """Store the pixel size of the image. Returns False if the file can
+        not be read, leaving the stored size unchanged."""
+        try:
+            self.width, self.height = self.image.width, self.image.height
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def generate_thumbnail(self):
+        """Store a downscaled WebP copy of the image for the gallery grid."""
+        from .image_utils import make_thumbnail
+        thumbnail = make_thumbnail(self.image, self.THUMBNAIL_SIZE)
+        if thumbnail is None:
+            # Drop the copy of a replaced image, so the grid shows the upload
+            if self.thumbnail:
+                self.thumbnail = None
+                super().save(update_fields=['thumbnail'])
+            return
+        self.thumbnail.save(thumbnail.name, thumbnail, save=False)
+        super().save(update_fields=['thumbnail'])
+
     def __str__(self):
         return self.caption or "Event Image"
 
 class EventVideo(models.Model):
     event = models.ForeignKey(Event, on_delete=models.CASCADE)
     youtube_url = models.URLField()
+    # Parsed from youtube_url on save, for the thumbnail and player
+    video_id = models.CharField(max_length=11, blank=True, default='', editable=False)
     caption = models.CharField(max_length=200, blank=True, null=True)
 
+    def save(self, *args, **kwargs):
+        from .video_utils import parse_youtube_id
+        self.video_id = parse_youtube_id(self.youtube_url)
+        super().save(*args, **kwargs)
+
+    @property
+    def thumbnail_url(self):
+        from .video_utils import youtube_thumbnail_url
+        return youtube_thumbnail_url(self.video_id) if self.video_id else ''
+
+    @property
+    def embed_url(self):
+        from .video_utils import youtube_embed_url
+        return youtube_embed_url(self.video_id) if self.video_id else ''
+
     def __str__(self):
         return self.caption or "Event Video"
 # EventImage and EventVideo Models END------------------------------------------------------------------------------------#
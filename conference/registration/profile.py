@@ -0,0 +1,82 @@
+"""Request-scoped, cached access to the logged-in user's profile.
+
+The UserProfile of a user (with its website Member row, if any) is loaded
+with one query, stored in the cache until the profile or membership changes,
+and memoized on the request. Views, context processors and templates all
+share that single copy through ``get_user_profile(request)`` or the lazy
+``request.user_profile`` set by UserProfileMiddleware.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from .models import UserProfile
+
+# Entries are dropped on change, so the timeout only bounds memory use
+USER_PROFILE_TIMEOUT = 60 * 60 * 24
+
+# Stored in the cache for users without a profile, to tell them from a miss
+_NO_PROFILE = 'none'
+
+
+def _profile_key(user_id):
+    return f'user_profile_{user_id}'
+
+
+def _load_user_profile(user_id):
+    profile = UserProfile.objects.select_related('member').filter(user_id=user_id).first()
+    if profile is not None:
+        member = getattr(profile, 'member', None)
+        profile.member_status = member.approval_status if member else None
+    return profile
+
+
+def get_user_profile(request):
+    """Return the UserProfile of the request's user, or None.
+
+    At most one query per request, and none when the profile is cached.
+    """
+    if not hasattr(request, '_cached_user_profile'):
+        profile = None
+        if request.user.is_authenticated:
+            key = _profile_key(request.user.pk)
+            profile = cache.get(key)
+            if profile is None:
+                profile = _load_user_profile(request.user.pk)
+                cache.set(key, profile if profile is not None else _NO_PROFILE, USER_PROFILE_TIMEOUT)
+            elif profile == _NO_PROFILE:
+                profile = None
+        request._cached_user_profile = profile
+    return request._cached_user_profile
+
+
+def invalidate_user_profile(user_id):
+    """Drop the cached profile of a user once the current transaction commits."""
+    if user_id is None:
+        return
+    key = _profile_key(user_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+# Signal handlers ------------------------------------------------------------#
+
+def _invalidate_for_profile(sender, instance, **kwargs):
+    invalidate_user_profile(instance.user_id)
+
+
+def _invalidate_for_member(sender, instance, **kwargs):
+    if instance.user_profile_id is None:
+        return
+    user_id = UserProfile.objects.filter(pk=instance.user_profile_id).values_list('user_id', flat=True).first()
+    invalidate_user_profile(user_id)
+
+
+def connect_profile_signals():
+    """Connect profile cache invalidation to UserProfile and website Member."""
+    from website.models import Member
+
+    post_save.connect(_invalidate_for_profile, sender=UserProfile, dispatch_uid='user_profile_cache_save')
+    post_delete.connect(_invalidate_for_profile, sender=UserProfile, dispatch_uid='user_profile_cache_delete')
+    post_save.connect(_invalidate_for_member, sender=Member, dispatch_uid='user_profile_cache_member_save')
+    post_delete.connect(_invalidate_for_member, sender=Member, dispatch_uid='user_profile_cache_member_delete')
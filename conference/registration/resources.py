@@ -11,6 +11,7 @@ class ParticipantResource(resources.ModelResource):
 class AbstractSubmissionResource(resources.ModelResource):
     class Meta:
         model = AbstractSubmission
+        exclude = ('is_published',)
 #AbstractSubmission resource END------------------------------------------------------------------------------#
 # Timeslot Model START---------------------------------------------------------------------------------#
 class TimeSlotResource(resources.ModelResource):
@@ -0,0 +1,139 @@
+"""Materialized program schedule grid (day x hall x slot) per event.
+
+The grid is built with a fixed number of queries from ProgramDay, HallRoom,
+TimeSlot and ProgramSchedule (with its abstract and people) and stored in the
+cache as plain dicts, so rendering it never triggers a lazy lookup. It is
+dropped whenever one of the underlying rows or M2M links changes.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+from django.db.models.signals import post_save, post_delete, m2m_changed
+
+from .models import (
+    AbstractSubmission, Chairperson, HallRoom, Moderator, Panelist,
+    ProgramDay, ProgramSchedule, TimeSlot,
+)
+
+# Models whose rows feed the grid; a change to any of them drops it
+GRID_MODELS = (
+    ProgramSchedule, TimeSlot, HallRoom, ProgramDay,
+    Chairperson, Moderator, Panelist, AbstractSubmission,
+)
+
+
+def _grid_key(event_id):
+    return f'schedule_grid_{event_id}'
+
+
+def _slot_label(slot, hall_name):
+    # Same text as TimeSlot.__str__, without the hall_room lookup
+    return f"{hall_name} - {slot.start_time.strftime('%I:%M %p')} - {slot.end_time.strftime('%I:%M %p')}"
+
+
+def build_schedule_grid(event_id):
+    """Query the database and return a fresh schedule grid for an event.
+
+    The result has three views of the same data:
+      * ``days``: nested day -> hall -> slot -> sessions, for grid layouts
+      * ``rows``: one row per (session, slot) ordered by day, time and hall
+      * ``sessions``: session dicts keyed by abstract submission id
+    """
+    slots = {}
+    for slot in TimeSlot.objects.filter(event_id=event_id).select_related('program_day', 'hall_room'):
+        slots[slot.id] = {
+            'id': slot.id,
+            'start_time': slot.start_time,
+            'end_time': slot.end_time,
+            'label': _slot_label(slot, slot.hall_room.name),
+            'day': {'id': slot.program_day.id, 'name': slot.program_day.name, 'date': slot.program_day.date},
+            'hall': {'id': slot.hall_room.id, 'name': slot.hall_room.name, 'location': slot.hall_room.location},
+            'sessions': [],
+        }
+
+    schedules = ProgramSchedule.objects.filter(event_id=event_id)\
+        .select_related('abstract_submission', 'chairperson', 'moderator')\
+        .defer('abstract_submission__methods', 'abstract_submission__results', 'abstract_submission__conclusion')\
+        .prefetch_related(
+            Prefetch('time_slots', queryset=TimeSlot.objects.only('id')),
+            Prefetch('panelist', queryset=Panelist.objects.only('id', 'name')),
+        )
+
+    sessions = {}
+    rows = []
+    for schedule in schedules:
+        abstract = schedule.abstract_submission
+        session_slots = sorted(
+            (slots[slot.id] for slot in schedule.time_slots.all() if slot.id in slots),
+            key=lambda s: (s['day']['date'], s['start_time'], s['hall']['name']),
+        )
+        session = {
+            'id': abstract.id,
+            'schedule_id': schedule.id,
+            'title': abstract.title,
+            'authors': abstract.authors,
+            'introduction': abstract.introduction,
+            'presenter': schedule.presenter,
+            'chairperson': schedule.chairperson.name if schedule.chairperson else None,
+            'moderator': schedule.moderator.name if schedule.moderator else None,
+            'panelists': [panelist.name for panelist in schedule.panelist.all()],
+            'slot_labels': [slot['label'] for slot in session_slots],
+        }
+        sessions[abstract.id] = session
+        for slot in session_slots:
+            slot['sessions'].append(session)
+            rows.append({'slot': slot, 'session': session})
+
+    rows.sort(key=lambda row: (row['slot']['day']['date'], row['slot']['start_time'], row['slot']['hall']['name']))
+
+    days = {}
+    for slot in sorted(slots.values(), key=lambda s: (s['day']['date'], s['hall']['name'], s['start_time'])):
+        day = days.setdefault(slot['day']['id'], dict(slot['day'], halls={}))
+        hall = day['halls'].setdefault(slot['hall']['id'], dict(slot['hall'], slots=[]))
+        hall['slots'].append(slot)
+    for day in days.values():
+        day['halls'] = list(day['halls'].values())
+
+    return {
+        'days': list(days.values()),
+        'rows': rows,
+        'sessions': sessions,
+    }
+
+
+def get_schedule_grid(event_id):
+    """Return the cached schedule grid of an event, rebuilding it on a miss."""
+    key = _grid_key(event_id)
+    grid = cache.get(key)
+    if grid is None:
+        grid = build_schedule_grid(event_id)
+        cache.set(key, grid, None)
+    return grid
+
+
+def invalidate_schedule_grid(event_id):
+    """Drop the schedule grid of an event once the current transaction commits."""
+    if event_id is None:
+        return
+    key = _grid_key(event_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+# Signal handlers ------------------------------------------------------------#
+
+def _invalidate_for_instance(sender, instance, **kwargs):
+    invalidate_schedule_grid(getattr(instance, 'event_id', None))
+
+
+def connect_schedule_grid_signals():
+    """Connect grid invalidation to the schedule models and their M2M links."""
+    for model in GRID_MODELS:
+        uid = f'schedule_grid_{model._meta.label_lower}'
+        post_save.connect(_invalidate_for_instance, sender=model, dispatch_uid=f'{uid}_save')
+        post_delete.connect(_invalidate_for_instance, sender=model, dispatch_uid=f'{uid}_delete')
+
+    # Both sides of these links carry an event_id, so the same handler works
+    # whether the change was made from the schedule or from the slot/panelist
+    for through in (ProgramSchedule.time_slots.through, ProgramSchedule.panelist.through):
+        m2m_changed.connect(_invalidate_for_instance, sender=through, dispatch_uid=f'schedule_grid_{through._meta.label_lower}')
@@ -1,7 +1,11 @@
+import logging
+
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from .models import PaymentStatus, RegistrationKit
 
+logger = logging.getLogger(__name__)
+
 @receiver(post_save, sender=PaymentStatus)
 def create_registration_kit(sender, instance, created, **kwargs):
     # Ensure the payment status is 'paid'
@@ -13,6 +17,6 @@ def create_registration_kit(sender, instance, created, **kwargs):
         )
 
     if created:
-        print(f"Registration kit created for {instance.participant.name} - {instance.event.name}")
+        logger.debug("Registration kit checked for new payment %s", instance.pk)
     else:
-        print(f"Registration kit already exists for {instance.participant.name} - {instance.event.name}")
\ No newline at end of file
+        logger.debug("Registration kit checked for payment %s", instance.pk)
\ No newline at end of file
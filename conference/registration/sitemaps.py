@@ -3,6 +3,7 @@
 from django.contrib.sitemaps import Sitemap
 from django.urls import reverse
 from .models import Event, AbstractSubmission
+from .snapshot import SNAPSHOT_ROUTES, snapshot_event_ids, snapshot_url
 
 # Import website models for sitemap entries
 try:
@@ -10,49 +11,70 @@ try:
 except Exception:
     Webinar = None
 
+# URLs per sitemap page; larger sections are split across pages of the index
+SITEMAP_PAGE_SIZE = 5000
+
 class EventSitemap(Sitemap):
     changefreq = "weekly"
     priority = 0.8
 
     def items(self):
-        return Event.objects.order_by('-updated_at')
+        return Event.objects.only(
+            'id', 'name', 'event_status', 'snapshot_exported_at', 'updated_at'
+        ).order_by('-updated_at')
 
     def lastmod(self, obj):
         return obj.updated_at
 
     def location(self, item):
-        return reverse('registration:home', args=[item.id])
+        path = reverse('registration:home', args=[item.id])
+        # Archived events are served from their static snapshot
+        return snapshot_url(path) if item.has_snapshot else path
 # registration/sitemaps.py
 
 class StaticViewSitemap(Sitemap):
     changefreq = "monthly"
     priority = 0.5
 
+    limit = SITEMAP_PAGE_SIZE
+
     def items(self):
-        events = Event.objects.all()
+        events = Event.objects.values_list('id', 'updated_at').order_by('id')
         static_urls = [
             'about', 'invitation', 'speakers', 'schedule', 'participant_list',
             'registration', 'abstract_submission', 'sponsor_list', 'event_gallery',
             'publication_list'
         ]
-        return [(url, event.id) for event in events for url in static_urls]
+        self.snapshot_events = snapshot_event_ids()
+        return [(url, event_id, updated_at) for event_id, updated_at in events for url in static_urls]
+
+    def lastmod(self, item):
+        return item[2]
 
     def location(self, item):
-        return reverse(f'registration:{item[0]}', args=[item[1]])
+        path = reverse(f'registration:{item[0]}', args=[item[1]])
+        if item[1] in self.snapshot_events and item[0] in SNAPSHOT_ROUTES:
+            return snapshot_url(path)
+        return path
 # registration/sitemaps.py
 
 class PublicationSitemap(Sitemap):
     changefreq = "monthly"
     priority = 0.5
 
+    limit = SITEMAP_PAGE_SIZE
+
     def items(self):
-        return AbstractSubmission.objects.filter(approved_for_presentation=True) | AbstractSubmission.objects.filter(approved_for_poster=True)
+        self.snapshot_events = snapshot_event_ids()
+        # title is read by the HTML sitemap table
+        return AbstractSubmission.objects.filter(is_published=True).only('id', 'event_id', 'title', 'updated_at').order_by('id')
 
     def lastmod(self, obj):
         return obj.updated_at
 
     def location(self, item):
-        return reverse('registration:publication_detail', args=[item.event.id, item.id])
+        path = reverse('registration:publication_detail', args=[item.event_id, item.id])
+        return snapshot_url(path) if item.event_id in self.snapshot_events else path
 
 
 class WebsiteStaticSitemap(Sitemap):
@@ -0,0 +1,209 @@
+"""Static HTML snapshots of closed events.
+
+A closed event never changes again, so its public tabs can be rendered once
+and served as plain files. Every page is written under
+``MEDIA_ROOT/snapshots`` at the same path as its live URL, e.g.
+``/event/3/about/`` is stored as ``snapshots/event/3/about/index.html`` and
+served at ``MEDIA_URL + 'snapshots/event/3/about/'`` by the front web server.
+Links between exported pages, and the ``hx-get`` session detail fragments
+loaded by the schedule, are rewritten to point to their snapshot copy, so a
+visitor browsing an archived event never reaches Django.
+
+Pages are rendered by calling the resolved views directly, as an anonymous
+visitor, without the middleware or the test client.
+"""
+
+import os
+import re
+import shutil
+from urllib.parse import parse_qs
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.paginator import Paginator
+from django.http import Http404
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from .caching import bump_event_version
+from .models import AbstractSubmission, Event
+from .schedule_grid import get_schedule_grid
+from .views import PUBLICATION_PAGE_SIZE, PUBLICATION_TYPES
+
+SNAPSHOT_DIR = 'snapshots'
+
+# Event tabs exported for every closed event
+SNAPSHOT_ROUTES = (
+    'home', 'about', 'speakers', 'schedule', 'sponsor_list', 'event_gallery',
+    'publication_list',
+)
+
+_LINK_RE = re.compile(r'(href|hx-get)="([^"]*)"')
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def snapshot_url(path):
+    """Return the URL of the exported copy of a live URL path."""
+    return f"{settings.MEDIA_URL}{SNAPSHOT_DIR}{path}"
+
+
+def _snapshot_root():
+    return os.path.join(settings.MEDIA_ROOT, SNAPSHOT_DIR)
+
+
+def _event_dir(root, event_id):
+    return os.path.join(root, 'event', str(event_id))
+
+
+def _publication_variant_path(event_id, publication_type, page):
+    base = reverse('registration:publication_list', args=[event_id])
+    if not publication_type and page == 1:
+        return base
+    return f"{base}{publication_type or 'all'}/{page}/"
+
+
+def _publication_variants(event_id):
+    """Yield (type, page, snapshot path) for every page of every list filter."""
+    for publication_type in ('', *PUBLICATION_TYPES):
+        count = AbstractSubmission.objects.filter(
+            event_id=event_id, is_published=True, **PUBLICATION_TYPES.get(publication_type, {})
+        ).count()
+        for page in Paginator(range(count), PUBLICATION_PAGE_SIZE).page_range:
+            yield publication_type, page, _publication_variant_path(event_id, publication_type, page)
+
+
+def _rewrite_links(html, exported, publication_query_paths=None):
+    """Point links and fragments of exported pages (and list filters/pages) at the snapshot."""
+    def replace(match):
+        attribute, href = match.groups()
+        if href in exported:
+            return f'{attribute}="{snapshot_url(href)}"'
+        if attribute == 'href' and publication_query_paths is not None and href.startswith('?'):
+            params = parse_qs(href[1:].replace('&amp;', '&'))
+            publication_type = params.get('type', [''])[0]
+            try:
+                page = int(params.get('page', ['1'])[0])
+            except ValueError:
+                page = 1
+            path = publication_query_paths.get((publication_type, page))
+            if path is None:
+                path = publication_query_paths.get((publication_type, 1), publication_query_paths[('', 1)])
+            return f'href="{snapshot_url(path)}"'
+        return match.group(0)
+    return _LINK_RE.sub(replace, html)
+
+
+def _request_factory():
+    hosts = [host for host in settings.ALLOWED_HOSTS if host != '*' and not host.startswith('.')]
+    return RequestFactory(HTTP_HOST=hosts[0] if hosts else 'localhost')
+
+
+def _render(factory, path):
+    """Return the HTML of a public page as an anonymous visitor sees it."""
+    request = factory.get(path)
+    request.user = AnonymousUser()
+    request.user_profile = None
+    match = resolve(request.path_info)
+    try:
+        response = match.func(request, *match.args, **match.kwargs)
+    except Http404:
+        raise SnapshotError(f"{path} returned 404")
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code != 200:
+        raise SnapshotError(f"{path} returned {response.status_code}")
+    return response.content.decode(response.charset or 'utf-8')
+
+
+def export_event_snapshot(event):
+    """Render every public route of a closed event into static HTML files.
+
+    The snapshot is built in a temporary directory and swapped in at the end,
+    so the front server never serves a half written export. Returns the
+    number of pages written.
+    """
+    if event.event_status != 'closed':
+        raise SnapshotError(f"{event} is not closed")
+
+    factory = _request_factory()
+
+    # (path requested from Django, path the page is stored at)
+    pages = [(reverse(f'registration:{name}', args=[event.id]), None) for name in SNAPSHOT_ROUTES]
+    publication_ids = AbstractSubmission.objects.filter(
+        event_id=event.id, is_published=True
+    ).values_list('id', flat=True)
+    pages += [
+        (reverse('registration:publication_detail', args=[event.id, pub_id]), None)
+        for pub_id in publication_ids
+    ]
+    # Fragments loaded by the rows of the schedule
+    pages += [
+        (reverse('registration:session_detail', args=[event.id, session_id]), None)
+        for session_id in get_schedule_grid(event.id)['sessions']
+    ]
+
+    list_path = reverse('registration:publication_list', args=[event.id])
+    publication_query_paths = {}
+    for publication_type, page, path in _publication_variants(event.id):
+        publication_query_paths[(publication_type, page)] = path
+        if path != list_path:
+            pages.append((f"{list_path}?type={publication_type}&page={page}", path))
+
+    exported = {path for path, _ in pages if '?' not in path}
+
+    root = _snapshot_root()
+    final_dir = _event_dir(root, event.id)
+    build_dir = f"{final_dir}.tmp"
+    shutil.rmtree(build_dir, ignore_errors=True)
+
+    try:
+        for request_path, stored_path in pages:
+            stored_path = stored_path or request_path
+            is_publication_list = stored_path.startswith(list_path)
+            html = _rewrite_links(
+                _render(factory, request_path),
+                exported,
+                publication_query_paths if is_publication_list else None,
+            )
+
+            relative = stored_path.strip('/').split('/')[2:]  # drop "event/<id>"
+            target_dir = os.path.join(build_dir, *relative)
+            os.makedirs(target_dir, exist_ok=True)
+            with open(os.path.join(target_dir, 'index.html'), 'w', encoding='utf-8') as f:
+                f.write(html)
+
+        shutil.rmtree(final_dir, ignore_errors=True)
+        os.replace(build_dir, final_dir)
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+    # update() keeps updated_at and the event caches untouched
+    Event.objects.filter(pk=event.pk).update(snapshot_exported_at=timezone.now())
+    _snapshot_changed(event)
+    return len(pages)
+
+
+def _snapshot_changed(event):
+    # The event's URLs moved, so pages and sitemaps listing it are stale
+    from website.caching import bump_tags
+    bump_event_version(event.pk)
+    bump_tags('registration.Event')
+
+
+def delete_event_snapshot(event):
+    """Remove the exported files of an event and stop pointing to them."""
+    shutil.rmtree(_event_dir(_snapshot_root(), event.id), ignore_errors=True)
+    Event.objects.filter(pk=event.pk).update(snapshot_exported_at=None)
+    _snapshot_changed(event)
+
+
+def snapshot_event_ids():
+    """Return the ids of closed events whose snapshot has been exported."""
+    return set(
+        Event.objects.filter(event_status='closed', snapshot_exported_at__isnull=False)
+        .values_list('id', flat=True)
+    )
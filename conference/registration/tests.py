@@ -1,3 +1,682 @@
-from django.test import TestCase
+import datetime
+import os
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.http import Http404
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from PIL import Image
+
+from .account import get_account_summary
+from .admin import approve_for_poster, deny_participants
+from .bundle import get_bundle_stats, get_event_bundle
+from .event_catalog import get_event_catalog
+from .models import (
+    AbstractSubmission, Chairperson, Department, Event, EventImage, EventVideo, FeatureSpeaker, HallRoom, Panelist, Participant,
+    PaymentStatus, ProgramDay, ProgramSchedule, Sponsor, TimeSlot,
+)
+from .schedule_grid import build_schedule_grid, get_schedule_grid
+from .snapshot import SNAPSHOT_DIR, SnapshotError, export_event_snapshot, snapshot_url
+from .video_utils import parse_youtube_id
+
+TEMP_MEDIA_ROOT = os.path.join(tempfile.gettempdir(), 'conference-test-media')
+
+
+def make_event(**kwargs):
+    fields = {
+        'name': 'Annual Conference',
+        'year': 2024,
+        'start_date': datetime.date(2024, 3, 1),
+        'end_date': datetime.date(2024, 3, 2),
+        'event_status': 'active',
+        'show_publication_tab': True,
+    }
+    fields.update(kwargs)
+    return Event.objects.create(**fields)
+
+
+def make_abstract(event, user, **kwargs):
+    fields = {
+        'title': 'Outcomes of early screening',
+        'authors': 'A. Author',
+        'institution': 'Dhaka Medical College',
+        'introduction': 'Introduction',
+        'methods': 'Methods',
+        'results': 'Results',
+        'conclusion': 'Conclusion',
+    }
+    fields.update(kwargs)
+    return AbstractSubmission.objects.create(event=event, user=user, **fields)
+
+
+def make_participant(event, user, **kwargs):
+    fields = {
+        'name': user.username,
+        'degree': 'MBBS',
+        'year_of_graduation': 2015,
+        'department': Department.objects.get_or_create(event=event, name='Oncology')[0],
+        'organization': 'Dhaka Medical College',
+        'email': user.email,
+        'phone': f'0171{user.pk:07d}',
+    }
+    fields.update(kwargs)
+    return Participant.objects.create(event=event, user=user, **fields)
+
+
+def make_image(name='photo.png', size=(1200, 600)):
+    buffer = BytesIO()
+    Image.new('RGB', size, 'white').save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+def approve_abstracts_for_poster(*abstracts):
+    queryset = AbstractSubmission.objects.filter(pk__in=[abstract.pk for abstract in abstracts])
+    with mock.patch('registration.admin.send_approval_email'):
+        approve_for_poster(None, None, queryset)
+
+
+class CacheTestCase(TestCase):
+    """Starts every test with an empty cache, since it outlives the test database."""
+
+    def setUp(self):
+        cache.clear()
+
+
+class PublicationListTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = make_event()
+        self.user = User.objects.create_user('author', 'author@example.com', 'password')
+        self.url = reverse('registration:publication_list', args=[self.event.id])
+
+    def test_lists_only_published_abstracts(self):
+        make_abstract(self.event, self.user, title='Pending abstract')
+        make_abstract(self.event, self.user, title='Poster abstract', approved_for_poster=True)
+        response = self.client.get(self.url)
+        self.assertContains(response, 'Poster abstract')
+        self.assertNotContains(response, 'Pending abstract')
+
+    def test_unchanged_list_answers_304(self):
+        response = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_bulk_approval_refreshes_the_cached_list(self):
+        abstract = make_abstract(self.event, self.user)
+        response = self.client.get(self.url)
+        self.assertNotContains(response, abstract.title)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            approve_abstracts_for_poster(abstract)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertContains(response, abstract.title)
+
+
+class AccountSummaryTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = make_event(amount=1000)
+        self.user = User.objects.create_user('member', 'member@example.com', 'password')
+        self.participant = make_participant(self.event, self.user)
+
+    def test_summary_is_cached(self):
+        get_account_summary(self.user.id)
+        with self.assertNumQueries(0):
+            get_account_summary(self.user.id)
+
+    def test_payment_save_refreshes_the_summary(self):
+        self.assertEqual(get_account_summary(self.user.id)['payment_data'], [])
+        with self.captureOnCommitCallbacks(execute=True):
+            PaymentStatus.objects.create(
+                participant=self.participant, event=self.event, merchant_invoice_number='INV-1', status='pending',
+            )
+        payments = get_account_summary(self.user.id)['payment_data']
+        self.assertEqual([payment['status'] for payment in payments], ['pending'])
+
+    def test_payment_failure_refreshes_the_summary(self):
+        PaymentStatus.objects.create(
+            participant=self.participant, event=self.event, merchant_invoice_number='INV-1', status='pending',
+        )
+        get_account_summary(self.user.id)
+        self.client.force_login(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(reverse('registration:payment_failure', args=[self.event.id, self.participant.id]))
+        payments = get_account_summary(self.user.id)['payment_data']
+        self.assertEqual([payment['status'] for payment in payments], ['failed'])
+
+    def test_bulk_abstract_approval_refreshes_the_summary(self):
+        abstract = make_abstract(self.event, self.user)
+        get_account_summary(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            approve_abstracts_for_poster(abstract)
+        abstracts = get_account_summary(self.user.id)['abstract_submissions']
+        self.assertTrue(abstracts[0]['approved_for_poster'])
+
+    def test_denying_participants_drops_the_summary(self):
+        get_account_summary(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            deny_participants(None, None, Participant.objects.filter(pk=self.participant.pk))
+        with self.assertNumQueries(2):
+            get_account_summary(self.user.id)
+
+
+class StartupBenchmarkTests(SimpleTestCase):
+    clean = {
+        'setup_ms': 800.0, 'setup_rss_kb': 70000, 'setup_heavy': [], 'during_setup': False,
+        'import_ms': 10.0, 'rss_kb': 100, 'modules': 5, 'heavy': [],
+    }
+
+    def check(self, results):
+        with mock.patch(
+            'registration.management.commands.startup_benchmark.measure', side_effect=lambda module: results[module],
+        ):
+            call_command('startup_benchmark', module=['conference.wsgi'], check=True, stdout=StringIO())
+
+    def test_check_passes_without_heavy_libraries(self):
+        self.check({'conference.wsgi': self.clean, 'conference.urls': self.clean})
+
+    def test_check_fails_on_a_heavy_boot_import(self):
+        with self.assertRaisesMessage(CommandError, 'conference.urls loads pandas'):
+            self.check({'conference.wsgi': self.clean, 'conference.urls': dict(self.clean, heavy=['pandas'])})
+
+    def test_check_fails_when_a_boot_module_does_not_import(self):
+        with self.assertRaisesMessage(CommandError, 'conference.urls'):
+            self.check({'conference.wsgi': self.clean, 'conference.urls': {'error': 'ImportError: no module'}})
+
+    def test_boot_modules_do_not_import_the_dashboard_libraries(self):
+        call_command('startup_benchmark', module=['conference.wsgi'], check=True, stdout=StringIO())
+
+
+class ParticipantListTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = make_event()
+        self.url = reverse('registration:participant_list_partial', args=[self.event.id])
+
+    def add_participant(self, name, approved=True, status='completed'):
+        user = User.objects.create_user(name, f'{name}@example.com', 'password')
+        participant = make_participant(self.event, user, approved=approved)
+        if status:
+            PaymentStatus.objects.create(
+                participant=participant, event=self.event, merchant_invoice_number=f'INV-{name}', status=status,
+            )
+        return participant
+
+    def test_lists_approved_participants_with_completed_payments(self):
+        self.add_participant('listed')
+        self.add_participant('unapproved', approved=False)
+        self.add_participant('unpaid', status='pending')
+        self.add_participant('no_payment', status=None)
+        response = self.client.get(self.url)
+        self.assertEqual([row['name'] for row in response.context['participants']], ['listed'])
+
+    def test_chunks_continue_after_the_last_id(self):
+        for index in range(3):
+            self.add_participant(f'participant{index}')
+        with mock.patch('registration.views.PARTICIPANT_PAGE_SIZE', 2):
+            first = self.client.get(self.url)
+            second = self.client.get(self.url, {'after': first.context['next_after']})
+        self.assertEqual([row['name'] for row in first.context['participants']], ['participant0', 'participant1'])
+        self.assertEqual([row['name'] for row in second.context['participants']], ['participant2'])
+        self.assertIsNone(second.context['next_after'])
+
+    def test_denied_participants_leave_the_list(self):
+        participant = self.add_participant('denied')
+        with self.captureOnCommitCallbacks(execute=True):
+            deny_participants(None, None, Participant.objects.filter(pk=participant.pk))
+        self.assertEqual(list(self.client.get(self.url).context['participants']), [])
+
+
+@override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
+class SnapshotTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(shutil.rmtree, TEMP_MEDIA_ROOT, ignore_errors=True)
+        self.event = make_event(event_status='closed')
+        user = User.objects.create_user('author', 'author@example.com')
+        self.abstract = make_abstract(self.event, user, approved_for_poster=True)
+        day = ProgramDay.objects.create(event=self.event, date=datetime.date(2024, 3, 1))
+        hall = HallRoom.objects.create(event=self.event, name='Hall A', location='Ground floor')
+        slot = TimeSlot.objects.create(
+            event=self.event, program_day=day, hall_room=hall,
+            start_time=datetime.time(9), end_time=datetime.time(10),
+        )
+        schedule = ProgramSchedule.objects.create(event=self.event, abstract_submission=self.abstract)
+        schedule.time_slots.add(slot)
+        self.event_dir = os.path.join(TEMP_MEDIA_ROOT, SNAPSHOT_DIR, 'event', str(self.event.id))
+
+    def read(self, name, *args):
+        path = reverse(f'registration:{name}', args=[self.event.id, *args])
+        with open(os.path.join(TEMP_MEDIA_ROOT, SNAPSHOT_DIR, path.strip('/'), 'index.html'), encoding='utf-8') as f:
+            return f.read()
+
+    def test_exports_the_event_pages(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            export_event_snapshot(self.event)
+        self.assertIn('Outcomes of early screening', self.read('publication_list'))
+        self.assertIn('Outcomes of early screening', self.read('publication_detail', self.abstract.id))
+        self.event.refresh_from_db()
+        self.assertTrue(self.event.has_snapshot)
+        self.assertFalse(os.path.exists(f'{self.event_dir}.tmp'))
+
+    def test_schedule_fragments_are_exported(self):
+        export_event_snapshot(self.event)
+        fragment = reverse('registration:session_detail', args=[self.event.id, self.abstract.id])
+        self.assertIn(f'hx-get="{snapshot_url(fragment)}"', self.read('schedule'))
+        self.assertIn('Outcomes of early screening', self.read('session_detail', self.abstract.id))
+
+    def test_failed_export_removes_the_build_directory(self):
+        with mock.patch('registration.snapshot._render', side_effect=[
+            '<html></html>', SnapshotError('page returned 500'),
+        ]):
+            with self.assertRaises(SnapshotError):
+                export_event_snapshot(self.event)
+        self.assertFalse(os.path.exists(f'{self.event_dir}.tmp'))
+        self.assertFalse(os.path.exists(self.event_dir))
+
+    def test_open_events_are_not_exported(self):
+        self.event.event_status = 'active'
+        with self.assertRaises(SnapshotError):
+            export_event_snapshot(self.event)
+
+
+class EventPageCacheTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = make_event()
+        self.url = reverse('registration:speakers', args=[self.event.id])
+
+    def add_speaker(self, name):
+        with self.captureOnCommitCallbacks(execute=True):
+            return FeatureSpeaker.objects.create(
+                event=self.event, name=name, speciality='Oncology', institution='Dhaka Medical College',
+            )
+
+    def test_anonymous_page_is_served_from_the_cache(self):
+        self.add_speaker('Dr. Rahman')
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertContains(response, 'Dr. Rahman')
+
+    def test_saving_a_row_of_the_event_refreshes_the_page(self):
+        speaker = self.add_speaker('Dr. Rahman')
+        self.client.get(self.url)
+        speaker.name = 'Dr. Karim'
+        with self.captureOnCommitCallbacks(execute=True):
+            speaker.save()
+        self.assertContains(self.client.get(self.url), 'Dr. Karim')
+
+    def test_deleting_a_row_of_the_event_refreshes_the_page(self):
+        speaker = self.add_speaker('Dr. Rahman')
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            speaker.delete()
+        self.assertNotContains(self.client.get(self.url), 'Dr. Rahman')
+
+    def test_other_events_keep_their_cached_pages(self):
+        other = make_event(name='Other Conference')
+        other_url = reverse('registration:speakers', args=[other.id])
+        self.client.get(other_url)
+        self.add_speaker('Dr. Rahman')
+        with self.assertNumQueries(0):
+            self.client.get(other_url)
+
+    def test_logged_in_users_bypass_the_cache(self):
+        self.client.get(self.url)
+        self.client.force_login(User.objects.create_user('member'))
+        with mock.patch('registration.views.get_event_bundle', wraps=get_event_bundle) as bundle:
+            response = self.client.get(self.url)
+        bundle.assert_called_once()
+        self.assertFalse(response.has_header('ETag'))
+
+
+class EventBundleTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = make_event()
+
+    def test_bundle_is_built_once(self):
+        get_event_bundle(self.event.id)
+        with self.assertNumQueries(0):
+            bundle = get_event_bundle(self.event.id)
+        self.assertEqual(bundle['event'], self.event)
+        self.assertEqual(get_bundle_stats()['rebuilds'], 1)
+
+    def test_missing_event_raises_404(self):
+        with self.assertRaises(Http404):
+            get_event_bundle(self.event.id + 1)
+
+    def test_bundled_rows_drop_the_bundle(self):
+        get_event_bundle(self.event.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            speaker = FeatureSpeaker.objects.create(
+                event=self.event, name='Dr. Rahman', speciality='Oncology', institution='Dhaka Medical College',
+            )
+        self.assertEqual(get_event_bundle(self.event.id)['speakers'], [speaker])
+        with self.captureOnCommitCallbacks(execute=True):
+            speaker.delete()
+        self.assertEqual(get_event_bundle(self.event.id)['speakers'], [])
+
+    def test_event_changes_drop_the_bundle(self):
+        get_event_bundle(self.event.id)
+        self.event.location = 'Chattogram'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.save()
+        self.assertEqual(get_event_bundle(self.event.id)['event'].location, 'Chattogram')
+
+    def test_stats_are_staff_only(self):
+        url = reverse('cache_stats')
+        self.client.force_login(User.objects.create_user('member'))
+        self.assertNotEqual(self.client.get(url).status_code, 200)
+        self.client.force_login(User.objects.create_user('staff', is_staff=True))
+        get_event_bundle(self.event.id)
+        get_event_bundle(self.event.id)
+        stats = self.client.get(url).json()['event_bundle']
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+
+@override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
+class SponsorWallTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(shutil.rmtree, TEMP_MEDIA_ROOT, ignore_errors=True)
+        self.event = make_event()
+
+    def add_sponsor(self, name, category, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Sponsor.objects.create(event=self.event, name=name, category=category, **kwargs)
+
+    def test_logo_is_resized_on_upload(self):
+        sponsor = self.add_sponsor('Acme Pharma', Sponsor.TITLE, image=make_image('logo.png', (2000, 500)))
+        with Image.open(sponsor.logo_thumbnail.path) as thumbnail:
+            self.assertEqual((thumbnail.format, thumbnail.size), ('WEBP', (640, 160)))
+
+    def test_unreadable_logo_keeps_the_original(self):
+        upload = SimpleUploadedFile('logo.png', b'not an image', content_type='image/png')
+        sponsor = self.add_sponsor('Acme Pharma', Sponsor.TITLE, image=upload)
+        self.assertFalse(sponsor.logo_thumbnail)
+        self.assertContains(self.client.get(reverse('registration:sponsor_list', args=[self.event.id])), sponsor.image.url)
+
+    def test_unreadable_replacement_drops_the_old_thumbnail(self):
+        sponsor = self.add_sponsor('Acme Pharma', Sponsor.TITLE, image=make_image('logo.png'))
+        self.assertTrue(sponsor.logo_thumbnail)
+        sponsor.image = SimpleUploadedFile('new-logo.png', b'not an image', content_type='image/png')
+        with self.captureOnCommitCallbacks(execute=True):
+            sponsor.save()
+        sponsor.refresh_from_db()
+        self.assertFalse(sponsor.logo_thumbnail)
+        self.assertContains(self.client.get(reverse('registration:sponsor_list', args=[self.event.id])), sponsor.image.url)
+
+    def test_wall_is_grouped_in_tier_order(self):
+        self.add_sponsor('Silver Labs', Sponsor.SILVER)
+        self.add_sponsor('Acme Pharma', Sponsor.TITLE)
+        self.add_sponsor('Uncategorised', None)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('registration:sponsor_list', args=[self.event.id]))
+        sponsor_queries = [query for query in queries if 'registration_sponsor' in query['sql']]
+        self.assertEqual(len(sponsor_queries), 1)
+        grouped = response.context['sponsors_by_category']
+        self.assertEqual(list(grouped)[0], Sponsor.TITLE)
+        self.assertEqual([sponsor.name for sponsor in grouped[Sponsor.TITLE]], ['Acme Pharma'])
+        self.assertEqual([sponsor.name for sponsor in grouped[Sponsor.SILVER]], ['Silver Labs'])
+        self.assertNotContains(response, 'Uncategorised')
+
+
+class ScheduleGridTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = make_event()
+        self.user = User.objects.create_user('author', 'author@example.com')
+        self.day = ProgramDay.objects.create(event=self.event, date=datetime.date(2024, 3, 1))
+        self.hall = HallRoom.objects.create(event=self.event, name='Hall A', location='Ground floor')
+
+    def add_slot(self, hour, hall=None):
+        return TimeSlot.objects.create(
+            event=self.event, program_day=self.day, hall_room=hall or self.hall,
+            start_time=datetime.time(hour), end_time=datetime.time(hour + 1),
+        )
+
+    def add_session(self, title, *slots, **kwargs):
+        schedule = ProgramSchedule.objects.create(
+            event=self.event, abstract_submission=make_abstract(self.event, self.user, title=title), **kwargs,
+        )
+        schedule.time_slots.add(*slots)
+        return schedule
+
+    def test_grid_is_built_in_a_fixed_number_of_queries(self):
+        chairperson = Chairperson.objects.create(
+            event=self.event, name='Prof. Chair', email='chair@example.com', phone='01800000000',
+        )
+        for hour in range(9, 12):
+            schedule = self.add_session(f'Session {hour}', self.add_slot(hour), chairperson=chairperson)
+            schedule.panelist.add(Panelist.objects.create(
+                event=self.event, name=f'Panelist {hour}', email=f'panelist{hour}@example.com', phone=f'0171{hour:07d}',
+            ))
+        with self.assertNumQueries(4):
+            grid = build_schedule_grid(self.event.id)
+        self.assertEqual([row['session']['title'] for row in grid['rows']], ['Session 9', 'Session 10', 'Session 11'])
+        self.assertEqual(grid['rows'][0]['session']['chairperson'], 'Prof. Chair')
+        self.assertEqual(grid['rows'][0]['session']['panelists'], ['Panelist 9'])
+
+    def test_rows_are_ordered_by_time_then_hall(self):
+        hall_b = HallRoom.objects.create(event=self.event, name='Hall B', location='First floor')
+        self.add_session('Late', self.add_slot(14))
+        self.add_session('Hall B', self.add_slot(9, hall_b))
+        self.add_session('Hall A', self.add_slot(9))
+        rows = build_schedule_grid(self.event.id)['rows']
+        self.assertEqual([row['session']['title'] for row in rows], ['Hall A', 'Hall B', 'Late'])
+
+    def test_slot_links_drop_the_cached_grid(self):
+        schedule = self.add_session('Opening', self.add_slot(9))
+        second_slot = self.add_slot(10)
+        self.assertEqual(len(get_schedule_grid(self.event.id)['rows']), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            schedule.time_slots.add(second_slot)
+        self.assertEqual(len(get_schedule_grid(self.event.id)['rows']), 2)
+
+    def test_session_detail_falls_back_to_unscheduled_abstracts(self):
+        scheduled = self.add_session('Opening', self.add_slot(9)).abstract_submission
+        unscheduled = make_abstract(self.event, self.user, title='Unscheduled')
+        for abstract in (scheduled, unscheduled):
+            response = self.client.get(reverse('registration:session_detail', args=[self.event.id, abstract.id]))
+            self.assertContains(response, abstract.title)
+        response = self.client.get(reverse('registration:session_detail', args=[self.event.id, unscheduled.id + 1]))
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
+class EventGalleryTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(shutil.rmtree, TEMP_MEDIA_ROOT, ignore_errors=True)
+        self.event = make_event()
+
+    def add_image(self, caption='Opening ceremony', size=(1200, 600)):
+        with self.captureOnCommitCallbacks(execute=True):
+            return EventImage.objects.create(event=self.event, image=make_image(size=size), caption=caption)
+
+    def test_upload_stores_the_size_and_a_thumbnail(self):
+        image = self.add_image(size=(1600, 400))
+        self.assertEqual((image.width, image.height), (1600, 400))
+        with Image.open(image.thumbnail.path) as thumbnail:
+            self.assertEqual(thumbnail.size, (800, 200))
+
+    def test_missing_files_do_not_break_the_gallery(self):
+        image = self.add_image()
+        os.remove(image.image.path)
+        image = EventImage.objects.get(pk=image.pk)
+        image.caption = 'Renamed'
+        image.save()
+        self.assertEqual((image.width, image.height), (1200, 600))
+        response = self.client.get(reverse('registration:event_gallery', args=[self.event.id]))
+        self.assertContains(response, 'width="1200" height="600"')
+
+    def test_unreadable_replacement_drops_the_old_thumbnail(self):
+        image = self.add_image()
+        image.image = SimpleUploadedFile('new.png', b'not an image', content_type='image/png')
+        with self.captureOnCommitCallbacks(execute=True):
+            image.save()
+        image.refresh_from_db()
+        self.assertFalse(image.thumbnail)
+        self.assertEqual((image.width, image.height), (None, None))
+        response = self.client.get(reverse('registration:event_gallery', args=[self.event.id]))
+        self.assertContains(response, f'src="{image.image.url}"')
+
+    @mock.patch('registration.views.GALLERY_PAGE_SIZE', 2)
+    def test_images_are_paged_over_htmx(self):
+        for index in range(3):
+            self.add_image(caption=f'Image {index}')
+        response = self.client.get(reverse('registration:event_gallery', args=[self.event.id]))
+        self.assertEqual([image.caption for image in response.context['images']], ['Image 0', 'Image 1'])
+        self.assertContains(response, reverse('registration:event_gallery_images', args=[self.event.id]) + '?page=2')
+        response = self.client.get(reverse('registration:event_gallery_images', args=[self.event.id]), {'page': 2})
+        self.assertEqual([image.caption for image in response.context['images']], ['Image 2'])
+        self.assertIsNone(response.context['next_page'])
+
+    def test_backfill_reads_sizes_and_skips_unreadable_files(self):
+        readable, missing = self.add_image(), self.add_image()
+        EventImage.objects.update(width=None, height=None, thumbnail='')
+        os.remove(missing.image.path)
+        out = StringIO()
+        call_command('generate_gallery_thumbnails', stdout=out)
+        readable.refresh_from_db()
+        self.assertEqual((readable.width, readable.height), (1200, 600))
+        self.assertTrue(readable.thumbnail)
+        self.assertIn(f'Could not read {missing.image.name}', out.getvalue())
+        self.assertIn('Processed 1 gallery image(s)', out.getvalue())
+
+
+class ConditionalEventPageTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = make_event()
+        self.url = reverse('registration:about', args=[self.event.id])
+
+    def test_unchanged_page_answers_304_without_queries(self):
+        response = self.client.get(self.url)
+        self.assertTrue(response.has_header('Last-Modified'))
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_if_modified_since_answers_304(self):
+        response = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_changes_to_the_event_answer_200(self):
+        etag = self.client.get(self.url)['ETag']
+        self.event.location = 'Chattogram'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_logged_in_users_get_no_validators(self):
+        etag = self.client.get(self.url)['ETag']
+        self.client.force_login(User.objects.create_user('member'))
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
+
+
+class YoutubeIdTests(SimpleTestCase):
+    def test_parses_every_link_format(self):
+        links = [
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ&t=42',
+            'https://youtu.be/dQw4w9WgXcQ?si=abc',
+            'https://www.youtube.com/embed/dQw4w9WgXcQ',
+            'https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ',
+            'https://youtube.com/shorts/dQw4w9WgXcQ',
+            'https://www.youtube.com/live/dQw4w9WgXcQ',
+            'https://www.youtube.com/v/dQw4w9WgXcQ',
+            ' dQw4w9WgXcQ ',
+        ]
+        for link in links:
+            with self.subTest(link=link):
+                self.assertEqual(parse_youtube_id(link), 'dQw4w9WgXcQ')
+
+    def test_other_links_have_no_id(self):
+        for link in ('', None, 'https://vimeo.com/123456', 'https://www.youtube.com/channel/UC123'):
+            with self.subTest(link=link):
+                self.assertEqual(parse_youtube_id(link), '')
+
+
+class EventVideoTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = make_event()
+
+    def add_video(self, youtube_url):
+        with self.captureOnCommitCallbacks(execute=True):
+            return EventVideo.objects.create(event=self.event, youtube_url=youtube_url, caption='Keynote')
+
+    def test_video_id_is_stored_on_save(self):
+        video = self.add_video('https://youtu.be/dQw4w9WgXcQ')
+        self.assertEqual(video.video_id, 'dQw4w9WgXcQ')
+        video.youtube_url = 'https://vimeo.com/123456'
+        video.save()
+        self.assertEqual((video.video_id, video.embed_url), ('', ''))
+
+    def test_gallery_renders_a_facade_instead_of_the_player(self):
+        self.add_video('https://youtu.be/dQw4w9WgXcQ')
+        self.add_video('https://vimeo.com/123456')
+        response = self.client.get(reverse('registration:event_gallery', args=[self.event.id]))
+        self.assertContains(response, 'data-embed="https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ"')
+        self.assertContains(response, 'https://i.ytimg.com/vi/dQw4w9WgXcQ/mqdefault.jpg')
+        self.assertContains(response, 'href="https://vimeo.com/123456"')
+        self.assertNotContains(response, '<iframe')
+
+
+class EventCatalogTests(CacheTestCase):
+    def add_event(self, name, status, start):
+        with self.captureOnCommitCallbacks(execute=True):
+            return make_event(name=name, event_status=status, start_date=start, end_date=start + datetime.timedelta(days=1))
+
+    def names(self, cards):
+        return [card['name'] for card in cards]
+
+    def test_events_are_grouped_by_status(self):
+        self.add_event('Spring', 'active', datetime.date(2024, 3, 1))
+        self.add_event('Autumn', 'active', datetime.date(2024, 9, 1))
+        self.add_event('Next year', 'upcoming', datetime.date(2025, 3, 1))
+        self.add_event('Old', 'closed', datetime.date(2022, 3, 1))
+        self.add_event('Last year', 'closed', datetime.date(2023, 3, 1))
+        catalog = get_event_catalog()
+        self.assertEqual(self.names(catalog['active_events']), ['Autumn', 'Spring'])
+        self.assertEqual(self.names(catalog['upcoming_events']), ['Next year'])
+        self.assertEqual(self.names(catalog['closed_events']), ['Last year', 'Old'])
+        self.assertEqual(catalog['upcoming_events'][0]['title'], 'Next year 2024')
+
+    def test_catalog_is_cached_until_an_event_changes(self):
+        event = self.add_event('Spring', 'upcoming', datetime.date(2024, 3, 1))
+        get_event_catalog()
+        with self.assertNumQueries(0):
+            get_event_catalog()
+        event.event_status = 'active'
+        with self.captureOnCommitCallbacks(execute=True):
+            event.save()
+        self.assertEqual(self.names(get_event_catalog()['active_events']), ['Spring'])
+        with self.captureOnCommitCallbacks(execute=True):
+            event.delete()
+        self.assertEqual(self.names(get_event_catalog()['active_events']), [])
+
+    def test_index_lists_the_catalog(self):
+        self.add_event('Spring', 'active', datetime.date(2024, 3, 1))
+        get_event_catalog()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('index'))
+        self.assertContains(response, 'Spring')
+        self.assertFalse(any('registration_event' in query['sql'] for query in queries))
@@ -22,6 +22,7 @@ from .views import (
     publication_list,
     publication_detail,
     event_gallery,
+    event_gallery_images,
     payment,
     finalize_payment,
     payment_success,
@@ -59,6 +60,7 @@ urlpatterns = [
     path('<int:event_id>/publication/<int:pub_id>/', views.publication_detail, name='publication_detail'),
     # Event Gallery url
     path('<int:event_id>/gallery/', views.event_gallery, name='event_gallery'),
+    path('<int:event_id>/gallery/images/', views.event_gallery_images, name='event_gallery_images'),
     # Bkash Payment url
     path('<int:event_id>/payment/<int:participant_id>/', views.payment, name='payment'), 
     path('<int:event_id>/finalize-payment/<int:participant_id>/', finalize_payment, name='finalize_payment'),
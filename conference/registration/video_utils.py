@@ -0,0 +1,29 @@
+# registration/video_utils.py
+
+import re
+
+# Watch, short, embed, shorts, live and legacy /v/ links, or a bare video ID
+YOUTUBE_ID_RE = re.compile(
+    r'(?:youtu\.be/|youtube(?:-nocookie)?\.com/(?:watch\?(?:\S*?&)?v=|embed/|v/|shorts/|live/))([A-Za-z0-9_-]{11})'
+    r'|^([A-Za-z0-9_-]{11})$'
+)
+
+
+def parse_youtube_id(url):
+    """Return the 11 character YouTube video ID of a link, or '' if it has none."""
+    if not url:
+        return ''
+    match = YOUTUBE_ID_RE.search(url.strip())
+    if match is None:
+        return ''
+    return match.group(1) or match.group(2)
+
+
+def youtube_thumbnail_url(video_id, quality='mqdefault'):
+    """Return the URL of a static thumbnail of a video (mqdefault is 320x180)."""
+    return f'https://i.ytimg.com/vi/{video_id}/{quality}.jpg'
+
+
+def youtube_embed_url(video_id):
+    """Return the privacy-enhanced player URL of a video."""
+    return f'https://www.youtube-nocookie.com/embed/{video_id}'
@@ -8,8 +8,11 @@ from .forms import RegistrationForm, AbstractSubmissionForm, UserProfileForm
 from .models import *
 from django.contrib.auth import login, logout
 from django.contrib.auth.forms import AuthenticationForm
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 
 # User Profile View STARTS ---------------------------------------------------------------###
 def create_profile(request):
@@ -27,32 +30,16 @@ def create_profile(request):
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render, get_object_or_404
 from .models import UserProfile, AbstractSubmission, ProgramSchedule, Event
+from django.http import Http404
+from .account import get_account_summary, invalidate_account_summary
+from .profile import get_user_profile
 
 @login_required
 def user_profile(request):
     # Fetch the user's profile
-    user_profile = get_object_or_404(UserProfile, user=request.user)
-
-    # Fetch related submissions and schedules
-    abstract_submissions = AbstractSubmission.objects.filter(user=request.user)
-    program_schedules = ProgramSchedule.objects.filter(abstract_submission__in=abstract_submissions)
-
-    # Fetch active, upcoming, and closed events
-    active_events = Event.objects.filter(event_status='active').order_by('-start_date')
-    upcoming_events = Event.objects.filter(event_status='upcoming').order_by('start_date')
-    closed_events = Event.objects.filter(event_status='closed').order_by('-end_date')
-
-    # Fetch payment Status for the user's in registered events
-    payment_statuses = PaymentStatus.objects.filter(participant__user=request.user).select_related('event', 'participant')
-    payment_data = []
-    for payment in payment_statuses:
-        payment_data.append({
-            'event': f"{payment.event.name} {payment.event.year}",  # Assuming the event name and year are stored in the Event modelpayment.event.name,
-            'trxID': payment.trxID,
-            'amount': payment.event.amount,  # Assuming the event amount is stored in the Event model
-            'status': payment.status,
-            'updated_at': payment.updated_at,  # Assuming there's an updated_at field in PaymentStatus
-        })
+    user_profile = get_user_profile(request)
+    if user_profile is None:
+        raise Http404("No UserProfile matches the given query.")
 
     if request.method == 'POST':
         user_profile.name = request.POST.get('name')
@@ -63,16 +50,14 @@ def user_profile(request):
     else:
         message = ""
 
+    # Events, payments, abstracts and their schedule slots, cached per user
+    summary = get_account_summary(request.user.id)
+
     return render(request, 'user_profile.html', {
         'user': request.user,
         'user_profile': user_profile,
-        'abstract_submissions': abstract_submissions,
-        'program_schedules': program_schedules,
         'message': message,
-        'active_events': active_events,
-        'upcoming_events': upcoming_events,
-        'closed_events': closed_events,
-        'payment_data': payment_data,
+        **summary,
     })
 
 # Custom Password Change View STARTS ---------------------------------------------------------------###
@@ -101,23 +86,14 @@ class CustomPasswordResetView(PasswordResetView):
 from django.shortcuts import render
 from .models import Event, UserProfile
 
-def index(request):
-    user_profile = None
-    if request.user.is_authenticated:
-        try:
-            user_profile = UserProfile.objects.get(user=request.user)
-        except UserProfile.DoesNotExist:
-            pass  # UserProfile does not exist; continue without redirecting
+from .event_catalog import get_event_catalog
 
-    active_events = Event.objects.filter(event_status='active').order_by('-start_date')
-    upcoming_events = Event.objects.filter(event_status='upcoming').order_by('start_date')
-    closed_events = Event.objects.filter(event_status='closed').order_by('-end_date')
+def index(request):
+    user_profile = get_user_profile(request)
 
     context = {
         'user_profile': user_profile,
-        'active_events': active_events,
-        'upcoming_events': upcoming_events,
-        'closed_events': closed_events,
+        **get_event_catalog(),
     }
     return render(request, 'index.html', context)
 
@@ -152,27 +128,23 @@ def user_logout(request):
 # Home View ---------------------------------------------------------------###
 from django.shortcuts import get_object_or_404
 from .models import FeatureSpeaker, AboutTheConference, Invitation, Event
+from .bundle import get_event_bundle
+from .caching import cache_event_page, conditional_event_page
 
+@conditional_event_page
+@cache_event_page
 def home(request, event_id):
     # print(event_id)
-    user_profile = None
-    if request.user.is_authenticated:
-        try:
-            user_profile = UserProfile.objects.get(user=request.user)
-        except UserProfile.DoesNotExist:
-            user_profile = None  # Handle case where UserProfile doesn't exist
-    event = get_object_or_404(Event, id=event_id)
-    speakers = FeatureSpeaker.objects.filter(event=event)
-    about_conference = AboutTheConference.objects.filter(event=event).first()  # Assuming you have one instance per event
-    invitations = Invitation.objects.filter(event=event)
+    user_profile = get_user_profile(request)
+    bundle = get_event_bundle(event_id)
     modal_image_path = 'images/BBCC_2024_Poster_Final.jpg'
 
     context = {
         'user_profile': user_profile,
-        'event': event,
-        'speakers': speakers,
-        'about_conference': about_conference,
-        'invitations': invitations,
+        'event': bundle['event'],
+        'speakers': bundle['speakers'],
+        'about_conference': bundle['about_conference'],
+        'invitations': bundle['invitations'],
         'modal_image': modal_image_path,
     }
 
@@ -189,40 +161,66 @@ from django.http import JsonResponse
 
 # Participant List View ---------------------------------------------------------------###
 from django.shortcuts import get_object_or_404
-from .models import Participant, Event
+from django.db.models import Exists, OuterRef
+from .models import Participant, Event, PaymentStatus
+
+# Rows per chunk of the infinitely scrolled participant list
+PARTICIPANT_PAGE_SIZE = 50
 
+@conditional_event_page
 def participant_list(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
-    approved_paid_participants = Participant.objects.filter(event=event, approved=True, payment_statuses__status='completed')
-    
     if request.headers.get('HX-Request'):
-        return render(request, 'partials/participant_list.html', {'participants': approved_paid_participants})
-    
-    return render(request, 'participant_list.html', {'participants': approved_paid_participants, 'event': event})
-def participant_list_partial(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
+        return participant_list_partial(request, event_id)
 
-    # Filter participants with approved=True and payment status='completed'
-    approved_paid_participants = Participant.objects.filter(
-        event=event, approved=True, payment_statuses__status='completed'
-    )
+    # The page shell carries no rows; the partial streams them in chunks
+    bundle = get_event_bundle(event_id)
+    return render(request, 'participant_list.html', {'event': bundle['event']})
 
-    return render(request, 'partials/participant_list.html', {'participants': approved_paid_participants})
+def participant_list_partial(request, event_id):
+    # Keyset pagination on the primary key: each chunk starts after the last
+    # id of the previous one, so its cost does not grow with the page number
+    try:
+        after = int(request.GET.get('after', 0))
+    except ValueError:
+        after = 0
+
+    # Filter participants with approved=True and a payment status='completed'.
+    # EXISTS rather than a join, so a participant is listed once however many
+    # payment rows match
+    completed_payment = PaymentStatus.objects.filter(participant=OuterRef('pk'), status='completed')
+    rows = list(
+        Participant.objects.filter(
+            Exists(completed_payment), event_id=event_id, approved=True, id__gt=after
+        ).order_by('id').values(
+            'id', 'name', 'degree', 'department__name', 'organization', 'country'
+        )[:PARTICIPANT_PAGE_SIZE + 1]
+    )
+    has_more = len(rows) > PARTICIPANT_PAGE_SIZE
+    participants = rows[:PARTICIPANT_PAGE_SIZE]
+
+    return render(request, 'partials/participant_list.html', {
+        'event_id': event_id,
+        'participants': participants,
+        'is_first_page': after == 0,
+        'next_after': participants[-1]['id'] if has_more else None,
+    })
 
 
 
 # About The Conference View ---------------------------------------------------------------###
+@conditional_event_page
+@cache_event_page
 def about(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
-    about_conference = AboutTheConference.objects.filter(event=event).first()
-    return render(request, 'about.html', {'about_conference': about_conference, 'event': event})
+    bundle = get_event_bundle(event_id)
+    return render(request, 'about.html', {'about_conference': bundle['about_conference'], 'event': bundle['event']})
 # About The Conference View Ends ---------------------------------------------------------------### 
 
 # Speakers View ---------------------------------------------------------------###
+@conditional_event_page
+@cache_event_page
 def speakers(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
-    speakers = FeatureSpeaker.objects.filter(event=event)
-    return render(request, 'speakers.html', {'speakers': speakers, 'event': event})
+    bundle = get_event_bundle(event_id)
+    return render(request, 'speakers.html', {'speakers': bundle['speakers'], 'event': bundle['event']})
 # Speakers View Ends ---------------------------------------------------------------###
 
 # Registration view Starts --------------------------------------------------######
@@ -262,7 +260,9 @@ def registration(request, event_id):
             'event': event
         })
 
-    user_profile = UserProfile.objects.get(user=request.user)
+    user_profile = get_user_profile(request)
+    if user_profile is None:
+        return redirect('create_profile')
 
     # Check if the user has already registered for the event
     try:
@@ -316,7 +316,7 @@ def registration(request, event_id):
                 messages.success(request, 'Registration form submitted successfully!')
                 return redirect('registration:registration_submitted', event_id=event.id)  # type: ignore[attr-defined]
             except IntegrityError as e:
-                print(f"IntegrityError: {e}")  # Debugging line
+                logger.warning("Registration rejected as a duplicate: %s", e)
                 messages.error(request, 'A participant with this email or phone number already exists for this event.')
         else:
             messages.error(request, 'There are errors in your form. Registration failed. Please check the form.')
@@ -329,7 +329,6 @@ from django.shortcuts import render, get_object_or_404
 
 def registration_submitted(request, event_id):
     event = get_object_or_404(Event, id=event_id)
-    print(f"Event ID: {event.id}")  # type: ignore[attr-defined]  # Log to console to check
     return render(request, 'registration_submitted.html', {'event': event})
 
 def registration_message(request, event_id):
@@ -369,8 +368,8 @@ def send_approval_email(participant, event):
         email = EmailMultiAlternatives(subject, text_content, from_email, recipient_list)
         email.attach_alternative(html_content, "text/html")
         email.send()
-    except Exception as e:
-        print(f"Error sending approval email: {e}")
+    except Exception:
+        logger.exception("Error sending approval email to participant %s", participant.id)
 
 
 from django.core.mail import EmailMultiAlternatives
@@ -397,8 +396,8 @@ def send_payment_link_email(participant, event):
         email = EmailMultiAlternatives(subject, text_content, from_email, recipient_list)
         email.attach_alternative(html_content, "text/html")
         email.send()
-    except Exception as e:
-        print(f"Error sending payment link email: {e}")
+    except Exception:
+        logger.exception("Error sending payment link email to participant %s", participant.id)
 
 # #### Registration process, registration mail Ends ----------------------------------###
 
@@ -535,35 +534,37 @@ def send_abstract_submission_email(participant):
 # ### Abstract Submission process, abstract submission mail Ends ----------------------------------###
 
 # Invitation View
+@conditional_event_page
+@cache_event_page
 def invitation(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
-    invitations = Invitation.objects.filter(event=event)
-    return render(request, 'invitation.html', {'invitations': invitations, 'event': event})
+    bundle = get_event_bundle(event_id)
+    return render(request, 'invitation.html', {'invitations': bundle['invitations'], 'event': bundle['event']})
 
 
 from django.shortcuts import render, get_object_or_404
 from .models import ProgramSchedulePdf, Event
+from .schedule_grid import get_schedule_grid
+@conditional_event_page
 def schedule(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
-    program_schedules = ProgramSchedule.objects.filter(event=event)\
-        .select_related('abstract_submission')\
-        .prefetch_related('time_slots')\
-        .order_by('time_slots__program_day', 'time_slots__start_time')
-    
-    # Fetch the uploaded PDF from the ProgramSchedulePdf model
-    program_schedule_pdf = ProgramSchedulePdf.objects.filter(event=event).first()
-    
+    bundle = get_event_bundle(event_id)
+    schedule_grid = get_schedule_grid(event_id)
+
     return render(request, 'schedule.html', {
-        'program_schedules': program_schedules,
-        'event': event,
-        'program_schedule_pdf': program_schedule_pdf,  # Pass the PDF object to the template
+        'schedule_rows': schedule_grid['rows'],
+        'schedule_days': schedule_grid['days'],
+        'event': bundle['event'],
+        'program_schedule_pdf': bundle['program_schedule_pdf'],  # Pass the PDF object to the template
     })
 
 
+@conditional_event_page
 def session_detail(request, event_id, pk):
-    event = get_object_or_404(Event, id=event_id)
-    session = get_object_or_404(AbstractSubmission, event=event, pk=pk)
-    return render(request, 'partials/session_detail.html', {'session': session, 'event': event})
+    bundle = get_event_bundle(event_id)
+    session = get_schedule_grid(event_id)['sessions'].get(pk)
+    if session is None:
+        # Not on the schedule (yet); fall back to the submission itself
+        session = get_object_or_404(AbstractSubmission, event_id=event_id, pk=pk)
+    return render(request, 'partials/session_detail.html', {'session': session, 'event': bundle['event']})
 
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
@@ -586,21 +587,47 @@ def download_schedule_pdf(request, event_id):
 
 
 # Sponsors View START------------------------------------------------------------------------------#
+@conditional_event_page
 def sponsor_list(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
-    categories = ['Title', 'Platinum', 'Golden', 'Silver', 'Logistics', 'Media', 'IT', 'Event']
-    sponsors_by_category = {category: Sponsor.objects.filter(event=event, category=category) for category in categories}
-    return render(request, 'sponsor_list.html', {'sponsors_by_category': sponsors_by_category, 'event': event})
+    bundle = get_event_bundle(event_id)
+    return render(request, 'sponsor_list.html', {'sponsors_by_category': bundle['sponsors_by_category'], 'event': bundle['event']})
 
 # Sponsors View END--------------------------------------------------------------------------------#
 
 # Publication View START------------------------------------------------------------------------------#
+from django.core.paginator import Paginator
+
+PUBLICATION_PAGE_SIZE = 24
+PUBLICATION_TYPES = {
+    'presentation': {'approved_for_presentation': True},
+    'poster': {'approved_for_poster': True},
+}
+
+@conditional_event_page
+@cache_event_page
 def publication_list(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
-    publications = AbstractSubmission.objects.filter(event=event, approved_for_presentation=True) | AbstractSubmission.objects.filter(event=event, approved_for_poster=True)
-    notebook = UploadNoteBook.objects.filter(event=event).first()
-    return render(request, 'publication_list.html', {'event': event, 'publications': publications, 'notebook': notebook})
+    bundle = get_event_bundle(event_id)
+    event = bundle['event']
+    publication_type = request.GET.get('type', '')
+
+    # Served by the (event, is_published, title) index; the long abstract
+    # sections are only needed on the detail page
+    publications = AbstractSubmission.objects.filter(
+        event_id=event_id, is_published=True, **PUBLICATION_TYPES.get(publication_type, {})
+    ).only(
+        'id', 'event_id', 'title', 'authors', 'institution', 'image', 'presentation_file'
+    ).order_by('-approved_for_presentation', 'title', 'id')
+
+    page_obj = Paginator(publications, PUBLICATION_PAGE_SIZE).get_page(request.GET.get('page'))
+    return render(request, 'publication_list.html', {
+        'event': event,
+        'publications': page_obj,
+        'page_obj': page_obj,
+        'publication_type': publication_type if publication_type in PUBLICATION_TYPES else '',
+        'notebook': bundle['notebook'],
+    })
 
+@conditional_event_page
 def publication_detail(request, event_id, pub_id):
     event = get_object_or_404(Event, id=event_id)
     publication = get_object_or_404(AbstractSubmission, event=event, id=pub_id)
@@ -612,11 +639,29 @@ def publication_detail(request, event_id, pub_id):
 from django.shortcuts import render, get_object_or_404
 from .models import Event, EventImage, EventVideo
 
+GALLERY_PAGE_SIZE = 24
+
+def _gallery_page(images, page):
+    start = (page - 1) * GALLERY_PAGE_SIZE
+    next_page = page + 1 if len(images) > start + GALLERY_PAGE_SIZE else None
+    return images[start:start + GALLERY_PAGE_SIZE], next_page
+
+@conditional_event_page
+@cache_event_page
 def event_gallery(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
-    images = EventImage.objects.filter(event=event)
-    videos = EventVideo.objects.filter(event=event)
-    return render(request, 'event_gallery.html', {'event': event, 'images': images, 'videos': videos})
+    bundle = get_event_bundle(event_id)
+    images, next_page = _gallery_page(bundle['images'], 1)
+    return render(request, 'event_gallery.html', {'event': bundle['event'], 'images': images, 'next_page': next_page, 'videos': bundle['videos']})
+
+def event_gallery_images(request, event_id):
+    """HTMX endpoint returning the next page of gallery images."""
+    bundle = get_event_bundle(event_id)
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+    except ValueError:
+        page = 1
+    images, next_page = _gallery_page(bundle['images'], page)
+    return render(request, 'partials/gallery_images.html', {'event': bundle['event'], 'images': images, 'next_page': next_page})
 
 # Event Gallery View END--------------------------------------------------------------------------------#
 
@@ -655,7 +700,7 @@ from django.core.cache import cache
 def get_bkash_token():
     cached_token = cache.get('bkash_token')  # Check if token exists in cache
     if cached_token:
-        print("Using cached token...")
+        logger.debug("Using cached bKash token")
         return cached_token
 
     url = f"{BKASH_PRODUCTION_URL}/tokenized/checkout/token/grant"
@@ -670,20 +715,20 @@ def get_bkash_token():
     }
 
     try:
-        print("Requesting new token...")
+        logger.info("Requesting new bKash token")
         response = requests.post(url, json=payload, headers=headers, timeout=30) # 30 sec timeout
         response.raise_for_status()
         token = response.json().get("id_token")
 
         # Cache the token for 59 minutes (less than its actual expiry time of 60 minutes)
         cache.set('bkash_token', token, timeout=59 * 60)
-        print("Token retrieved and cached successfully:", token)
+        logger.info("bKash token retrieved and cached")
         return token
     except requests.exceptions.Timeout:
-        print("Token Request timed out.")
+        logger.error("bKash token request timed out")
         return None
     except requests.exceptions.RequestException as e:
-        print(f"Failed to get token: {e}")
+        logger.error("Failed to get bKash token: %s", e)
         return None
 
 # Step 2: Create Payment
@@ -705,17 +750,17 @@ def create_bkash_payment(token, amount, payer_reference, callback_url, merchant_
     }
 
     try:
-        print("Creating payment...")
+        logger.info("Creating bKash payment", extra={'merchant_invoice_number': merchant_invoice_number})
         response = requests.post(url, json=payload, headers=headers, timeout=30) # 30 sec timeout
         response.raise_for_status()  # Raises an exception for HTTP errors (4xx, 5xx)
         return response.json()
 
     except requests.exceptions.Timeout:
-        print("Payment creation timed out.")
+        logger.error("bKash payment creation timed out", extra={'merchant_invoice_number': merchant_invoice_number})
         return {"statusCode": "408", "statusMessage": "Payment creation request timed out."}
 
     except requests.exceptions.RequestException as e:
-        print(f"Error in creating payment: {e}")
+        logger.error("Error in creating bKash payment: %s", e, extra={'merchant_invoice_number': merchant_invoice_number})
         return None
 
 # Step 3: Execute Payment
@@ -729,19 +774,17 @@ def execute_payment(token, payment_id):
         "X-APP-Key": BKASH_APP_KEY # Add the required APP Key here
     }
     try:
-        print(f"Executing payment for Payment ID: {payment_id}")
+        logger.info("Executing bKash payment", extra={'payment_id': payment_id})
         response = requests.post(url, json=payload, headers=headers, timeout=30) # 30 sec timeout
         response.raise_for_status()
         return response.json()
         
     except requests.exceptions.Timeout:
-        print("Payment execution timed out.")
+        logger.error("bKash payment execution timed out", extra={'payment_id': payment_id})
         return {"statusCode": "408", "statusMessage": "Payment execution request timed out."}
     
     except requests.exceptions.RequestException as e:
-        print(f"Error in payment execution: {e}")
-        if e.response:
-            print(f"Error in executing payment: {e}")
+        logger.error("Error in executing bKash payment: %s", e, extra={'payment_id': payment_id})
         return None
 
 # Step 4: Query Payment  
@@ -758,25 +801,25 @@ def payment_query(token, payment_id):
     }
 
     try:
-        print(f"Querying payment status for Payment ID: {payment_id}")
+        logger.info("Querying bKash payment status", extra={'payment_id': payment_id})
         response = requests.post(url, json=payload, headers=headers, timeout=30) # 30 sec timeout
         response.raise_for_status()  # Raise an error for HTTP codes >= 400
         
-        # Debugging response
-        print(f"Payment query successful: {response.status_code}")
-        print(f"Response content: {response.json()}")
-        return response.json()
+        result = response.json()
+        logger.info(
+            "bKash payment query returned %s", result.get('transactionStatus'),
+            extra={'payment_id': payment_id, 'status_code': result.get('statusCode')},
+        )
+        return result
         
     except requests.exceptions.Timeout:
-        print(f"Payment query timed out for Payment ID: {payment_id}")
+        logger.error("bKash payment query timed out", extra={'payment_id': payment_id})
     
     except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP error occurred: {http_err}")
-        if http_err.response:
-            print(f"HTTP response error: {http_err.response.json()}")
+        logger.error("HTTP error in bKash payment query: %s", http_err, extra={'payment_id': payment_id})
         return None
     except requests.exceptions.RequestException as req_err:
-        print(f"Request error occurred: {req_err}")
+        logger.error("Error in bKash payment query: %s", req_err, extra={'payment_id': payment_id})
         return None
 
 # Step 5: Payment View
@@ -802,7 +845,7 @@ def payment(request, event_id, participant_id):
 
             # Step 2: Create payment
             amount = event.amount
-            payer_reference = str(getattr(request.user.userprofile, 'phone', None))
+            payer_reference = str(getattr(get_user_profile(request), 'phone', None))
             if not payer_reference:
                 messages.error(request, "Phone number not found.")
                 return redirect('index')
@@ -813,7 +856,7 @@ def payment(request, event_id, participant_id):
             ) + f"?merchant_invoice_number={merchant_invoice_number}"
             payment_response = create_bkash_payment(token, amount, payer_reference, callback_url, merchant_invoice_number)
             
-            print(f"Merchant Invoice Number sent to bkash: {merchant_invoice_number}")
+            logger.info("bKash payment requested", extra={'merchant_invoice_number': merchant_invoice_number, 'status_code': (payment_response or {}).get('statusCode')})
             
             if payment_response and payment_response.get("statusCode") == "0000":  # type: ignore[union-attr]
                 # Redirect to bKash payment page
@@ -822,8 +865,8 @@ def payment(request, event_id, participant_id):
                 messages.error(request, f"Payment failed: {payment_response.get('statusMessage')}")  # type: ignore[union-attr]
                 return redirect('index')
 
-        except Exception as e:
-            print(f"Error: {e}")
+        except Exception:
+            logger.exception("Error in starting bKash payment for participant %s", participant_id)
             messages.error(request, "An error occurred.")
             return redirect('index')
 
@@ -854,7 +897,7 @@ def payment_success(request, event_id, participant_id):
             'merchant_invoice_number': merchant_invoice_number  # Check if this is being set correctly
         }
     )
-    print(f"Generated Merchant Invoice Number: {merchant_invoice_number}")
+    logger.info("bKash payment pending", extra={'payment_id': payment_id, 'merchant_invoice_number': merchant_invoice_number})
 
     # Redirect to finalize the payment
     messages.success(request, "Payment completed. Finalizing...")
@@ -863,13 +906,11 @@ def payment_success(request, event_id, participant_id):
 
 # Step 7: Payment Finalizing View
 import time
-import logging
 from django.shortcuts import get_object_or_404, render
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from registration.pdf_utils import generate_invoice
 
-logger = logging.getLogger(__name__)
 @login_required
 def finalize_payment(request, event_id, participant_id):
     try:
@@ -888,8 +929,13 @@ def finalize_payment(request, event_id, participant_id):
         # Call bKash execute API
         execute_response = execute_payment(token, payment_status.transaction_id)
 
-        # Debug point: Log the execute response
-        print(f"Execute Payment API Response: {execute_response}")
+        logger.info(
+            "bKash payment executed", extra={
+                'payment_id': payment_status.transaction_id,
+                'status_code': (execute_response or {}).get('statusCode'),
+                'trx_id': (execute_response or {}).get('trxID'),
+            },
+        )
 
         # Handle specific Execute API error cases
         if execute_response:
@@ -935,8 +981,8 @@ def finalize_payment(request, event_id, participant_id):
             try:
                 invoice_path = generate_invoice(payment_status.participant, payment_status.event, payment_status)
                 send_invoice_email(payment_status.participant, payment_status.event, payment_status, invoice_path)
-            except Exception as e:
-                print(f"Invoice/Email Error: {e}")
+            except Exception:
+                logger.exception("Error generating or sending the invoice of payment %s", payment_status.id)
                 messages.error(request, "Payment completed, but there was an issue generating the invoice or sending the email.")
                 return render(request, 'payment_message.html', {
                     'title': 'Payment Completed with Issues',
@@ -957,8 +1003,8 @@ def finalize_payment(request, event_id, participant_id):
             'error_message': 'Payment finalization failed. Please contact support.',
         })
 
-    except Exception as e:
-        print(f"Error in finalizing payment: {e}")
+    except Exception:
+        logger.exception("Error in finalizing bKash payment for participant %s", participant_id)
         return render(request, 'payment_message.html', {
             'title': 'Payment Failure',
             'error_message': 'An unexpected error occurred during payment finalization.',
@@ -972,6 +1018,8 @@ def payment_failure(request, event_id, participant_id):
 
     # Update payment status to 'failed'
     PaymentStatus.objects.filter(participant=participant, event=event).update(status='failed')
+    # update() sends no post_save, which would drop the cached account summary
+    invalidate_account_summary(participant.user_id)
 
     # Optional: Show a failure reason
     failure_reason = request.GET.get('reason', "Payment failed. Please try again.")
@@ -999,9 +1047,9 @@ def send_invoice_email(participant, event, payment_status, invoice_path):
         payment_status.email_sent = True
         payment_status.invoice = invoice_path
         payment_status.save()
-        print(f"Email sent to {recipient}")
-    except Exception as e:
-        print(f"Error sending email: {e}")
+        logger.info("Invoice email sent for payment %s", payment_status.id)
+    except Exception:
+        logger.exception("Error sending the invoice email of payment %s", payment_status.id)
 
 
 
@@ -1177,77 +1225,26 @@ from django.contrib.admin.views.decorators import staff_member_required
 from django.shortcuts import render
 from django.db.models import Sum
 from django.conf import settings
-import os
-import matplotlib
-matplotlib.use('Agg')  # Set backend before importing pyplot
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
 from registration.models import Participant, PaymentStatus, Event
-from datetime import datetime
 from django.core.cache import cache
 from django.core.paginator import Paginator
 from urllib.parse import urlencode
 
 
-def generate_chart(event_metrics):
-    cache_key = f"chart_{hash(str(event_metrics))}"
-    cached_chart = cache.get(cache_key)
-    if cached_chart:
-        return cached_chart
-    if not event_metrics:
-        return None
-
-    try:
-        df = pd.DataFrame(event_metrics)
-        df = df.rename(columns={
-            'approved_participants': 'Approved Participants',
-            'pending_payments': 'Pending Payments',
-            'revenue_collected': 'Revenue Collected'
-        })
-
-        df_melted = df.melt(
-            id_vars=['name'],
-            value_vars=['Approved Participants', 'Pending Payments'],
-            var_name='Metric',
-            value_name='Count'
-        )
-
-        plt.figure(figsize=(12, 7))
-        sns.set_style("whitegrid")
-        ax = sns.barplot(
-            x='name',
-            y='Count',
-            hue='Metric',
-            data=df_melted,
-            palette="viridis"
-        )
-        plt.title('Event Metrics Comparison', fontsize=14)
-        plt.xlabel('Events', fontsize=12)
-        plt.ylabel('Count', fontsize=12)
-        plt.xticks(rotation=45, ha='right')
-        plt.legend(title='Metrics', bbox_to_anchor=(1.05, 1), loc='upper left')
-
-        chart_dir = os.path.join(settings.MEDIA_ROOT, 'charts')
-        os.makedirs(chart_dir, exist_ok=True)
-        chart_filename = f'metrics_{datetime.now().timestamp()}.png'
-        chart_path = os.path.join(chart_dir, chart_filename)
-
-        plt.tight_layout()
-        plt.savefig(chart_path)
-        plt.close()
-
-        chart_url = f'charts/{chart_filename}'
-        cache.set(cache_key, chart_url, timeout=3600)
-        return chart_url
-
-    except Exception as e:
-        print(f"Chart Error: {e}")
-        return None
+@staff_member_required
+def cache_stats(request):
+    """Expose cache hit/miss counters and rebuild timings for monitoring."""
+    from .bundle import get_bundle_stats
+    # Two-tier cache counters of the worker serving this request
+    tiers = cache.get_stats() if hasattr(cache, 'get_stats') else None
+    return JsonResponse({'event_bundle': get_bundle_stats(), 'cache': tiers})
 
 
 @staff_member_required
 def global_dashboard(request):
+    # Imports pandas and the plotting libraries, see registration/analytics.py
+    from .analytics import generate_chart, get_participant_summary
+
     event_filter = request.GET.get('event')
     event_status_filter = request.GET.get('event_status')
     page_number = request.GET.get('page')
@@ -1315,146 +1312,3 @@ def global_dashboard(request):
     if request.headers.get('HX-Request'):
         return render(request, 'partials/dashboard_content.html', context)
     return render(request, 'dashboard.html', context)
-
-
-def get_participant_summary(request, org_page_number=None):
-    event_filter = request.GET.get('event')
-    event_status_filter = request.GET.get('event_status')
-
-    events = Event.objects.all()
-    if event_status_filter:
-        events = events.filter(event_status=event_status_filter)
-    if event_filter:
-        events = events.filter(id=event_filter)
-
-    if not events.exists():
-        return [], {}, None, [], None
-
-    event_ids = events.values_list('id', flat=True)
-
-    participant_qs = Participant.objects.filter(event_id__in=event_ids).values(
-        'name', 'email', 'approved', 'denied', 'event__name', 'country', 'organization'
-    )
-
-    df = pd.DataFrame(list(participant_qs))
-    if df.empty:
-        return [], {}, None, [], None
-
-    df = df.rename(columns={'event__name': 'event_name'})
-
-    totals = {
-        'total_participants': len(df),
-        'approved_participants': df['approved'].sum(),
-        'denied_participants': df['denied'].sum(),
-        'pending_participants': len(df) - df['approved'].sum() - df['denied'].sum(),
-        'local_participants': df['country'].fillna('').str.contains('Bangladesh', case=False).sum(),
-        'foreign_participants': len(df) - df['country'].fillna('').str.contains('Bangladesh', case=False).sum(),
-    }
-
-    organization_summary = df.groupby('organization').size().reset_index(name='participant_count')
-    organization_paginator = Paginator(organization_summary.to_dict(orient='records'), 10)
-    organization_page_obj = organization_paginator.get_page(org_page_number)
-
-    chart_path = generate_participant_summary_chart(df)
-    org_chart_path = generate_organization_chart(organization_summary)
-
-    return df.to_dict(orient='records'), totals, chart_path, organization_page_obj, org_chart_path
-
-
-def generate_participant_summary_chart(df):
-    if df.empty:
-        return None
-
-    cache_key = f"participant_summary_chart_{hash(pd.util.hash_pandas_object(df).sum())}"
-    cached_chart = cache.get(cache_key)
-    if cached_chart:
-        return cached_chart
-
-    summary_df = df.groupby('event_name').agg({
-        'approved': 'sum',
-        'denied': 'sum',
-    }).reset_index()
-    summary_df['pending'] = df.groupby('event_name').apply(
-        lambda x: len(x) - x['approved'].sum() - x['denied'].sum()
-    ).values
-
-    summary_df = summary_df.rename(columns={
-        'approved': 'Approved Participants',
-        'denied': 'Denied Participants',
-        'pending': 'Pending Participants'
-    })
-
-    df_melted = summary_df.melt(
-        id_vars=['event_name'],
-        value_vars=['Approved Participants', 'Denied Participants', 'Pending Participants'],
-        var_name='Status',
-        value_name='Count'
-    )
-
-    plt.figure(figsize=(12, 7))
-    sns.set_style("whitegrid")
-    sns.barplot(
-        x='event_name',
-        y='Count',
-        hue='Status',
-        data=df_melted,
-        palette='pastel'
-    )
-    plt.title('Participant approval status per event', fontsize=16)
-    plt.xlabel('Event', fontsize=14)
-    plt.ylabel('Count', fontsize=14)
-    plt.xticks(rotation=45, ha='right', fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.tight_layout()
-
-    chart_dir = os.path.join(settings.MEDIA_ROOT, 'charts')
-    os.makedirs(chart_dir, exist_ok=True)
-    chart_filename = f'participant_summary_status_{datetime.now().timestamp()}.png'
-    chart_path = os.path.join(chart_dir, chart_filename)
-    plt.savefig(chart_path)
-    plt.close()
-
-    chart_url = f'charts/{chart_filename}'
-    cache.set(cache_key, chart_url, timeout=3600)
-    return chart_url
-
-
-def generate_organization_chart(organization_summary):
-    if organization_summary.empty:
-        return None
-
-    try:
-        cache_key = f"organization_chart_{hash(pd.util.hash_pandas_object(organization_summary).sum())}"
-        cached_chart = cache.get(cache_key)
-        if cached_chart:
-            return cached_chart
-
-        plt.figure(figsize=(12, 7))
-        sns.set_style("whitegrid")
-        sns.barplot(
-            x="participant_count",
-            y="organization",
-            data=organization_summary.sort_values('participant_count', ascending=False),
-            hue="organization",
-            palette="pastel",
-            legend=False
-        )
-
-        plt.title("Participants Per Organization", fontsize=16)
-        plt.xlabel("Number of Participants", fontsize=14)
-        plt.ylabel("Organization", fontsize=14)
-        plt.tight_layout()
-
-        chart_dir = os.path.join(settings.MEDIA_ROOT, 'charts')
-        os.makedirs(chart_dir, exist_ok=True)
-        chart_filename = f'organization_participant_chart_{datetime.now().timestamp()}.png'
-        chart_path = os.path.join(chart_dir, chart_filename)
-        plt.savefig(chart_path)
-        plt.close()
-
-        chart_url = f'charts/{chart_filename}'
-        cache.set(cache_key, chart_url, timeout=3600)
-        return chart_url
-    except Exception as e:
-        print(f"Chart Error: {e}")
-        return None
@@ -0,0 +1,18 @@
+// Replace a .video-facade thumbnail with the YouTube player on click, so the
+// player scripts are only downloaded for videos that are actually watched.
+document.addEventListener('click', function (event) {
+    var facade = event.target.closest('.video-facade');
+    if (!facade) {
+        return;
+    }
+    var src = facade.dataset.embed;
+    var iframe = document.createElement('iframe');
+    iframe.src = src + (src.indexOf('?') === -1 ? '?' : '&') + 'autoplay=1&rel=0';
+    iframe.className = facade.className.replace('video-facade', '').trim();
+    iframe.style.cssText = facade.style.cssText;
+    iframe.style.border = 'none';
+    iframe.setAttribute('allow', 'accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share');
+    iframe.setAttribute('allowfullscreen', '');
+    iframe.title = facade.getAttribute('aria-label') || 'YouTube video';
+    facade.replaceWith(iframe);
+});
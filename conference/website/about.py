@@ -0,0 +1,113 @@
+"""Precompiled About page structure.
+
+The About page combines board members, committees, partnerships, awards,
+the timeline and the organizational values, and derives the Values card
+(list items, header title and icon) from free-form descriptions. All of it
+is computed once and cached under the tag versions of the models involved,
+so it is rebuilt only after one of them changes.
+"""
+
+import hashlib
+import re
+
+from django.core.cache import cache
+
+from .caching import BASE_PAGE_TAGS, get_tag_versions
+from .models import (
+    Award, BoardMember, CallToAction, Committee, HeroSection, NavigationLink,
+    OrganizationalValue, Partnership, StatisticCounter, TimelineSection,
+)
+
+ABOUT_PAGE_TAGS = tuple(sorted(set(BASE_PAGE_TAGS) | {
+    'website.StatisticCounter', 'website.BoardMember', 'website.Committee', 'website.Partnership',
+    'website.Award', 'website.TimelineSection', 'website.TimelineItem', 'website.OrganizationalValue',
+}))
+
+# Keyed by tag versions, so the timeout only bounds memory use
+ABOUT_PAGE_TIMEOUT = 60 * 60 * 24
+
+_VALUES_HEADER_RE = re.compile(r'^(values|our values?)$', re.IGNORECASE)
+
+
+def _values_card(values):
+    """Return (values_items, header title, header icon url) for the Values card.
+
+    If there are multiple `value` rows, each row's title is an item. A single
+    `value` row whose description holds a pasted list is split into items.
+    """
+    values_items = []
+    if len(values) > 1:
+        for v in values:
+            # prefer the title for short list items, fallback to description
+            text = v.title or (v.description or '').strip()
+            if text:
+                values_items.append(text)
+    elif len(values) == 1:
+        single = values[0]
+        desc = (single.description or '').strip()
+        if desc:
+            # split on newlines first
+            parts = [p.strip() for p in re.split(r'[\r\n]+', desc) if p.strip()]
+            if len(parts) == 1:
+                # if still single, try splitting on common separators
+                parts = [p.strip() for p in re.split(r'[;\u2022,]+', desc) if p.strip()]
+            values_items = parts
+        elif single.title:
+            # no description, use the title as a single item
+            values_items = [single.title]
+
+    # Prefer an explicit "Values" meta row (title like 'Values' or 'Our Values');
+    # otherwise a single row provides the header itself
+    values_header_title = 'Values'
+    values_header_icon_url = None
+    header = next((v for v in values if _VALUES_HEADER_RE.match(v.title or '')), None)
+    if header is None and len(values) == 1:
+        header = values[0]
+    if header is not None:
+        values_header_title = header.title or values_header_title
+        if header.icon_svg:
+            values_header_icon_url = header.icon_svg.url
+
+    return values_items, values_header_title, values_header_icon_url
+
+
+def build_about_page():
+    """Query the database and return a fresh About page context."""
+    organizational_values = list(OrganizationalValue.objects.all())
+    mission = next((v for v in organizational_values if v.value_type == 'mission'), None)
+    vision = next((v for v in organizational_values if v.value_type == 'vision'), None)
+    values = sorted((v for v in organizational_values if v.value_type == 'value'), key=lambda v: v.order)
+    values_items, values_header_title, values_header_icon_url = _values_card(values)
+
+    timeline_section = TimelineSection.objects.order_by('order').first()
+    timeline_items = list(timeline_section.items.all()) if timeline_section else []  # type: ignore
+
+    return {
+        'hero': HeroSection.objects.filter(page='about').first(),
+        'stats_counters': list(StatisticCounter.objects.filter(page='about').order_by('order')),
+        'board_members': list(BoardMember.objects.all().order_by('order')),
+        'committees': list(Committee.objects.all().order_by('order')),
+        'partnerships': list(Partnership.objects.all().order_by('order')),
+        'awards': list(Award.objects.all().order_by('order', '-year')),
+        'call_to_action': CallToAction.objects.filter(page='about').first(),
+        'navigation_links': list(NavigationLink.objects.filter(is_active=True).order_by('order')),
+        'mission': mission,
+        'vision': vision,
+        'values': values,
+        'values_items': values_items,
+        'values_header_title': values_header_title,
+        'values_header_icon_url': values_header_icon_url,
+        'timeline_section': timeline_section,
+        'timeline_items': timeline_items,
+    }
+
+
+def get_about_page():
+    """Return the cached About page context, rebuilding it after a content change."""
+    versions = '-'.join(str(version) for version in get_tag_versions(ABOUT_PAGE_TAGS))
+    key = f'about_page_{hashlib.md5(versions.encode()).hexdigest()}'
+    context = cache.get(key)
+    if context is None:
+        context = build_about_page()
+        cache.set(key, context, ABOUT_PAGE_TIMEOUT)
+    return context
@@ -7,6 +7,7 @@ from .models import (
     Webinar, Member, NavigationLink, OrganizationalValue, ResearchInterestArea, Speciality, Panelist
 )
 from .models import TimelineSection, TimelineItem
+from .member_search import search_members
 
 # HeroSection and related CarouselItems
 @admin.register(HeroSection)
@@ -173,6 +174,12 @@ class MemberAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_search_results(self, request, queryset, search_term):
+        # Emails are not in the search document, so they use search_fields
+        if not search_term.strip() or '@' in search_term:
+            return super().get_search_results(request, queryset, search_term)
+        return search_members(queryset, search_term, rank=False), False
+
     def get_member_name(self, obj):
         return obj.user_profile.name
     get_member_name.short_description = 'Name'  # type: ignore
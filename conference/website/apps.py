@@ -8,3 +8,9 @@ class WebsiteConfig(AppConfig):
     def ready(self):
         """Register signal handlers when the app is ready."""
         import website.signals  # noqa
+        from .caching import connect_content_signals
+        from .member_search import connect_member_search_signals
+        from .search import connect_search_signals
+        connect_content_signals()
+        connect_member_search_signals()
+        connect_search_signals()
@@ -0,0 +1,177 @@
+"""Content generation counter and tagged page cache for the website pages.
+
+Every save or delete of a ``website`` model (and every change to an M2M link
+between them) replaces a single generation token. Website pages also show
+rows of other apps (EXTERNAL_TAG_MODELS), whose changes replace a separate
+token instead, so they do not flush what is keyed by the generation. The
+version of a page combines both with the registration app's all-events
+token. Conditional GETs are answered from that version without touching the
+database.
+
+Each model also owns a tag token. Rendered pages are cached for anonymous
+visitors under the tokens of the models they display, so a content update
+only regenerates the pages that show that model.
+"""
+
+import hashlib
+import time
+from functools import wraps
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.http import HttpResponse
+from django.views.decorators.http import condition
+
+from registration.caching import (
+    bump_version, get_all_events_version, get_version, version_timestamp,
+    is_conditional_request_cacheable,
+)
+
+CONTENT_GENERATION_KEY = 'website_content_generation'
+
+# Replaced on changes to EXTERNAL_TAG_MODELS, for the validators of the pages
+EXTERNAL_CONTENT_VERSION_KEY = 'website_external_content_version'
+
+# Models of other apps shown on website pages
+EXTERNAL_TAG_MODELS = (
+    'registration.Event', 'registration.AbstractSubmission', 'registration.UserProfile',
+)
+
+# Search indexes derived from other models; rebuilding them is not a content change
+UNTAGGED_MODELS = ('website.SearchDocument', 'website.MemberSearchDocument')
+
+# Models read by the base template tags on every page
+BASE_PAGE_TAGS = (
+    'website.SiteSettings', 'website.NavigationLink', 'website.HeroSection', 'website.CallToAction',
+)
+
+# Pages are keyed by tag versions, so the timeout only bounds memory use
+SITE_PAGE_TIMEOUT = 60 * 60 * 24
+
+
+def get_content_generation():
+    """Return the current generation token of the website content."""
+    return get_version(CONTENT_GENERATION_KEY)
+
+
+def bump_content_generation():
+    """Replace the generation token once the current transaction commits."""
+    bump_version(CONTENT_GENERATION_KEY)
+
+
+def get_site_version():
+    """Return a token covering website content, the rows of other apps it
+    shows and conference events."""
+    return f'{get_content_generation()}-{get_version(EXTERNAL_CONTENT_VERSION_KEY)}-{get_all_events_version()}'
+
+
+def _tag_key(tag):
+    return f'website_tag_{tag.lower()}'
+
+
+def get_tag_versions(tags):
+    """Return the version tokens of several model tags in one cache round trip."""
+    keys = [_tag_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Seed with the current time so an evicted token never repeats
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_tags(*tags):
+    """Replace the tokens of model tags once the current transaction commits."""
+    bump_version(*(_tag_key(tag) for tag in tags))
+
+
+def cache_site_page(*tags):
+    """Cache the rendered page of a website view for anonymous visitors.
+
+    ``tags`` are the ``app_label.ModelName`` labels of the models the page
+    displays, in addition to BASE_PAGE_TAGS. Logged-in users, HTMX requests
+    and anything but GET always hit the view. Only 200 responses are kept.
+    """
+    page_tags = sorted(set(BASE_PAGE_TAGS) | set(tags))
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view_func(request, *args, **kwargs):
+            if request.method != 'GET' or not is_conditional_request_cacheable(request):
+                return view_func(request, *args, **kwargs)
+
+            versions = '-'.join(str(version) for version in get_tag_versions(page_tags))
+            digest = hashlib.md5(f'{request.build_absolute_uri()}|{versions}'.encode()).hexdigest()
+            key = f'site_page_{view_func.__name__}_{digest}'
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                cache.set(key, (response.content, response['Content-Type']), SITE_PAGE_TIMEOUT)
+            return response
+        return _wrapped_view_func
+    return decorator
+
+
+def _site_last_modified_timestamp():
+    return version_timestamp(max(
+        get_content_generation(), get_version(EXTERNAL_CONTENT_VERSION_KEY), get_all_events_version(),
+    ))
+
+
+def _site_etag(request, *args, **kwargs):
+    if not is_conditional_request_cacheable(request):
+        return None
+    return f'"site-{get_site_version()}"'
+
+
+def _site_last_modified(request, *args, **kwargs):
+    if not is_conditional_request_cacheable(request):
+        return None
+    return _site_last_modified_timestamp()
+
+
+def conditional_site_page(view_func):
+    """Answer conditional GETs of a website page for anonymous visitors."""
+    return condition(etag_func=_site_etag, last_modified_func=_site_last_modified)(view_func)
+
+
+# Signal handlers ------------------------------------------------------------#
+
+def _bump_for_instance(sender, **kwargs):
+    bump_version(CONTENT_GENERATION_KEY, _tag_key(sender._meta.label))
+
+
+def _bump_for_external_instance(sender, **kwargs):
+    bump_version(EXTERNAL_CONTENT_VERSION_KEY, _tag_key(sender._meta.label))
+
+
+def _bump_for_m2m(sender, instance, model, action, **kwargs):
+    if action.startswith('post_'):
+        bump_version(CONTENT_GENERATION_KEY, _tag_key(type(instance)._meta.label), _tag_key(model._meta.label))
+
+
+def connect_content_signals():
+    """Bump the generation and model tag on save/delete of website models
+    (except UNTAGGED_MODELS), and the external version and model tag on
+    save/delete of the EXTERNAL_TAG_MODELS they display."""
+    for model in apps.get_app_config('website').get_models():
+        if model._meta.label in UNTAGGED_MODELS:
+            continue
+        uid = f'website_generation_{model._meta.label_lower}'
+        post_save.connect(_bump_for_instance, sender=model, dispatch_uid=f'{uid}_save')
+        post_delete.connect(_bump_for_instance, sender=model, dispatch_uid=f'{uid}_delete')
+        for m2m in model._meta.local_many_to_many:
+            through = m2m.remote_field.through
+            m2m_changed.connect(_bump_for_m2m, sender=through, dispatch_uid=f'website_generation_{through._meta.label_lower}')
+
+    for label in EXTERNAL_TAG_MODELS:
+        model = apps.get_model(label)
+        uid = f'website_tag_{model._meta.label_lower}'
+        post_save.connect(_bump_for_external_instance, sender=model, dispatch_uid=f'{uid}_save')
+        post_delete.connect(_bump_for_external_instance, sender=model, dispatch_uid=f'{uid}_delete')
@@ -0,0 +1,115 @@
+"""Full-text searchable text column for the website app.
+
+``SearchTextField`` is a TextField with a ``search`` lookup and a matching
+``SearchRank`` expression. The index itself is created by migrations, per
+database vendor:
+
+* MySQL: a FULLTEXT index on the column, queried in BOOLEAN MODE.
+* SQLite: an FTS5 table named ``<db_table>_fts`` whose rowid is the pk of
+  the row, kept in sync by triggers on the base table.
+* Anything else: the lookup falls back to one LIKE per term.
+
+Every term of a query must match, and the last letters of each term are
+optional, so "mah dha" finds "Mahmud, Dhaka Medical College".
+"""
+
+import re
+
+from django.db import models
+from django.db.models import Func, Lookup
+
+# Queries are cut to this many terms
+MAX_SEARCH_TERMS = 8
+
+
+def search_terms(query):
+    """Split a user query into lowercase word terms."""
+    return re.findall(r'\w+', (query or '').lower())[:MAX_SEARCH_TERMS]
+
+
+def fts_table(model):
+    """Return the name of the SQLite FTS5 table backing a model's SearchTextField."""
+    return f'{model._meta.db_table}_fts'
+
+
+def mysql_boolean_query(terms):
+    # Terms with the truncation operator are kept even if shorter than
+    # innodb_ft_min_token_size or a stopword
+    return ' '.join(f'+{term}*' for term in terms)
+
+
+def fts5_query(terms):
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+class SearchTextField(models.TextField):
+    """TextField backed by a full-text index (see module docstring)."""
+
+
+@SearchTextField.register_lookup
+class FullTextSearch(Lookup):
+    lookup_name = 'search'
+    prepare_rhs = False
+
+    def as_mysql(self, compiler, connection):
+        terms = search_terms(self.rhs)
+        if not terms:
+            return '1 = 1', []
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        return f'MATCH ({lhs}) AGAINST (%s IN BOOLEAN MODE)', [*lhs_params, mysql_boolean_query(terms)]
+
+    def as_sqlite(self, compiler, connection):
+        terms = search_terms(self.rhs)
+        if not terms:
+            return '1 = 1', []
+        qn = compiler.quote_name_unless_alias
+        model = self.lhs.target.model
+        fts = qn(fts_table(model))
+        pk = f'{qn(self.lhs.alias)}.{qn(model._meta.pk.column)}'
+        return f'{pk} IN (SELECT rowid FROM {fts} WHERE {fts} MATCH %s)', [fts5_query(terms)]
+
+    def as_sql(self, compiler, connection):
+        terms = search_terms(self.rhs)
+        if not terms:
+            return '1 = 1', []
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        sql = ' AND '.join(f'{lhs} LIKE %s' for _ in terms)
+        return f'({sql})', [param for term in terms for param in (*lhs_params, f'%{term}%')]
+
+
+class SearchRank(Func):
+    """Relevance of a SearchTextField for a query; higher is better.
+
+    Only meaningful on rows that also pass the ``search`` lookup. Databases
+    without a full-text index rank every row equally.
+    """
+    output_field = models.FloatField()
+
+    def __init__(self, expression, query, **extra):
+        self.query = query
+        super().__init__(expression, **extra)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        lhs, lhs_params = compiler.compile(self.source_expressions[0])
+        return (
+            f'MATCH ({lhs}) AGAINST (%s IN BOOLEAN MODE)',
+            [*lhs_params, mysql_boolean_query(search_terms(self.query))],
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        terms = search_terms(self.query)
+        if not terms:
+            return '0', []
+        column = self.source_expressions[0]
+        qn = compiler.quote_name_unless_alias
+        model = column.target.model
+        fts = qn(fts_table(model))
+        pk = f'{qn(column.alias)}.{qn(model._meta.pk.column)}'
+        # bm25() is lower for better matches
+        return (
+            f'(SELECT -bm25({fts}) FROM {fts} WHERE {fts} MATCH %s AND {fts}.rowid = {pk})',
+            [fts5_query(terms)],
+        )
+
+    def as_sql(self, compiler, connection, **extra_context):
+        return '0', []
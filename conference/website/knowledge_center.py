@@ -0,0 +1,79 @@
+"""Resource library of the knowledge center.
+
+Resources are filtered by category slug and resource type in SQL and
+paginated, so a request only loads the visible page. The filter options
+with their resource counts come from one aggregate cached under the
+ResourceCategory and ResourceItem tag versions.
+"""
+
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Count
+
+from .caching import get_tag_versions
+from .models import ResourceCategory, ResourceItem
+
+RESOURCE_PAGE_SIZE = 9
+
+RESOURCE_TAGS = ('website.ResourceCategory', 'website.ResourceItem')
+
+# Keyed by tag versions, so the timeout only bounds memory use
+RESOURCE_FACETS_TIMEOUT = 60 * 60 * 24
+
+
+def build_resource_facets():
+    """Query the database and return the filter options with their counts."""
+    categories = list(
+        ResourceCategory.objects.annotate(resource_count=Count('resources'))
+        .values('slug', 'name', 'resource_count').order_by('order', 'name')
+    )
+    type_counts = dict(ResourceItem.objects.order_by().values_list('resource_type').annotate(total=Count('id')))
+    types = [
+        {'value': value, 'label': label, 'resource_count': type_counts.get(value, 0)}
+        for value, label in ResourceItem.RESOURCE_TYPE_CHOICES
+    ]
+    return {
+        'categories': categories,
+        'types': types,
+        'total': sum(type_counts.values()),
+    }
+
+
+def get_resource_facets():
+    """Return the cached filter options, rebuilt after a resource change."""
+    versions = '-'.join(str(version) for version in get_tag_versions(RESOURCE_TAGS))
+    key = f'resource_facets_{hashlib.md5(versions.encode()).hexdigest()}'
+    facets = cache.get(key)
+    if facets is None:
+        facets = build_resource_facets()
+        cache.set(key, facets, RESOURCE_FACETS_TIMEOUT)
+    return facets
+
+
+def get_resource_page(params):
+    """Filter resources by the ``category`` slug and ``type`` in ``params``
+    and return the requested ``page`` with the active filters."""
+    facets = get_resource_facets()
+    resources = ResourceItem.objects.all()
+
+    category = params.get('category', '')
+    if category not in {c['slug'] for c in facets['categories']}:
+        category = ''
+    if category:
+        resources = resources.filter(category__slug=category)
+    resource_type = params.get('type', '')
+    if resource_type not in dict(ResourceItem.RESOURCE_TYPE_CHOICES):
+        resource_type = ''
+    if resource_type:
+        resources = resources.filter(resource_type=resource_type)
+
+    page = Paginator(resources.order_by('order', 'id'), RESOURCE_PAGE_SIZE).get_page(params.get('page'))
+    return {
+        'resources': page.object_list,
+        'page_obj': page,
+        'resource_facets': facets,
+        'selected_category': category,
+        'selected_type': resource_type,
+    }
@@ -0,0 +1,40 @@
+"""
+Management command to pre-generate the cached XML sitemaps and HTML sitemap table.
+
+Usage: python manage.py generate_sitemaps [--host <domain>] [--secure]
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.urls import reverse
+from website.sitemaps import SITEMAPS, get_sitemap_rows
+
+
+class Command(BaseCommand):
+    help = 'Render and cache the sitemap index, every sitemap page and the HTML sitemap rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', help='Host the sitemap URLs are built for (default: first ALLOWED_HOSTS entry)')
+        parser.add_argument('--secure', action='store_true', help='Build https:// URLs')
+
+    def handle(self, *args, **options):
+        host = options['host']
+        if not host:
+            hosts = [h for h in settings.ALLOWED_HOSTS if h != '*' and not h.startswith('.')]
+            host = hosts[0] if hosts else 'localhost'
+        client = Client(HTTP_HOST=host)
+
+        paths = [reverse('django.contrib.sitemaps.views.sitemap')]
+        for section, sitemap_class in SITEMAPS.items():
+            path = reverse('sitemap_section', kwargs={'section': section})
+            num_pages = sitemap_class().paginator.num_pages
+            paths.extend(path if page == 1 else f'{path}?p={page}' for page in range(1, num_pages + 1))
+
+        for path in paths:
+            response = client.get(path, secure=options['secure'])
+            if response.status_code != 200:
+                self.stdout.write(self.style.WARNING(f"{path} returned {response.status_code}"))
+
+        rows = get_sitemap_rows()
+        self.stdout.write(self.style.SUCCESS(f"Generated {len(paths)} sitemap page(s) and {len(rows)} sitemap table row(s) for {host}"))
@@ -0,0 +1,19 @@
+"""
+Management command to rebuild the denormalized member search documents.
+
+Usage: python manage.py rebuild_member_search [--member <member_id> ...]
+"""
+
+from django.core.management.base import BaseCommand
+from website.member_search import refresh_member_search_documents
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search documents of members'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--member', type=int, action='append', dest='members', help='Only rebuild this member (repeatable)')
+
+    def handle(self, *args, **options):
+        count = refresh_member_search_documents(options['members'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} member search document(s)"))
@@ -0,0 +1,25 @@
+"""
+Management command to rebuild the site-wide search index.
+
+Usage: python manage.py rebuild_search_index [--kind <kind> ...]
+"""
+
+from django.core.management.base import BaseCommand
+from website.models import SearchDocument
+from website.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the site-wide search documents'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--kind', action='append', dest='kinds', choices=[kind for kind, _ in SearchDocument.KIND_CHOICES],
+            help='Only rebuild documents of this kind (repeatable)',
+        )
+
+    def handle(self, *args, **options):
+        counts = rebuild_search_index(options['kinds'])
+        for kind, count in counts.items():
+            self.stdout.write(f"{kind}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {sum(counts.values())} search document(s)"))
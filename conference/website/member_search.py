@@ -0,0 +1,134 @@
+"""Denormalized member search documents.
+
+Each Member has one MemberSearchDocument holding its name, institution,
+position, specialties and research areas as a single lowercase text, backed
+by a full-text index (see website.fields). Searching then touches one
+indexed column instead of joining UserProfile and both M2M tables with
+icontains scans.
+
+Documents are rebuilt after the transaction commits whenever a member, its
+profile, its M2M links or the name of a linked specialty or research area
+changes, together with the members' entries in the site-wide search index
+(website.search). ``python manage.py rebuild_member_search`` rebuilds all
+of them.
+"""
+
+from django.db import connection, transaction
+from django.db.models.signals import post_save, pre_delete, m2m_changed
+
+from registration.models import UserProfile
+
+from .fields import SearchRank
+from .models import Member, MemberSearchDocument, ResearchInterestArea, Speciality
+
+REBUILD_BATCH_SIZE = 500
+
+
+def build_search_content(member):
+    """Return the search text of a member with profile and M2Ms loaded."""
+    parts = [
+        member.user_profile.name if member.user_profile else '',
+        member.institution,
+        member.position,
+        *(specialty.name for specialty in member.specialties.all()),
+        *(area.name for area in member.research_interest_areas.all()),
+    ]
+    return ' '.join(part for part in parts if part).lower()
+
+
+def refresh_member_search_documents(member_ids=None):
+    """Rebuild the search documents of the given members, or of all members.
+
+    Returns the number of documents written.
+    """
+    members = Member.objects.select_related('user_profile').prefetch_related(
+        'specialties', 'research_interest_areas'
+    ).order_by('pk')
+    if member_ids is not None:
+        members = members.filter(pk__in=member_ids)
+
+    # MySQL upserts on any unique key and takes no target columns
+    unique_fields = ['member'] if connection.features.supports_update_conflicts_with_target else None
+    count = 0
+    batch = []
+    for member in members.iterator(chunk_size=REBUILD_BATCH_SIZE):
+        batch.append(MemberSearchDocument(member=member, content=build_search_content(member)))
+        if len(batch) == REBUILD_BATCH_SIZE:
+            count += _write_documents(batch, unique_fields)
+            batch = []
+    if batch:
+        count += _write_documents(batch, unique_fields)
+
+    # The site-wide search documents of members are built from the same text
+    from .search import index_objects
+    index_objects('member', member_ids)
+    return count
+
+
+def _write_documents(documents, unique_fields):
+    MemberSearchDocument.objects.bulk_create(
+        documents, update_conflicts=True, unique_fields=unique_fields, update_fields=['content', 'updated_at']
+    )
+    return len(documents)
+
+
+def search_members(queryset, query, rank=True):
+    """Filter a Member queryset by a search query.
+
+    With ``rank`` the members are annotated with ``search_rank``, higher
+    for better matches.
+    """
+    queryset = queryset.filter(search_document__content__search=query)
+    if rank:
+        queryset = queryset.annotate(search_rank=SearchRank('search_document__content', query))
+    return queryset
+
+
+def schedule_refresh(member_ids):
+    """Rebuild the documents of some members once the current transaction commits."""
+    member_ids = list(member_ids)
+    if member_ids:
+        transaction.on_commit(lambda: refresh_member_search_documents(member_ids))
+
+
+# Signal handlers ------------------------------------------------------------#
+
+def _refresh_for_member(sender, instance, **kwargs):
+    schedule_refresh([instance.pk])
+
+
+def _refresh_for_profile(sender, instance, **kwargs):
+    schedule_refresh(Member.objects.filter(user_profile_id=instance.pk).values_list('pk', flat=True))
+
+
+def _refresh_for_tag(sender, instance, **kwargs):
+    # Called on save and before delete; the rebuild runs after the commit,
+    # when the M2M rows of a deleted specialty or area are gone too
+    if isinstance(instance, Speciality):
+        members = instance.members_specialties.all()
+    else:
+        members = instance.members.all()
+    schedule_refresh(members.values_list('pk', flat=True))
+
+
+def _refresh_for_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith('post_'):
+            schedule_refresh([instance.pk])
+    elif action == 'pre_clear':
+        # pk_set is not provided on clear, so read the linked members first
+        _refresh_for_tag(sender, instance)
+    elif action in ('post_add', 'post_remove'):
+        schedule_refresh(pk_set)
+
+
+def connect_member_search_signals():
+    """Keep member search documents in sync with their sources."""
+    post_save.connect(_refresh_for_member, sender=Member, dispatch_uid='member_search_member_save')
+    post_save.connect(_refresh_for_profile, sender=UserProfile, dispatch_uid='member_search_profile_save')
+    for model in (Speciality, ResearchInterestArea):
+        uid = f'member_search_{model._meta.label_lower}'
+        post_save.connect(_refresh_for_tag, sender=model, dispatch_uid=f'{uid}_save')
+        pre_delete.connect(_refresh_for_tag, sender=model, dispatch_uid=f'{uid}_delete')
+    for through in (Member.specialties.through, Member.research_interest_areas.through):
+        m2m_changed.connect(_refresh_for_m2m, sender=through, dispatch_uid=f'member_search_{through._meta.label_lower}')
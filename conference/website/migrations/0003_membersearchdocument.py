@@ -0,0 +1,86 @@
+# Generated by Django 5.1.4 on 2026-10-18 06:46
+
+import django.db.models.deletion
+import website.fields
+from django.db import migrations, models
+
+TABLE = 'website_membersearchdocument'
+FTS_TABLE = f'{TABLE}_fts'
+
+SQLITE_CREATE = [
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(content, tokenize='unicode61')",
+    # The FTS rowid is the member id; these triggers are lost if a later
+    # migration makes SQLite rebuild the base table
+    f"""CREATE TRIGGER {TABLE}_ai AFTER INSERT ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.member_id, new.content);
+    END""",
+    f"""CREATE TRIGGER {TABLE}_ad AFTER DELETE ON {TABLE} BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.member_id;
+    END""",
+    f"""CREATE TRIGGER {TABLE}_au AFTER UPDATE ON {TABLE} BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.member_id;
+        INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.member_id, new.content);
+    END""",
+]
+
+SQLITE_DROP = [
+    f"DROP TRIGGER IF EXISTS {TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'mysql':
+        schema_editor.execute(f"ALTER TABLE {TABLE} ADD FULLTEXT INDEX member_search_content_ft (content)")
+    elif vendor == 'sqlite':
+        for sql in SQLITE_CREATE:
+            schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'mysql':
+        schema_editor.execute(f"ALTER TABLE {TABLE} DROP INDEX member_search_content_ft")
+    elif vendor == 'sqlite':
+        for sql in SQLITE_DROP:
+            schema_editor.execute(sql)
+
+
+def build_documents(apps, schema_editor):
+    Member = apps.get_model('website', 'Member')
+    MemberSearchDocument = apps.get_model('website', 'MemberSearchDocument')
+    members = Member.objects.select_related('user_profile').prefetch_related('specialties', 'research_interest_areas')
+    documents = []
+    for member in members.iterator(chunk_size=500):
+        parts = [
+            member.user_profile.name if member.user_profile else '',
+            member.institution,
+            member.position,
+            *(specialty.name for specialty in member.specialties.all()),
+            *(area.name for area in member.research_interest_areas.all()),
+        ]
+        documents.append(MemberSearchDocument(member=member, content=' '.join(p for p in parts if p).lower()))
+    MemberSearchDocument.objects.bulk_create(documents, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0002_remove_member_location_remove_member_name_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberSearchDocument',
+            fields=[
+                ('member', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='website.member')),
+                ('content', website.fields.SearchTextField(blank=True, default='')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(build_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-18 06:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0003_membersearchdocument'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resourceitem',
+            index=models.Index(fields=['category', 'order'], name='resource_category_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resourceitem',
+            index=models.Index(fields=['resource_type', 'order'], name='resource_type_order_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.4 on 2026-10-18 06:56
+
+from django.db import migrations, models
+
+from registration.video_utils import parse_youtube_id
+
+
+def fill_video_ids(apps, schema_editor):
+    Webinar = apps.get_model('website', 'Webinar')
+    webinars = list(Webinar.objects.only('video_url'))
+    for webinar in webinars:
+        webinar.video_id = parse_youtube_id(webinar.video_url)
+    Webinar.objects.bulk_update(webinars, ['video_id'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0005_searchdocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webinar',
+            name='video_id',
+            field=models.CharField(blank=True, default='', editable=False, max_length=11),
+        ),
+        migrations.RunPython(fill_video_ids, migrations.RunPython.noop),
+    ]
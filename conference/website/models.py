@@ -1,6 +1,10 @@
 from django.db import models
 from django.utils import timezone
 
+from registration.video_utils import parse_youtube_id, youtube_embed_url, youtube_thumbnail_url
+
+from .fields import SearchTextField
+
 
 class SiteSettings(models.Model):
     site_name = models.CharField(max_length=255, default='BSBCS')
@@ -332,6 +336,11 @@ class ResourceItem(models.Model):
 
     class Meta:
         ordering = ['order']
+        indexes = [
+            # Knowledge center library filters, read in display order
+            models.Index(fields=['category', 'order'], name='resource_category_order_idx'),
+            models.Index(fields=['resource_type', 'order'], name='resource_type_order_idx'),
+        ]
 
 
 class Panelist(models.Model):
@@ -362,12 +371,26 @@ class Webinar(models.Model):
     recorded_date = models.DateField(blank=True, null=True)
     duration = models.DurationField(blank=True, null=True)
     video_url = models.URLField(blank=True, null=True)
+    # YouTube ID parsed from video_url on save, for the thumbnail and player
+    video_id = models.CharField(max_length=11, blank=True, default='', editable=False)
     slides_url = models.URLField(blank=True, null=True)
     international_panel = models.ManyToManyField(Panelist, blank=True, related_name='international_panel_webinars')
     national_panel = models.ManyToManyField(Panelist, blank=True, related_name='national_panel_webinars')
     moderators = models.ManyToManyField(Panelist, blank=True, related_name='moderated_webinars')
     order = models.PositiveIntegerField(default=0)
 
+    def save(self, *args, **kwargs):
+        self.video_id = parse_youtube_id(self.video_url)
+        super().save(*args, **kwargs)
+
+    @property
+    def video_thumbnail_url(self):
+        return youtube_thumbnail_url(self.video_id) if self.video_id else ''
+
+    @property
+    def video_embed_url(self):
+        return youtube_embed_url(self.video_id) if self.video_id else ''
+
     def __str__(self):
         return self.title
 
@@ -421,6 +444,45 @@ class Member(models.Model):
         ordering = ['order']
 
 
+class MemberSearchDocument(models.Model):
+    """Denormalized search text of a Member (name, institution, position,
+    specialties and research areas), kept up to date by website.member_search."""
+    member = models.OneToOneField(Member, on_delete=models.CASCADE, primary_key=True, related_name='search_document')
+    content = SearchTextField(blank=True, default='')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Search document for member {self.member_id}"  # type: ignore
+
+
+class SearchDocument(models.Model):
+    """One entry of the site-wide search index, maintained by website.search."""
+    KIND_CHOICES = [
+        ('event', 'Event'),
+        ('publication', 'Publication'),
+        ('webinar', 'Webinar'),
+        ('resource', 'Resource'),
+        ('research', 'Research'),
+        ('member', 'Member'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=500)
+    url = models.CharField(max_length=500)
+    summary = models.TextField(blank=True, default='')
+    content = SearchTextField(blank=True, default='')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.title}"  # type: ignore
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='search_document_kind_object_uniq'),
+        ]
+
+
 class Tag(models.Model):
     name = models.CharField(max_length=100, unique=True)
 
@@ -0,0 +1,301 @@
+"""Site-wide search.
+
+Events, published abstracts, webinars, resources, research highlights and
+approved members each get one SearchDocument row with the title, link and
+summary shown in results, and a lowercase ``content`` column behind the
+full-text (inverted) index of website.fields. A search is one indexed
+lookup on that table, ranked by relevance.
+
+Documents are rebuilt after the transaction commits when a source row is
+saved or deleted; member documents follow the member search documents of
+website.member_search. ``python manage.py rebuild_search_index`` rebuilds
+the whole index.
+"""
+
+import re
+from collections import namedtuple
+from urllib.parse import urlencode
+
+from django.apps import apps
+from django.core.paginator import Page
+from django.db import connection, transaction
+from django.db.models import Count
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import escape, format_html
+from django.utils.safestring import mark_safe
+
+from .fields import SearchRank, search_terms
+from .models import SearchDocument
+from .webinars import CountedPaginator
+
+SEARCH_PAGE_SIZE = 20
+
+# Characters of the stored summary and of the highlighted snippet
+SUMMARY_LENGTH = 500
+SNIPPET_LENGTH = 240
+
+REBUILD_BATCH_SIZE = 500
+
+SearchSource = namedtuple('SearchSource', ['model', 'queryset', 'build'])
+
+
+def _text(*parts):
+    return ' '.join(str(part) for part in parts if part)
+
+
+def _event_document(event):
+    return {
+        'title': f"{event.name} {event.year}",
+        'url': event.get_absolute_url(),
+        'summary': event.description or event.slogan or '',
+        'content': _text(event.name, event.year, event.slogan, event.location, event.description, event.keywords),
+    }
+
+
+def _publication_document(abstract):
+    return {
+        'title': abstract.title,
+        'url': reverse('registration:publication_detail', args=[abstract.event_id, abstract.pk]),
+        'summary': _text(abstract.authors, '-', abstract.introduction),
+        'content': _text(
+            abstract.title, abstract.authors, abstract.institution, abstract.introduction,
+            abstract.methods, abstract.results, abstract.conclusion,
+        ),
+    }
+
+
+def _webinar_document(webinar):
+    return {
+        'title': webinar.title,
+        'url': reverse('website:webinar_detail', args=[webinar.pk]),
+        'summary': webinar.description or '',
+        'content': _text(webinar.title, webinar.get_type_display(), webinar.presenter_name, webinar.description),
+    }
+
+
+def _resource_document(resource):
+    if resource.external_link:
+        url = resource.external_link
+    elif resource.file_upload:
+        url = resource.file_upload.url
+    else:
+        url = reverse('website:knowledge_center')
+        if resource.category:
+            url += '?' + urlencode({'category': resource.category.slug})
+    return {
+        'title': resource.title,
+        'url': url,
+        'summary': resource.description or '',
+        'content': _text(
+            resource.title, resource.get_resource_type_display(),
+            resource.category.name if resource.category else '', resource.description,
+        ),
+    }
+
+
+def _research_document(highlight):
+    return {
+        'title': highlight.title,
+        'url': highlight.journal_link or reverse('website:research_and_publications'),
+        'summary': highlight.description or '',
+        'content': _text(highlight.title, highlight.lead_researcher_name, highlight.journal_name, highlight.description),
+    }
+
+
+def _member_document(member):
+    from .member_search import build_search_content
+
+    name = member.user_profile.name if member.user_profile else ''
+    return {
+        'title': name,
+        'url': reverse('website:member_directory') + '?' + urlencode({'q': name}),
+        'summary': _text(member.position, member.institution),
+        'content': build_search_content(member),
+    }
+
+
+# Indexed models by SearchDocument kind: label, indexable rows, document builder
+SEARCH_SOURCES = {
+    'event': SearchSource('registration.Event', lambda qs: qs, _event_document),
+    'publication': SearchSource(
+        'registration.AbstractSubmission', lambda qs: qs.filter(is_published=True), _publication_document
+    ),
+    'webinar': SearchSource('website.Webinar', lambda qs: qs, _webinar_document),
+    'resource': SearchSource('website.ResourceItem', lambda qs: qs.select_related('category'), _resource_document),
+    'research': SearchSource('website.ResearchHighlight', lambda qs: qs, _research_document),
+    'member': SearchSource(
+        'website.Member',
+        lambda qs: qs.filter(approval_status='approved').select_related('user_profile').prefetch_related(
+            'specialties', 'research_interest_areas'
+        ),
+        _member_document,
+    ),
+}
+
+
+def _write_documents(documents):
+    # MySQL upserts on any unique key and takes no target columns
+    unique_fields = ['kind', 'object_id'] if connection.features.supports_update_conflicts_with_target else None
+    SearchDocument.objects.bulk_create(
+        documents, update_conflicts=True, unique_fields=unique_fields,
+        update_fields=['title', 'url', 'summary', 'content', 'updated_at'],
+    )
+
+
+def index_objects(kind, object_ids=None):
+    """Rebuild the documents of some objects of a kind, or of all of them.
+
+    Documents of objects that were deleted or are no longer indexable (e.g.
+    an abstract that lost its approval) are removed. Returns the number of
+    documents written.
+    """
+    source = SEARCH_SOURCES[kind]
+    objects = source.queryset(apps.get_model(source.model).objects.all()).order_by('pk')
+    if object_ids is not None:
+        objects = objects.filter(pk__in=object_ids)
+
+    started = timezone.now()
+    indexed = set()
+    batch = []
+    for obj in objects.iterator(chunk_size=REBUILD_BATCH_SIZE):
+        document = source.build(obj)
+        batch.append(SearchDocument(
+            kind=kind,
+            object_id=obj.pk,
+            title=document['title'][:500],
+            url=document['url'][:500],
+            summary=document['summary'][:SUMMARY_LENGTH],
+            # Repeat the title so its words weigh more in the rank
+            content=f"{document['title']} {document['content']}".lower(),
+        ))
+        indexed.add(obj.pk)
+        if len(batch) == REBUILD_BATCH_SIZE:
+            _write_documents(batch)
+            batch = []
+    if batch:
+        _write_documents(batch)
+
+    stale = SearchDocument.objects.filter(kind=kind)
+    if object_ids is not None:
+        stale.filter(object_id__in=object_ids).exclude(object_id__in=indexed).delete()
+    else:
+        # Every current document was rewritten above
+        stale.filter(updated_at__lt=started).delete()
+    return len(indexed)
+
+
+def rebuild_search_index(kinds=None):
+    """Rebuild the documents of every kind (or the given ones); returns counts per kind."""
+    return {kind: index_objects(kind) for kind in (kinds or SEARCH_SOURCES)}
+
+
+def schedule_index(kind, object_ids):
+    """Rebuild the documents of some objects once the current transaction commits."""
+    object_ids = list(object_ids)
+    if object_ids:
+        transaction.on_commit(lambda: index_objects(kind, object_ids))
+
+
+def highlight(text, terms):
+    """Escape ``text`` and wrap words starting with one of ``terms`` in <mark>."""
+    if not terms:
+        return escape(text)
+    pattern = re.compile(r'\b(?:' + '|'.join(re.escape(term) for term in terms) + r')\w*', re.IGNORECASE)
+    parts = []
+    last = 0
+    for match in pattern.finditer(text):
+        parts.append(escape(text[last:match.start()]))
+        parts.append(format_html('<mark>{}</mark>', match.group(0)))
+        last = match.end()
+    parts.append(escape(text[last:]))
+    return mark_safe(''.join(parts))
+
+
+def snippet(text, terms):
+    """Cut ``text`` to SNIPPET_LENGTH characters around the first matching term."""
+    if len(text) <= SNIPPET_LENGTH:
+        return text
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in terms]
+    first = min((position for position in positions if position >= 0), default=0)
+    start = max(first - SNIPPET_LENGTH // 4, 0)
+    cut = text[start:start + SNIPPET_LENGTH].strip()
+    return f"{'…' if start else ''}{cut}{'…' if start + SNIPPET_LENGTH < len(text) else ''}"
+
+
+def search_site(query, kind='', page=None):
+    """Return one page of ranked, highlighted results and per-kind counts."""
+    terms = search_terms(query)
+    kinds = dict(SearchDocument.KIND_CHOICES)
+    if kind not in kinds:
+        kind = ''
+    if not terms:
+        return {'query': query, 'kind': kind, 'results': [], 'page_obj': None, 'kind_counts': [], 'total': 0}
+
+    matches = SearchDocument.objects.filter(content__search=query)
+    counts = dict(matches.order_by().values_list('kind').annotate(total=Count('id')))
+    if kind:
+        matches = matches.filter(kind=kind)
+    matches = matches.annotate(rank=SearchRank('content', query)).defer('content').order_by('-rank', '-updated_at', 'id')
+
+    # The per-kind counts already give the total, so paginating needs no COUNT
+    total = sum(counts.values())
+    paginator = CountedPaginator(counts.get(kind, 0) if kind else total, SEARCH_PAGE_SIZE)
+    number = paginator.get_page(page).number
+    offset = (number - 1) * SEARCH_PAGE_SIZE
+    page_obj = Page(list(matches[offset:offset + SEARCH_PAGE_SIZE]), number, paginator)
+    results = [
+        {
+            'kind': document.kind,
+            'kind_label': kinds[document.kind],
+            'url': document.url,
+            'title': highlight(document.title, terms),
+            'snippet': highlight(snippet(document.summary, terms), terms),
+        }
+        for document in page_obj.object_list
+    ]
+    return {
+        'query': query,
+        'kind': kind,
+        'results': results,
+        'page_obj': page_obj,
+        'kind_counts': [(value, label, counts[value]) for value, label in SearchDocument.KIND_CHOICES if counts.get(value)],
+        'total': total,
+    }
+
+
+# Signal handlers ------------------------------------------------------------#
+
+def _index_for_instance(sender, instance, **kwargs):
+    schedule_index(_SENDER_KINDS[sender], [instance.pk])
+
+
+_SENDER_KINDS = {}
+
+
+def _index_for_category(sender, instance, **kwargs):
+    # Resource documents hold the category name and slug. Called on save and
+    # before delete, since SET_NULL then updates the resources without signals
+    schedule_index('resource', instance.resources.values_list('pk', flat=True))
+
+
+def connect_search_signals():
+    """Keep search documents in sync with their source rows.
+
+    Members are indexed from website.member_search, which already follows
+    their profile, M2M links and specialty names; only deletions are
+    handled here. Resources are also reindexed when their category changes.
+    """
+    for kind, source in SEARCH_SOURCES.items():
+        model = apps.get_model(source.model)
+        _SENDER_KINDS[model] = kind
+        uid = f'site_search_{kind}'
+        if kind != 'member':
+            post_save.connect(_index_for_instance, sender=model, dispatch_uid=f'{uid}_save')
+        post_delete.connect(_index_for_instance, sender=model, dispatch_uid=f'{uid}_delete')
+
+    ResourceCategory = apps.get_model('website.ResourceCategory')
+    post_save.connect(_index_for_category, sender=ResourceCategory, dispatch_uid='site_search_resource_category_save')
+    pre_delete.connect(_index_for_category, sender=ResourceCategory, dispatch_uid='site_search_resource_category_delete')
@@ -94,15 +94,4 @@ def send_member_approval_email(sender, instance, created, update_fields, **kwarg
         )
         logger.info(f"[MEMBER SIGNAL] Email sent successfully to {user_email}")
     except Exception as e:
-        logger.error(f"[MEMBER SIGNAL] Failed to send email to {user_email}: {str(e)}", exc_info=True)
-        # Print to console for debugging (no unicode to avoid cp1252 encoding issues on Windows)
-        import traceback
-        print("\n" + "="*60)
-        print("!!! EMAIL SEND ERROR !!!")
-        print("="*60)
-        print(f"Error: {str(e)}")
-        print(f"Template: {template_name}")
-        print(f"Email: {user_email}")
-        print("="*60)
-        print(traceback.format_exc())
-        print("="*60 + "\n")
+        logger.error(f"[MEMBER SIGNAL] Failed to send email to {user_email} with {template_name}: {str(e)}", exc_info=True)
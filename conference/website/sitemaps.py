@@ -0,0 +1,170 @@
+"""Pre-generated XML sitemaps and HTML sitemap table.
+
+``/sitemap.xml`` is a sitemap index pointing to one sitemap per section,
+split into pages of ``SITEMAP_PAGE_SIZE`` URLs for large sections. Each
+rendered section page, the index and the rows of the HTML sitemap table
+are cached under the version tokens of the models they list, so a content
+change only regenerates the sections that show that model and crawlers
+are served from the cache. ``python manage.py generate_sitemaps`` renders
+everything ahead of time, e.g. after a deploy.
+"""
+
+import hashlib
+
+from django.contrib.sitemaps import views as sitemap_views
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.views.decorators.http import condition
+
+from registration.caching import version_timestamp
+from registration.sitemaps import (
+    EventSitemap,
+    StaticViewSitemap,
+    PublicationSitemap,
+    WebsiteStaticSitemap,
+    WebinarSitemap,
+)
+
+from .caching import get_tag_versions
+
+SITEMAPS = {
+    'events': EventSitemap,
+    'static': StaticViewSitemap,
+    'publications': PublicationSitemap,
+    'website': WebsiteStaticSitemap,
+    'webinars': WebinarSitemap,
+}
+
+# Models listed by each section. Exporting or deleting an event snapshot
+# bumps the Event tag, since it moves the event's URLs
+SITEMAP_SECTION_TAGS = {
+    'events': ('registration.Event',),
+    'static': ('registration.Event',),
+    'publications': ('registration.Event', 'registration.AbstractSubmission'),
+    'website': (),
+    'webinars': ('website.Webinar',),
+}
+
+# Keyed by versions, so the timeout only bounds memory use
+SITEMAP_TIMEOUT = 60 * 60 * 24
+
+# Order of the sections in the HTML sitemap table
+TABLE_SECTIONS = ('website', 'events', 'webinars', 'publications', 'static')
+
+# Friendly titles for well-known static names
+STATIC_TITLES = {
+    'website:homepage': 'Home',
+    'website:about': 'About',
+    'website:member_directory': 'Members',
+    'website:research_and_publications': 'Research & Publications',
+    'website:knowledge_center': 'Resources',
+    'website:events': 'Events',
+    'website:webinars': 'Webinars',
+}
+
+
+def _section_versions(sections):
+    tags = sorted({tag for section in sections for tag in SITEMAP_SECTION_TAGS[section]})
+    versions = dict(zip(tags, get_tag_versions(tags)))
+    return {section: [versions[tag] for tag in SITEMAP_SECTION_TAGS[section]] for section in sections}
+
+
+def get_sitemap_version(sections=None):
+    """Return a token covering the given sections (default: all of them)."""
+    versions = _section_versions(sections or tuple(SITEMAPS))
+    raw = '|'.join(f"{section}:{'-'.join(map(str, tokens))}" for section, tokens in versions.items())
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def _latest_token(sections=None):
+    tokens = [token for values in _section_versions(sections or tuple(SITEMAPS)).values() for token in values]
+    return max(tokens) if tokens else None
+
+
+def _cached_xml(request, key, render):
+    # Entries depend on the host the absolute URLs are built from
+    key = f"{key}_{hashlib.md5(request.build_absolute_uri('/').encode()).hexdigest()}"
+    cached = cache.get(key)
+    if cached is None:
+        response = render()
+        response.render()
+        if response.status_code != 200:
+            return response
+        cached = (response.content, response['Content-Type'])
+        cache.set(key, cached, SITEMAP_TIMEOUT)
+    content, content_type = cached
+    return HttpResponse(content, content_type=content_type, headers={'X-Robots-Tag': 'noindex, noodp, noarchive'})
+
+
+def _section_etag(request, section=None, **kwargs):
+    sections = (section,) if section in SITEMAPS else None
+    return f'"sitemap-{section or "index"}-{get_sitemap_version(sections)}-{request.GET.get("p", 1)}"'
+
+
+def _section_last_modified(request, section=None, **kwargs):
+    latest = _latest_token((section,) if section in SITEMAPS else None)
+    return version_timestamp(latest) if latest else None
+
+
+@condition(etag_func=_section_etag, last_modified_func=_section_last_modified)
+def sitemap_index(request):
+    """Serve the cached sitemap index."""
+    key = f'sitemap_index_{get_sitemap_version()}'
+    return _cached_xml(
+        request, key,
+        lambda: sitemap_views.index(request, SITEMAPS, sitemap_url_name='sitemap_section'),
+    )
+
+
+@condition(etag_func=_section_etag, last_modified_func=_section_last_modified)
+def sitemap_section(request, section):
+    """Serve one cached page of a sitemap section."""
+    if section not in SITEMAPS:
+        # Let the sitemap view raise its usual 404
+        return sitemap_views.sitemap(request, SITEMAPS, section=section)
+    page = request.GET.get('p', '1')
+    key = f'sitemap_{section}_{get_sitemap_version((section,))}_{hashlib.md5(page.encode()).hexdigest()}'
+    return _cached_xml(request, key, lambda: sitemap_views.sitemap(request, SITEMAPS, section=section))
+
+
+def _row_title(item):
+    # Named URL of a static page
+    if isinstance(item, str):
+        return STATIC_TITLES.get(item, item.replace('website:', '').replace('_', ' ').title())
+    # StaticViewSitemap entry: (url name, event id, updated_at)
+    if isinstance(item, (list, tuple)):
+        return f"{item[0].replace('_', ' ').title()} (Event {item[1]})"
+    # Model instances: try common fields
+    return getattr(item, 'title', None) or getattr(item, 'name', None) or str(item)
+
+
+def build_sitemap_rows():
+    """Query every sitemap section and return the rows of the HTML table.
+
+    Columns: URL, Title, Last modified, Changefreq, Priority.
+    """
+    rows = []
+    for section in TABLE_SECTIONS:
+        sm = SITEMAPS[section]()
+        changefreq = getattr(sm, 'changefreq', '')
+        priority = getattr(sm, 'priority', '')
+        lastmod = getattr(sm, 'lastmod', None)
+        for item in sm.items():
+            rows.append({
+                'loc': sm.location(item),
+                'title': _row_title(item),
+                'lastmod': lastmod(item) if callable(lastmod) else None,
+                'changefreq': changefreq,
+                'priority': priority,
+            })
+    return rows
+
+
+def get_sitemap_rows():
+    """Return the cached rows of the HTML sitemap table."""
+    key = f'sitemap_rows_{get_sitemap_version()}'
+    rows = cache.get(key)
+    if rows is None:
+        rows = build_sitemap_rows()
+        cache.set(key, rows, SITEMAP_TIMEOUT)
+    return rows
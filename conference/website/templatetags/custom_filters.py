@@ -1,5 +1,6 @@
 from django import template
-import re
+
+from registration.video_utils import parse_youtube_id
 
 register = template.Library()
 
@@ -7,22 +8,4 @@ register = template.Library()
 @register.filter
 def extract_youtube_id(url):
     """Extract YouTube video ID from various URL formats."""
-    if not url:
-        return None
-    
-    # Handle youtu.be format
-    match = re.search(r'youtu\.be/([^?&]+)', url)
-    if match:
-        return match.group(1)
-    
-    # Handle youtube.com format
-    match = re.search(r'youtube\.com/watch\?v=([^&]+)', url)
-    if match:
-        return match.group(1)
-    
-    # Handle youtube.com/embed format
-    match = re.search(r'youtube\.com/embed/([^?&]+)', url)
-    if match:
-        return match.group(1)
-    
-    return None
+    return parse_youtube_id(url) or None
@@ -1,28 +1,38 @@
 from django import template
 from django.urls import reverse, NoReverseMatch
 from django.core.cache import cache
-import re
 
 from website.models import SiteSettings, NavigationLink, HeroSection, CallToAction
+from website.caching import get_content_generation
+from registration.video_utils import parse_youtube_id, youtube_thumbnail_url
 
 register = template.Library()
 
-# Cache timeout (in seconds): 1 hour
-CACHE_TIMEOUT = 3600
+# Keys embed the content generation, which changes on every website model
+# save/delete; keyed by version, so the timeout only bounds memory use
+CACHE_TIMEOUT = 60 * 60 * 24
+
+# Distinguishes a cached None (no such row) from a cache miss
+_MISSING = object()
+
+
+def _cache_key(name):
+    return f'site_tags_g{get_content_generation()}_{name}'
 
 
 @register.simple_tag
 def get_site_settings():
     """Return the first SiteSettings instance or None.
     
-    Results are cached for 1 hour to reduce database queries.
+    Results are cached until the website content changes.
     """
-    cached = cache.get('site_settings')
-    if cached is not None:
+    cache_key = _cache_key('site_settings')
+    cached = cache.get(cache_key, _MISSING)
+    if cached is not _MISSING:
         return cached
     
     settings = SiteSettings.objects.first()
-    cache.set('site_settings', settings, CACHE_TIMEOUT)
+    cache.set(cache_key, settings, CACHE_TIMEOUT)
     return settings
 
 
@@ -31,9 +41,10 @@ def get_navigation_links():
     """Return a list of navigation link dicts: {'label':..., 'url':...}.
 
     This resolves URL names when possible and falls back to the stored value.
-    Results are cached for 1 hour to reduce database queries.
+    Results are cached until the website content changes.
     """
-    cached = cache.get('navigation_links')
+    cache_key = _cache_key('navigation_links')
+    cached = cache.get(cache_key)
     if cached is not None:
         return cached
     
@@ -46,7 +57,7 @@ def get_navigation_links():
             url = nav.url_name
         navs.append({'label': nav.label, 'url': url})
     
-    cache.set('navigation_links', navs, CACHE_TIMEOUT)
+    cache.set(cache_key, navs, CACHE_TIMEOUT)
     return navs
 
 
@@ -54,11 +65,11 @@ def get_navigation_links():
 def get_hero_section(page_name):
     """Return the HeroSection instance for a specific page.
     
-    Results are cached for 1 hour to reduce database queries.
+    Results are cached until the website content changes.
     """
-    cache_key = f'hero_section_{page_name}'
-    cached = cache.get(cache_key)
-    if cached is not None:
+    cache_key = _cache_key(f'hero_section_{page_name}')
+    cached = cache.get(cache_key, _MISSING)
+    if cached is not _MISSING:
         return cached
     
     hero = HeroSection.objects.filter(page=page_name).first()
@@ -70,11 +81,11 @@ def get_hero_section(page_name):
 def get_call_to_action(page_name):
     """Return the CallToAction instance for a specific page.
     
-    Results are cached for 1 hour to reduce database queries.
+    Results are cached until the website content changes.
     """
-    cache_key = f'call_to_action_{page_name}'
-    cached = cache.get(cache_key)
-    if cached is not None:
+    cache_key = _cache_key(f'call_to_action_{page_name}')
+    cached = cache.get(cache_key, _MISSING)
+    if cached is not _MISSING:
         return cached
     
     cta = CallToAction.objects.filter(page=page_name).first()
@@ -89,7 +100,8 @@ def get_call_to_action_current(context):
 
     This tag requires request to be available in the template context (Django
     provides it when you use RequestContext or render shortcuts which pass
-    the request). Results are cached per view name for CACHE_TIMEOUT seconds.
+    the request). Results are cached per view name until the website
+    content changes.
     
     Aliases like 'homepage_alias' are normalized to their primary names ('homepage')
     to ensure consistent CTA rendering across aliased routes.
@@ -107,9 +119,9 @@ def get_call_to_action_current(context):
     if page_name == 'homepage_alias':
         page_name = 'homepage'
 
-    cache_key = f'call_to_action_current_{page_name or "__latest"}'
-    cached = cache.get(cache_key)
-    if cached is not None:
+    cache_key = _cache_key(f'call_to_action_current_{page_name or "__latest"}')
+    cached = cache.get(cache_key, _MISSING)
+    if cached is not _MISSING:
         return cached
 
     cta = None
@@ -126,50 +138,19 @@ def get_call_to_action_current(context):
 
 @register.filter
 def extract_youtube_id(url):
-    """Extract YouTube video ID from various URL formats."""
-    if not url:
-        return None
-    
-    url = url.strip()
-    
-    # Handle youtu.be format
-    match = re.search(r'youtu\.be/([^?&\s]+)', url)
-    if match:
-        return match.group(1)
-    
-    # Handle youtube.com/watch?v= format
-    match = re.search(r'youtube\.com/watch\?.*v=([^&\s]+)', url)
-    if match:
-        return match.group(1)
-    
-    # Handle youtube.com/embed/ format
-    match = re.search(r'youtube\.com/embed/([^?&\s]+)', url)
-    if match:
-        return match.group(1)
-    
-    # Handle youtube.com/v/ format (old)
-    match = re.search(r'youtube\.com/v/([^?&\s]+)', url)
-    if match:
-        return match.group(1)
-    
-    # Handle full embed URLs (youtube.com/embed/{id})
-    match = re.search(r'(?:youtube\.com/)?embed/([^?&\s]+)', url)
-    if match:
-        return match.group(1)
-    
-    # Handle direct video ID (11 chars, alphanumeric with - and _)
-    match = re.search(r'^([a-zA-Z0-9_-]{11})$', url)
-    if match:
-        return match.group(1)
-    
-    return None
+    """Extract YouTube video ID from various URL formats.
+
+    Webinars and event videos store their ID on save (``video_id``); this
+    is for links that are not stored that way.
+    """
+    return parse_youtube_id(url) or None
 
 
 @register.filter
 def youtube_thumbnail(url):
     """Extract YouTube video ID and return thumbnail URL."""
-    video_id = extract_youtube_id(url)
+    video_id = parse_youtube_id(url)
     if video_id:
         # Use medium quality thumbnail (320x180)
-        return f'https://img.youtube.com/vi/{video_id}/mqdefault.jpg'
+        return youtube_thumbnail_url(video_id)
     return None
@@ -1,3 +1,444 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from registration.models import AbstractSubmission, UserProfile
+from registration.tests import CacheTestCase, approve_abstracts_for_poster, make_abstract, make_event
+
+from .about import get_about_page
+from .caching import get_content_generation
+from .models import (
+    Member, NavigationLink, NewsTickerItem, OrganizationalValue, Panelist, ResourceCategory, ResourceItem,
+    SearchDocument, SiteSettings, Speciality, Webinar,
+)
+from .knowledge_center import get_resource_facets, get_resource_page
+from .member_search import search_members
+from .search import index_objects, rebuild_search_index, search_site
+from .templatetags.site_tags import get_navigation_links, get_site_settings
+from .webinars import get_webinar_detail, get_webinar_pages
+
+
+def make_member(name, approval_status='approved', **kwargs):
+    user = User.objects.create_user(name.lower().replace(' ', '_'))
+    profile = UserProfile.objects.create(
+        user=user, name=name, email=f'{user.username}@example.com', phone=f'0171{user.pk:07d}',
+    )
+    return Member.objects.create(user_profile=profile, approval_status=approval_status, **kwargs)
+
+
+class ConditionalSitePageTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('website:about')
+
+    def test_unchanged_page_answers_304_without_queries(self):
+        response = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_website_content_changes_answer_200(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            NewsTickerItem.objects.create(text='Registration is open')
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_profile_changes_answer_200_and_keep_the_generation(self):
+        member = make_member('Dr. Rahman')
+        etag = self.client.get(self.url)['ETag']
+        generation = get_content_generation()
+        member.user_profile.name = 'Dr. Karim'
+        with self.captureOnCommitCallbacks(execute=True):
+            member.user_profile.save()
+        self.assertEqual(get_content_generation(), generation)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_event_changes_answer_200(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            make_event()
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class SitePageCacheTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('website:homepage')
+
+    def test_anonymous_page_is_served_from_the_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_changes_to_a_displayed_model_refresh_the_page(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            NewsTickerItem.objects.create(text='Registration is open')
+        self.assertContains(self.client.get(self.url), 'Registration is open')
+
+    def test_external_models_refresh_only_the_pages_showing_them(self):
+        profile = make_member('Dr. Rahman').user_profile
+        about_url = reverse('website:about')
+        self.client.get(about_url)
+        profile.name = 'Dr. Karim'
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+        with self.assertNumQueries(0):
+            self.client.get(about_url)
+        self.assertContains(self.client.get(reverse('website:member_directory')), 'Dr. Karim')
+
+    def test_changes_to_other_models_keep_the_page(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Webinar.objects.create(title='Imaging update')
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+    def test_logged_in_users_bypass_the_cache(self):
+        self.client.get(self.url)
+        self.client.force_login(User.objects.create_user('member'))
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        self.assertTrue(any('website_newstickeritem' in query['sql'] for query in queries))
+
+
+class AboutPageTests(CacheTestCase):
+    def add_value(self, title, description, value_type='value', order=0):
+        with self.captureOnCommitCallbacks(execute=True):
+            return OrganizationalValue.objects.create(
+                value_type=value_type, title=title, description=description, order=order,
+            )
+
+    def test_context_is_compiled_once(self):
+        get_about_page()
+        with self.assertNumQueries(0):
+            get_about_page()
+
+    def test_single_value_row_is_split_into_items(self):
+        self.add_value('Our Values', 'Compassion; Integrity; Excellence')
+        context = get_about_page()
+        self.assertEqual(context['values_items'], ['Compassion', 'Integrity', 'Excellence'])
+        self.assertEqual(context['values_header_title'], 'Our Values')
+
+    def test_value_rows_are_listed_in_order(self):
+        self.add_value('Integrity', 'Acting honestly', order=2)
+        self.add_value('Compassion', 'Caring for patients', order=1)
+        self.assertEqual(get_about_page()['values_items'], ['Compassion', 'Integrity'])
+
+    def test_changes_recompile_the_context(self):
+        get_about_page()
+        mission = self.add_value('Mission', 'Early detection for all', value_type='mission')
+        self.assertEqual(get_about_page()['mission'], mission)
+
+    def test_unrelated_changes_keep_the_context(self):
+        get_about_page()
+        with self.captureOnCommitCallbacks(execute=True):
+            Webinar.objects.create(title='Imaging update')
+        with self.assertNumQueries(0):
+            get_about_page()
+
+
+class SiteTagsTests(CacheTestCase):
+    def test_missing_settings_are_cached(self):
+        self.assertIsNone(get_site_settings())
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_site_settings())
+
+    def test_content_changes_refresh_the_tags(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            NavigationLink.objects.create(label='Events', url_name='website:events')
+        self.assertEqual(get_navigation_links(), [{'label': 'Events', 'url': reverse('website:events')}])
+        with self.captureOnCommitCallbacks(execute=True):
+            SiteSettings.objects.create(site_name='BSBCS')
+        with self.assertNumQueries(1):
+            get_navigation_links()
+        self.assertEqual(get_site_settings().site_name, 'BSBCS')
+
+    def test_generation_is_shared_by_every_website_model(self):
+        generation = get_content_generation()
+        with self.captureOnCommitCallbacks(execute=True):
+            Webinar.objects.create(title='Imaging update')
+        self.assertNotEqual(get_content_generation(), generation)
+
+
+class MemberDirectoryTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('website:member_directory_results')
+
+    def names(self, response):
+        return [member.user_profile.name for member in response.context['members']]
+
+    def test_only_approved_members_are_listed(self):
+        make_member('Dr. Approved')
+        make_member('Dr. Pending', approval_status='pending')
+        self.assertEqual(self.names(self.client.get(self.url)), ['Dr. Approved'])
+
+    def test_filters_by_specialty(self):
+        oncology = Speciality.objects.create(name='Oncology')
+        make_member('Dr. Surgeon')
+        make_member('Dr. Oncologist').specialties.add(oncology)
+        response = self.client.get(self.url, {'specialty': oncology.id})
+        self.assertEqual(self.names(response), ['Dr. Oncologist'])
+
+    @mock.patch('website.views.MEMBER_PAGE_SIZE', 2)
+    def test_later_pages_return_only_the_cards(self):
+        for name in ('Dr. C', 'Dr. A', 'Dr. B'):
+            make_member(name)
+        first = self.client.get(self.url, {'sort': 'name'})
+        self.assertEqual(self.names(first), ['Dr. A', 'Dr. B'])
+        self.assertTemplateUsed(first, 'partials/member_results.html')
+        second = self.client.get(self.url, {'sort': 'name', 'page': 2})
+        self.assertEqual(self.names(second), ['Dr. C'])
+        self.assertTemplateNotUsed(second, 'partials/member_results.html')
+
+    def test_page_is_queried_with_a_fixed_number_of_queries(self):
+        oncology = Speciality.objects.create(name='Oncology')
+        for index in range(3):
+            make_member(f'Dr. {index}').specialties.add(oncology)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(self.url)
+        make_member('Dr. 3').specialties.add(oncology)
+        with CaptureQueriesContext(connection) as more:
+            self.client.get(self.url)
+        self.assertEqual(len(more), len(few))
+
+
+class MemberSearchTests(CacheTestCase):
+    def search(self, query):
+        return [member.user_profile.name for member in search_members(Member.objects.all(), query).order_by('-search_rank')]
+
+    def add_member(self, name, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return make_member(name, **kwargs)
+
+    def test_matches_name_institution_and_specialties(self):
+        member = self.add_member('Dr. Rahman', institution='Dhaka Medical College')
+        with self.captureOnCommitCallbacks(execute=True):
+            member.specialties.add(Speciality.objects.create(name='Radiology'))
+        self.assertEqual(self.search('rahman'), ['Dr. Rahman'])
+        self.assertEqual(self.search('dhaka'), ['Dr. Rahman'])
+        self.assertEqual(self.search('radiology'), ['Dr. Rahman'])
+        self.assertEqual(self.search('surgery'), [])
+
+    def test_renamed_specialty_updates_the_documents(self):
+        specialty = Speciality.objects.create(name='Radiology')
+        member = self.add_member('Dr. Rahman')
+        with self.captureOnCommitCallbacks(execute=True):
+            member.specialties.add(specialty)
+        specialty.name = 'Nuclear medicine'
+        with self.captureOnCommitCallbacks(execute=True):
+            specialty.save()
+        self.assertEqual(self.search('nuclear'), ['Dr. Rahman'])
+        self.assertEqual(self.search('radiology'), [])
+
+    def test_profile_changes_update_the_documents(self):
+        member = self.add_member('Dr. Rahman')
+        member.user_profile.name = 'Dr. Karim'
+        with self.captureOnCommitCallbacks(execute=True):
+            member.user_profile.save()
+        self.assertEqual(self.search('karim'), ['Dr. Karim'])
+
+    def test_rebuild_command_writes_every_document(self):
+        make_member('Dr. Rahman')
+        self.assertEqual(self.search('rahman'), [])
+        call_command('rebuild_member_search', stdout=StringIO())
+        self.assertEqual(self.search('rahman'), ['Dr. Rahman'])
+
+
+class KnowledgeCenterTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.guidelines = ResourceCategory.objects.create(name='Guidelines', slug='guidelines')
+        self.tools = ResourceCategory.objects.create(name='Tools', slug='tools')
+
+    def add_resource(self, title, category, resource_type='guideline', order=0):
+        with self.captureOnCommitCallbacks(execute=True):
+            return ResourceItem.objects.create(title=title, category=category, resource_type=resource_type, order=order)
+
+    def titles(self, params):
+        return [resource.title for resource in get_resource_page(params)['resources']]
+
+    def test_filters_by_category_and_type(self):
+        self.add_resource('Screening guideline', self.guidelines)
+        self.add_resource('Staging calculator', self.tools, resource_type='tool')
+        self.add_resource('Dosing tool', self.guidelines, resource_type='tool')
+        self.assertEqual(self.titles({'category': 'guidelines'}), ['Screening guideline', 'Dosing tool'])
+        self.assertEqual(self.titles({'category': 'guidelines', 'type': 'tool'}), ['Dosing tool'])
+
+    def test_unknown_filters_are_ignored(self):
+        self.add_resource('Screening guideline', self.guidelines)
+        page = get_resource_page({'category': 'missing', 'type': 'video'})
+        self.assertEqual((page['selected_category'], page['selected_type']), ('', ''))
+        self.assertEqual(len(page['resources']), 1)
+
+    @mock.patch('website.knowledge_center.RESOURCE_PAGE_SIZE', 2)
+    def test_resources_are_paginated(self):
+        for index in range(3):
+            self.add_resource(f'Resource {index}', self.guidelines, order=index)
+        self.assertEqual(self.titles({'page': '2'}), ['Resource 2'])
+
+    def test_facet_counts_are_cached_until_a_resource_changes(self):
+        self.add_resource('Screening guideline', self.guidelines)
+        get_resource_facets()
+        with self.assertNumQueries(0):
+            facets = get_resource_facets()
+        self.assertEqual([category['resource_count'] for category in facets['categories']], [1, 0])
+        self.add_resource('Staging calculator', self.tools, resource_type='tool')
+        facets = get_resource_facets()
+        self.assertEqual([category['resource_count'] for category in facets['categories']], [1, 1])
+        self.assertEqual(facets['total'], 2)
+
+    def test_htmx_endpoint_renders_the_library(self):
+        self.add_resource('Screening guideline', self.guidelines)
+        response = self.client.get(reverse('website:knowledge_center_resources'), {'category': 'tools'})
+        self.assertNotContains(response, 'Screening guideline')
+        self.assertTemplateUsed(response, 'partials/resource_library.html')
+
+
+class WebinarTests(CacheTestCase):
+    def add_webinar(self, title, webinar_type='webinar', order=0):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Webinar.objects.create(title=title, type=webinar_type, order=order)
+
+    def titles(self, page):
+        return [webinar.title for webinar in page.object_list]
+
+    @mock.patch('website.webinars.WEBINAR_PAGE_SIZE', 2)
+    def test_every_section_is_paged_in_one_query(self):
+        for index in range(3):
+            self.add_webinar(f'Webinar {index}', order=index)
+        self.add_webinar('Preceptorship', webinar_type='perceptorship')
+        get_webinar_pages({})
+        with self.assertNumQueries(1):
+            pages = get_webinar_pages({'webinars_page': '2'})
+        self.assertEqual(self.titles(pages['webinar']), ['Webinar 2'])
+        self.assertEqual(pages['webinar'].paginator.num_pages, 2)
+        self.assertEqual(self.titles(pages['perceptorship']), ['Preceptorship'])
+        self.assertEqual(self.titles(pages['gci']), [])
+
+    def test_invalid_page_numbers_show_the_first_page(self):
+        self.add_webinar('Webinar')
+        pages = get_webinar_pages({'webinars_page': 'last', 'gci_page': '9'})
+        self.assertEqual(self.titles(pages['webinar']), ['Webinar'])
+        self.assertEqual(pages['gci'].number, 1)
+
+    def test_new_webinars_refresh_the_counts(self):
+        self.add_webinar('First')
+        get_webinar_pages({})
+        self.add_webinar('Second')
+        self.assertEqual(get_webinar_pages({})['webinar'].paginator.count, 2)
+
+    def test_detail_is_cached_with_its_panels(self):
+        webinar = self.add_webinar('Imaging update')
+        with self.captureOnCommitCallbacks(execute=True):
+            webinar.moderators.add(Panelist.objects.create(name='Dr. Rahman'))
+        get_webinar_detail(webinar.pk)
+        with self.assertNumQueries(0):
+            detail = get_webinar_detail(webinar.pk)
+            self.assertEqual([panelist.name for panelist in detail.moderators.all()], ['Dr. Rahman'])
+
+    def test_panelist_changes_refresh_the_detail(self):
+        webinar = self.add_webinar('Imaging update')
+        with self.captureOnCommitCallbacks(execute=True):
+            panelist = Panelist.objects.create(name='Dr. Rahman')
+            webinar.moderators.add(panelist)
+        get_webinar_detail(webinar.pk)
+        panelist.name = 'Dr. Karim'
+        with self.captureOnCommitCallbacks(execute=True):
+            panelist.save()
+        self.assertEqual([p.name for p in get_webinar_detail(webinar.pk).moderators.all()], ['Dr. Karim'])
+
+    def test_missing_webinar_answers_404(self):
+        response = self.client.get(reverse('website:webinar_detail', args=[1]))
+        self.assertEqual(response.status_code, 404)
+
+
+class SitemapTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = make_event()
+        self.user = User.objects.create_user('author', 'author@example.com', 'password')
+        self.url = reverse('sitemap_section', args=['publications'])
+
+    def test_index_lists_the_sections(self):
+        response = self.client.get(reverse('django.contrib.sitemaps.views.sitemap'))
+        self.assertContains(response, 'sitemap-publications.xml')
+
+    def test_unchanged_section_answers_304(self):
+        response = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_bulk_approval_adds_the_publication(self):
+        abstract = make_abstract(self.event, self.user)
+        detail_url = reverse('registration:publication_detail', args=[self.event.id, abstract.id])
+        self.assertNotContains(self.client.get(self.url), detail_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            approve_abstracts_for_poster(abstract)
+        self.assertContains(self.client.get(self.url), detail_url)
+
+
+class SiteSearchTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = make_event(name='Breast Cancer Summit')
+        self.user = User.objects.create_user('author', 'author@example.com', 'password')
+
+    def test_bulk_approval_indexes_the_publication(self):
+        abstract = make_abstract(self.event, self.user, title='Screening outcomes in rural clinics')
+        self.assertEqual(search_site('rural')['total'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            approve_abstracts_for_poster(abstract)
+        results = search_site('rural')['results']
+        self.assertEqual([result['kind'] for result in results], ['publication'])
+        self.assertIn('<mark>', str(results[0]['title']))
+
+    def test_withdrawn_approval_removes_the_publication(self):
+        abstract = make_abstract(self.event, self.user, title='Screening outcomes', approved_for_poster=True)
+        rebuild_search_index(['publication'])
+        abstract.approved_for_poster = False
+        with self.captureOnCommitCallbacks(execute=True):
+            abstract.save()
+        self.assertFalse(SearchDocument.objects.filter(kind='publication', object_id=abstract.pk).exists())
+
+    def test_title_matches_rank_first(self):
+        make_abstract(self.event, self.user, title='Follow-up care', results='Screening rates improved', approved_for_poster=True)
+        make_abstract(self.event, self.user, title='Screening in practice', approved_for_poster=True)
+        rebuild_search_index(['publication'])
+        results = search_site('screening', kind='publication')['results']
+        self.assertEqual(len(results), 2)
+        self.assertIn('Screening in practice', str(results[0]['title']).replace('<mark>', '').replace('</mark>', ''))
+
+    def test_category_changes_reindex_their_resources(self):
+        category = ResourceCategory.objects.create(name='Guidelines', slug='guidelines')
+        resource = ResourceItem.objects.create(title='Screening', category=category, resource_type='guideline')
+        rebuild_search_index(['resource'])
+        category.name, category.slug = 'Protocols', 'protocols'
+        with self.captureOnCommitCallbacks(execute=True):
+            category.save()
+        document = SearchDocument.objects.get(kind='resource', object_id=resource.pk)
+        self.assertEqual(document.url, reverse('website:knowledge_center') + '?category=protocols')
+        self.assertEqual(search_site('protocols')['total'], 1)
+        self.assertEqual(search_site('guidelines')['total'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            category.delete()
+        self.assertEqual(search_site('protocols')['total'], 0)
+        self.assertEqual(search_site('screening')['total'], 1)
+
+    def test_index_writes_leave_the_content_generation(self):
+        abstract = make_abstract(self.event, self.user, approved_for_poster=True)
+        generation = get_content_generation()
+        with self.captureOnCommitCallbacks(execute=True):
+            index_objects('publication')
+            AbstractSubmission.objects.filter(pk=abstract.pk).update(approved_for_poster=False)
+            index_objects('publication', [abstract.pk])
+        self.assertEqual(get_content_generation(), generation)
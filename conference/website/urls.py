@@ -7,7 +7,9 @@ urlpatterns = [
     path('homepage/', views.homepage, name='homepage_alias'),
     path('about/', views.about, name='about'),
     path('knowledge-center/', views.knowledge_center, name='knowledge_center'),
+    path('knowledge-center/resources/', views.knowledge_center_resources, name='knowledge_center_resources'),
     path('member-directory/', views.member_directory, name='member_directory'),
+    path('member-directory/results/', views.member_directory_results, name='member_directory_results'),
     path('membership-form/', views.membership_form, name='membership_form'),
     # Expose events at /events/ and use URL name 'events'
     path('events/', views.events, name='events'),
@@ -17,4 +19,5 @@ urlpatterns = [
     path('favicon.ico', views.favicon),
     # HTML sitemap for human visitors
     path('sitemap/', views.sitemap_table, name='sitemap_table'),
+    path('search/', views.search, name='search'),
 ]
\ No newline at end of file
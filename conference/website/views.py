@@ -5,7 +5,6 @@ from pathlib import Path
 import os
 from django.http import FileResponse, Http404
 from django.conf import settings
-import re
 from django.core.paginator import Paginator
 from .models import (
     HeroSection, CarouselItem, NewsTickerItem, QuickAccessCard, StatisticCounter,
@@ -15,6 +14,16 @@ from .models import (
 )
 from .models import ResearchInterestArea, Speciality
 from .forms import MembershipForm
+from .about import ABOUT_PAGE_TAGS, get_about_page
+from .caching import cache_site_page, conditional_site_page
+from .knowledge_center import RESOURCE_TAGS, get_resource_page
+from .member_search import search_members
+from .search import search_site
+from .sitemaps import get_sitemap_rows
+from .webinars import get_webinar_detail, get_webinar_pages
+from registration.event_catalog import get_event_catalog
+from registration.profile import get_user_profile
+from registration.video_utils import parse_youtube_id
 
 
 def favicon(request):
@@ -28,26 +37,12 @@ def favicon(request):
 
 def extract_youtube_id(url):
     """Extract YouTube video ID from various URL formats."""
-    if not url:
-        return None
-    
-    # Handle youtu.be format
-    match = re.search(r'youtu\.be/([^?&]+)', url)
-    if match:
-        return match.group(1)
-    
-    # Handle youtube.com format
-    match = re.search(r'youtube\.com/watch\?v=([^&]+)', url)
-    if match:
-        return match.group(1)
-    
-    # Handle youtube.com/embed format
-    match = re.search(r'youtube\.com/embed/([^?&]+)', url)
-    if match:
-        return match.group(1)
-    
-    return None
+    return parse_youtube_id(url) or None
 
+
+@conditional_site_page
+@cache_site_page('website.CarouselItem', 'website.NewsTickerItem', 'website.QuickAccessCard', 'website.StatisticCounter',
+                 'website.MemberSpotlight', 'website.ResearchHighlight', 'registration.Event')
 def homepage(request):
     hero = HeroSection.objects.filter(page='homepage').first()
     carousel_items = CarouselItem.objects.filter(hero_section=hero) if hero else []
@@ -57,18 +52,8 @@ def homepage(request):
     member_spotlights = MemberSpotlight.objects.filter(is_featured=True).order_by('order')
     # Only show highlights flagged for homepage (highlight=True)
     research_highlights = ResearchHighlight.objects.filter(highlight=True).order_by('order')
-    # Prefer registration app's Event model for upcoming events display on homepage
-    try:
-        from registration.models import Event as RegEvent
-    except Exception:
-        RegEvent = Event  # fallback to local Event model
-
-    # Query only upcoming events from the registration app and order by start_date
-    try:
-        events = RegEvent.objects.filter(event_status='upcoming').order_by('start_date')
-    except Exception:
-        # Fallback to the existing local events list if RegEvent doesn't support these fields
-        events = Event.objects.all().order_by('order', 'date')
+    # Upcoming events of the registration app, soonest first
+    events = get_event_catalog()['upcoming_events']
     # Use the latest CallToAction entry for homepage (most recent).
     # We keep the model's order field available but prefer the latest DB entry
     # so content managers can update the hero CTA by creating a new entry.
@@ -90,124 +75,90 @@ def homepage(request):
     return render(request, 'pages/homepage.html', context)
 
 
+@conditional_site_page
+@cache_site_page(*ABOUT_PAGE_TAGS)
 def about(request):
-    hero = HeroSection.objects.filter(page='about').first()
-    stats_counters = StatisticCounter.objects.filter(page='about').order_by('order')
-    board_members = BoardMember.objects.all().order_by('order')
-    committees = Committee.objects.all().order_by('order')
-    partnerships = Partnership.objects.all().order_by('order')
-    awards = Award.objects.all().order_by('order', '-year')
-    call_to_action = CallToAction.objects.filter(page='about').first()
-    navigation_links = NavigationLink.objects.filter(is_active=True).order_by('order')
-    
-    # Fetch timeline section with ordered items
-    timeline_section = TimelineSection.objects.order_by('order').first()
-    timeline_items = []
-    if timeline_section:
-        timeline_items = list(timeline_section.items.all())  # type: ignore
-    
-    # Fetch organizational values grouped by type
-    mission = OrganizationalValue.objects.filter(value_type='mission').first()
-    vision = OrganizationalValue.objects.filter(value_type='vision').first()
-    values = OrganizationalValue.objects.filter(value_type='value').order_by('order')
-
-    # Prepare values_items for the template. If there are multiple `value` rows,
-    # use each row's title as an item. If there is a single `value` row which
-    # contains a multi-line description (e.g. authors pasted a list into the
-    # description field), split it into list items for rendering.
-    import re
-    values_items = []
-    if values.count() > 1:
-        for v in values:
-            # prefer the title for short list items, fallback to description
-            text = v.title or (v.description or '').strip()
-            if text:
-                values_items.append(text)
-    elif values.count() == 1:
-        single = values.first()
-        desc = (single.description or '').strip()  # type: ignore
-        if desc:
-            # split on newlines first
-            parts = [p.strip() for p in re.split(r'[\r\n]+', desc) if p.strip()]
-            if len(parts) == 1:
-                # if still single, try splitting on common separators
-                parts = [p.strip() for p in re.split(r'[;\u2022,]+', desc) if p.strip()]
-            values_items = parts
-        else:
-            # no description, use the title as a single item
-            if single.title:  # type: ignore
-                values_items = [single.title]  # type: ignore
-    
-    # Determine a header title and icon for the Values card.
-    # Prefer an explicit "Values" meta row when present (title like 'Values' or 'Our Values').
-    values_header_title = 'Values'
-    values_header_icon_url = None
-    if values.exists():
-        # try to find a meta/header row
-        header = values.filter(title__iregex=r'^(values|our values?)$').first()
-        if header:
-            values_header_title = header.title  # type: ignore
-            if header.icon_svg:  # type: ignore
-                values_header_icon_url = header.icon_svg.url  # type: ignore
-        else:
-            # no explicit header row: if there's a single row, use its title/icon as header
-            if values.count() == 1:
-                single = values.first()
-                values_header_title = single.title or values_header_title  # type: ignore
-                if single.icon_svg:  # type: ignore
-                    values_header_icon_url = single.icon_svg.url  # type: ignore
-            else:
-                # multiple rows and no header candidate: leave generic title and no icon
-                values_header_title = 'Values'
-
-    context = {
-        'hero': hero,
-        'stats_counters': stats_counters,
-        'board_members': board_members,
-        'committees': committees,
-        'partnerships': partnerships,
-        'awards': awards,
-        'call_to_action': call_to_action,
-        'navigation_links': navigation_links,
-        'mission': mission,
-        'vision': vision,
-        'values': values,
-        'values_items': values_items,
-        'values_header_title': values_header_title,
-        'values_header_icon_url': values_header_icon_url,
-        'timeline_section': timeline_section,
-        'timeline_items': timeline_items,
-    }
+    # Compiled once per change of the models it shows, see website/about.py
+    context = get_about_page()
     return render(request, 'pages/about_site.html', context)
 
 
+@conditional_site_page
+@cache_site_page(*RESOURCE_TAGS)
 def knowledge_center(request):
     hero = HeroSection.objects.filter(page='knowledge_center').first()
-    resource_categories = ResourceCategory.objects.all().order_by('order')
     # Featured Resources section: only featured items
     featured_resources = ResourceItem.objects.filter(is_featured=True).order_by('order')
-    # Clinical Guidelines section: all items (regardless of is_featured)
-    all_resources = ResourceItem.objects.all().order_by('order')
-    webinars = Webinar.objects.all().order_by('order')
     call_to_action = CallToAction.objects.filter(page='knowledge_center').first()
     navigation_links = NavigationLink.objects.filter(is_active=True).order_by('order')
 
     context = {
         'hero': hero,
-        'resource_categories': resource_categories,
         'featured_resources': featured_resources,
-        'all_resources': all_resources,
-        'webinars': webinars,
         'call_to_action': call_to_action,
         'navigation_links': navigation_links,
+        # Clinical Guidelines section: one filtered page of the library
+        **get_resource_page(request.GET),
     }
     return render(request, 'pages/knowledge_center.html', context)
 
 
+def knowledge_center_resources(request):
+    """HTMX endpoint returning the filtered resource library."""
+    return render(request, 'partials/resource_library.html', get_resource_page(request.GET))
+
+
+MEMBER_PAGE_SIZE = 9
+
+MEMBER_SORTS = {
+    'order': ('order', 'id'),
+    'name': ('user_profile__name', 'id'),
+    'recent': ('-created_at', '-id'),
+}
+
+
+def _member_directory_page(request):
+    """Filter approved members by the query string and return one page of them.
+
+    Supported parameters: ``q`` (full-text over name, institution, position,
+    specialties and research areas), ``specialty`` and
+    ``research_area`` (ids), ``sort`` (a MEMBER_SORTS key) and ``page``.
+    """
+    members = Member.objects.filter(approval_status='approved')
+
+    query = request.GET.get('q', '').strip()
+    if query:
+        members = search_members(members, query)
+    specialty = request.GET.get('specialty', '')
+    if specialty.isdigit():
+        members = members.filter(specialties__id=specialty)
+    research_area = request.GET.get('research_area', '')
+    if research_area.isdigit():
+        members = members.filter(research_interest_areas__id=research_area)
+
+    sort = request.GET.get('sort', 'order')
+    ordering = MEMBER_SORTS.get(sort, MEMBER_SORTS['order'])
+    if query and sort not in ('name', 'recent'):
+        # Best matches first, then the usual directory order
+        ordering = ('-search_rank', *ordering)
+    members = members.order_by(*ordering)
+    members = members.select_related('user_profile').prefetch_related('specialties', 'research_interest_areas')
+
+    page = Paginator(members, MEMBER_PAGE_SIZE).get_page(request.GET.get('page'))
+    return {
+        'members': page.object_list,
+        'page_obj': page,
+        'query': query,
+        'selected_specialty': specialty,
+        'selected_research_area': research_area,
+        'sort': sort,
+    }
+
+
+@conditional_site_page
+@cache_site_page('website.Member', 'website.Speciality', 'website.ResearchInterestArea', 'registration.UserProfile')
 def member_directory(request):
     hero = HeroSection.objects.filter(page='member_directory').first()
-    # Only show members with 'approved' status in the directory
-    members = Member.objects.filter(approval_status='approved').order_by('order')
     # Fetch specialties and research interest areas for the advanced filter dropdowns
     specialities = Speciality.objects.all().order_by('name')
     research_areas = ResearchInterestArea.objects.all().order_by('name')
@@ -216,39 +167,32 @@ def member_directory(request):
 
     context = {
         'hero': hero,
-        'members': members,
         'specialities': specialities,
         'research_areas': research_areas,
         'call_to_action': call_to_action,
         'navigation_links': navigation_links,
+        **_member_directory_page(request),
     }
     return render(request, 'pages/member_directory.html', context)
 
 
+def member_directory_results(request):
+    """HTMX endpoint returning the filtered results, or only the cards of a later page."""
+    context = _member_directory_page(request)
+    if context['page_obj'].number > 1:
+        return render(request, 'partials/member_cards.html', context)
+    return render(request, 'partials/member_results.html', context)
+
+
+@conditional_site_page
+@cache_site_page('website.NewsTickerItem', 'registration.Event')
 def events(request):
     # Render the legacy registration index at /events/
-    # Use the registration app's Event model (has fields like start_date, end_date, event_status)
-    try:
-        from registration.models import Event as RegEvent, UserProfile as RegUserProfile
-    except Exception:
-        RegEvent = Event  # fallback to local Event model
-        RegUserProfile = None
-
-    user_profile = None
-    if request.user.is_authenticated and RegUserProfile:
-        try:
-            user_profile = RegUserProfile.objects.get(user=request.user)
-        except RegUserProfile.DoesNotExist:  # type: ignore[name-defined]
-            user_profile = None
+    user_profile = get_user_profile(request)
 
     hero = HeroSection.objects.filter(page='events').first()
     news_tickers = NewsTickerItem.objects.filter(is_active=True).order_by('order')
 
-    # Mirror registration.index view behavior: group events by status
-    active_events = RegEvent.objects.filter(event_status='active').order_by('-start_date')
-    upcoming_events = RegEvent.objects.filter(event_status='upcoming').order_by('start_date')
-    closed_events = RegEvent.objects.filter(event_status='closed').order_by('-end_date')
-
     call_to_action = CallToAction.objects.filter(page='events').first()
     navigation_links = NavigationLink.objects.filter(is_active=True).order_by('order')
 
@@ -256,9 +200,8 @@ def events(request):
         'user_profile': user_profile,
         'hero': hero,
         'news_tickers': news_tickers,
-        'active_events': active_events,
-        'upcoming_events': upcoming_events,
-        'closed_events': closed_events,
+        # Mirror registration.index view behavior: events grouped by status
+        **get_event_catalog(),
         'call_to_action': call_to_action,
         'navigation_links': navigation_links,
     }
@@ -266,6 +209,8 @@ def events(request):
     return render(request, 'index.html', context)
 
 
+@conditional_site_page
+@cache_site_page('website.StatisticCounter', 'website.ResearchHighlight', 'website.AnnualReport')
 def research_and_publications(request):
     hero = HeroSection.objects.filter(page='research_and_publications').first()
     stats_counters = StatisticCounter.objects.filter(page='research_and_publications').order_by('order')
@@ -288,60 +233,33 @@ def research_and_publications(request):
     }
     return render(request, 'pages/research_and_publications.html', context)
 
+@conditional_site_page
+@cache_site_page('website.Webinar')
 def webinars(request):
     hero = HeroSection.objects.filter(page='webinars').first()
-    resource_categories = ResourceCategory.objects.all().order_by('order')
-    resources = ResourceItem.objects.all().order_by('order')
-    
-    # Pagination settings: 6 items per page for each section
-    items_per_page = 6
-    
-    # Get webinars and paginate
-    webinars_all = Webinar.objects.filter(type='webinar').order_by('order')
-    webinars_paginator = Paginator(webinars_all, items_per_page)
-    webinars_page = request.GET.get('webinars_page', 1)
-    try:
-        webinars = webinars_paginator.page(webinars_page)
-    except:
-        webinars = webinars_paginator.page(1)
-    
-    # Get preceptorship webinars and paginate
-    preceptorship_all = Webinar.objects.filter(type='perceptorship').order_by('order')
-    preceptorship_paginator = Paginator(preceptorship_all, items_per_page)
-    preceptorship_page = request.GET.get('preceptorship_page', 1)
-    try:
-        preceptorship_webinars = preceptorship_paginator.page(preceptorship_page)
-    except:
-        preceptorship_webinars = preceptorship_paginator.page(1)
-    
-    # Get GCI webinars and paginate
-    gci_all = Webinar.objects.filter(type='gci').order_by('order')
-    gci_paginator = Paginator(gci_all, items_per_page)
-    gci_page = request.GET.get('gci_page', 1)
-    try:
-        gci_webinars = gci_paginator.page(gci_page)
-    except:
-        gci_webinars = gci_paginator.page(1)
-    
+    # One query for the visible page of every section, totals from the cache
+    pages = get_webinar_pages(request.GET)
     call_to_action = CallToAction.objects.filter(page='webinars').first()
     navigation_links = NavigationLink.objects.filter(is_active=True).order_by('order')
 
     context = {
         'hero': hero,
-        'resource_categories': resource_categories,
-        'resources': resources,
-        'webinars': webinars,
-        'preceptorship_webinars': preceptorship_webinars,
-        'gci_webinars': gci_webinars,
+        'webinars': pages['webinar'],
+        'preceptorship_webinars': pages['perceptorship'],
+        'gci_webinars': pages['gci'],
         'call_to_action': call_to_action,
         'navigation_links': navigation_links,
     }
     return render(request, 'pages/webinars.html', context)
 
 
+@conditional_site_page
+@cache_site_page('website.Webinar', 'website.Panelist')
 def webinar_detail(request, pk):
     """Display full webinar details including video and panelists."""
-    webinar = Webinar.objects.get(pk=pk)
+    webinar = get_webinar_detail(pk)
+    if webinar is None:
+        raise Http404("Webinar not found")
     navigation_links = NavigationLink.objects.filter(is_active=True).order_by('order')
     
     context = {
@@ -351,110 +269,33 @@ def webinar_detail(request, pk):
     return render(request, 'pages/webinar_detail.html', context)
 
 
+@conditional_site_page
+@cache_site_page('website.Webinar', 'registration.Event', 'registration.AbstractSubmission')
 def sitemap_table(request):
     """Render a human-friendly, tabular sitemap page.
 
-    Collects entries from the existing sitemap classes in
-    `registration.sitemaps` and builds a list of rows with the
-    following columns: URL, Title, Last modified, Changefreq, Priority.
+    The rows (URL, Title, Last modified, Changefreq, Priority) come from
+    the sitemap classes in `registration.sitemaps`, cached by
+    `website.sitemaps` until one of the listed models changes.
     """
-    from registration.sitemaps import (
-        EventSitemap,
-        StaticViewSitemap,
-        PublicationSitemap,
-        WebsiteStaticSitemap,
-        WebinarSitemap,
-    )
-
-    sitemap_instances = [
-        WebsiteStaticSitemap(),
-        EventSitemap(),
-        WebinarSitemap(),
-        PublicationSitemap(),
-        StaticViewSitemap(),
-    ]
-
-    rows = []
-
-    # Friendly titles for well-known static names
-    static_title_map = {
-        'website:homepage': 'Home',
-        'website:about': 'About',
-        'website:member_directory': 'Members',
-        'website:research_and_publications': 'Research & Publications',
-        'website:knowledge_center': 'Resources',
-        'website:events': 'Events',
-        'website:webinars': 'Webinars',
-    }
-
-    for sm in sitemap_instances:
-        changefreq = getattr(sm, 'changefreq', '')
-        priority = getattr(sm, 'priority', '')
-        try:
-            items = list(sm.items())
-        except Exception:
-            items = []
-
-        for item in items:
-            # location may raise, guard it
-            try:
-                loc = sm.location(item)
-            except Exception:
-                # fallback: try str()
-                try:
-                    loc = str(item)
-                except Exception:
-                    loc = ''
-
-            # lastmod if provided
-            lastmod = None
-            if hasattr(sm, 'lastmod'):
-                try:
-                    lastmod = sm.lastmod(item)
-                except Exception:
-                    lastmod = None
-
-            # Determine a human-friendly title
-            title = None
-            # If the sitemap item is a named URL (string)
-            if isinstance(item, str):
-                title = static_title_map.get(item, item.replace('website:', '').replace('_', ' ').title())
-            # If tuple used by StaticViewSitemap (('about', event_id))
-            elif isinstance(item, (list, tuple)):
-                try:
-                    url_name = item[0]
-                    arg = item[1] if len(item) > 1 else ''
-                    title = f"{url_name.replace('_', ' ').title()} (Event {arg})"
-                except Exception:
-                    title = str(item)
-            else:
-                # Model instances: try common fields
-                title = getattr(item, 'title', None) or getattr(item, 'name', None) or getattr(item, 'get_short_name', None)
-                if callable(title):
-                    try:
-                        title = title()
-                    except Exception:
-                        title = None
-                if not title:
-                    try:
-                        title = str(item)
-                    except Exception:
-                        title = ''
-
-            rows.append({
-                'loc': loc,
-                'title': title,
-                'lastmod': lastmod,
-                'changefreq': changefreq,
-                'priority': priority,
-            })
-
     context = {
-        'rows': rows,
+        'rows': get_sitemap_rows(),
     }
     return render(request, 'pages/sitemap_table.html', context)
 
 
+def search(request):
+    """Search events, publications, webinars, resources, research and members.
+
+    Results come from the site-wide index in `website.search`, ranked by
+    relevance and optionally narrowed to one ``kind``.
+    """
+    context = search_site(
+        request.GET.get('q', '').strip(), request.GET.get('kind', ''), request.GET.get('page')
+    )
+    return render(request, 'pages/search.html', context)
+
+
 def membership_form(request):
     """View for membership form submission and creation.
     
@@ -465,7 +306,6 @@ def membership_form(request):
     """
     from django.shortcuts import redirect
     from django.urls import reverse
-    from registration.models import UserProfile
     
     # Check if user is logged in
     if not request.user.is_authenticated:
@@ -473,9 +313,8 @@ def membership_form(request):
         return redirect(f'{reverse("login")}?next={reverse("website:membership_form")}')
     
     # Check if user has a UserProfile
-    try:
-        user_profile = UserProfile.objects.get(user=request.user)
-    except UserProfile.DoesNotExist:
+    user_profile = get_user_profile(request)
+    if user_profile is None:
         # Redirect to create_profile with next parameter pointing back to membership form
         return redirect(f'{reverse("create_profile")}?next={reverse("website:membership_form")}')
     
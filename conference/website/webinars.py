@@ -0,0 +1,108 @@
+"""Cached webinar listing and detail data.
+
+The webinars page shows one paginated section per webinar type. The
+visible page of every section is read with a single query, numbering the
+rows within each type, and the section totals come from per-type counts
+cached under the Webinar tag version. Detail pages keep each webinar with
+its panels prefetched, cached under the Webinar and Panelist tag versions.
+"""
+
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.db.models import Case, Count, F, Value, When, Window
+from django.db.models.functions import RowNumber
+
+from .caching import get_tag_versions
+from .models import Webinar
+
+# Listing sections, in page order: (webinar type, query parameter of its page)
+WEBINAR_SECTIONS = (
+    ('webinar', 'webinars_page'),
+    ('perceptorship', 'preceptorship_page'),
+    ('gci', 'gci_page'),
+)
+
+WEBINAR_PAGE_SIZE = 6
+
+# Keyed by tag versions, so the timeout only bounds memory use
+WEBINAR_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Stored in the cache for missing webinars, to tell them from a miss
+_NO_WEBINAR = 'none'
+
+
+def _versions_digest(*tags):
+    versions = '-'.join(str(version) for version in get_tag_versions(tags))
+    return hashlib.md5(versions.encode()).hexdigest()
+
+
+class CountedPaginator(Paginator):
+    """Paginator over a total known in advance, so it never runs a COUNT."""
+
+    def __init__(self, count, per_page):
+        super().__init__((), per_page)
+        self.count = count
+
+
+def get_webinar_counts():
+    """Return the cached number of webinars of each type."""
+    key = f'webinar_counts_{_versions_digest("website.Webinar")}'
+    counts = cache.get(key)
+    if counts is None:
+        counts = dict(Webinar.objects.order_by().values_list('type').annotate(total=Count('id')))
+        cache.set(key, counts, WEBINAR_CACHE_TIMEOUT)
+    return counts
+
+
+def get_webinar_pages(params):
+    """Return a Page per section type for the page numbers in ``params``.
+
+    Out of range or invalid page numbers fall back to the first page.
+    """
+    counts = get_webinar_counts()
+    paginators = {}
+    numbers = {}
+    for webinar_type, param in WEBINAR_SECTIONS:
+        paginator = CountedPaginator(counts.get(webinar_type, 0), WEBINAR_PAGE_SIZE)
+        try:
+            numbers[webinar_type] = paginator.validate_number(params.get(param, 1))
+        except InvalidPage:
+            numbers[webinar_type] = 1
+        paginators[webinar_type] = paginator
+
+    # One query for every visible section: number the rows within each type
+    # and keep those that fall on the requested page of their type
+    offset = Case(
+        *(When(type=webinar_type, then=Value((number - 1) * WEBINAR_PAGE_SIZE)) for webinar_type, number in numbers.items()),
+        default=Value(0),
+    )
+    rows = {webinar_type: [] for webinar_type in numbers}
+    webinars = Webinar.objects.filter(type__in=numbers).annotate(
+        row_number=Window(RowNumber(), partition_by=F('type'), order_by=(F('order').asc(), F('id').asc())),
+        row_offset=offset,
+    ).filter(
+        row_number__gt=F('row_offset'), row_number__lte=F('row_offset') + WEBINAR_PAGE_SIZE
+    ).order_by('type', 'row_number')
+    for webinar in webinars:
+        rows[webinar.type].append(webinar)
+
+    return {
+        webinar_type: Page(rows[webinar_type], numbers[webinar_type], paginators[webinar_type])
+        for webinar_type in numbers
+    }
+
+
+def get_webinar_detail(pk):
+    """Return the cached webinar with its panels prefetched, or None."""
+    key = f'webinar_detail_{pk}_{_versions_digest("website.Webinar", "website.Panelist")}'
+    webinar = cache.get(key)
+    if webinar is None:
+        webinar = Webinar.objects.prefetch_related(
+            'international_panel', 'national_panel', 'moderators'
+        ).filter(pk=pk).first()
+        cache.set(key, webinar if webinar is not None else _NO_WEBINAR, WEBINAR_CACHE_TIMEOUT)
+    elif webinar == _NO_WEBINAR:
+        webinar = None
+    return webinar